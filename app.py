@@ -1,7 +1,9 @@
 import streamlit as st
 import validators
 from seo_analyzer import SEOAnalyzer
-from preview_generators import PreviewGenerator
+from result_cache import ResultCache
+from preview_generators import PreviewGenerator, build_previews
+from batch_runner import BatchRun, parse_url_list
 import time
 
 # Page configuration
@@ -299,60 +301,47 @@ st.markdown("""
 # Initialize analyzers
 @st.cache_resource
 def get_analyzers():
-    return SEOAnalyzer(), PreviewGenerator()
+    return SEOAnalyzer(cache=ResultCache()), PreviewGenerator()
 
 seo_analyzer, preview_generator = get_analyzers()
 
-# Main title
-st.title("🔍 SEO Meta Tag Analyzer")
+# Validation and preview HTML depend only on the analyzed page, so they are
+# memoized across reruns (and sessions) instead of rebuilt on every click
+CACHE_TTL = 600
 
-# URL input section
-st.header("Website Analysis")
-url_input = st.text_input(
-    "Enter website URL to analyze:",
-    placeholder="example.com",
-    help="Enter any website URL (protocol will be added automatically)"
-)
+# Upper bound on URLs per multi-URL run, to keep one user from hogging a shared deployment
+MAX_BATCH_URLS = 500
 
-analyze_button = st.button("Analyze Website", type="primary")
 
-if analyze_button and url_input:
-    # Auto-add protocol if missing
-    if not url_input.startswith(('http://', 'https://')):
-        url_input = 'https://' + url_input
-    
-    # Validate URL
-    if not validators.url(url_input):
-        st.error("❌ Please enter a valid URL (e.g., example.com or https://example.com)")
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def get_validation(final_url, meta_tags):
+    return seo_analyzer.validate_seo(meta_tags)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def get_preview_html(final_url, meta_tags):
+    return build_previews(meta_tags, final_url)
+
+
+def score_style(score):
+    """
+    Return (color, label, emoji) for a category score
+    """
+    if score >= 80:
+        return "#28a745", "Excellent", "✅"
+    elif score >= 60:
+        return "#ffc107", "Good", "⚠️"
     else:
-        # Show loading spinner
-        with st.spinner("Fetching and analyzing website..."):
-            try:
-                # Analyze the website
-                analysis_result = seo_analyzer.analyze_website(url_input)
-                
-                if analysis_result["success"]:
-                    st.success(f"✅ Successfully analyzed: {analysis_result['final_url']}")
-                    
-                    # Store results in session state
-                    st.session_state.analysis_result = analysis_result
-                    st.session_state.analyzed_url = url_input
-                    
-                else:
-                    st.error(f"❌ Error analyzing website: {analysis_result['error']}")
-                    
-            except Exception as e:
-                st.error(f"❌ Unexpected error: {str(e)}")
+        return "#dc3545", "Needs Work", "❌"
 
-# Display results if available
-if hasattr(st.session_state, 'analysis_result') and st.session_state.analysis_result["success"]:
-    result = st.session_state.analysis_result
-    meta_tags = result["meta_tags"]
-    
+
+def render_google_section(result, previews):
     # Google Search Preview
     st.header("🔍 Google Search Preview")
-    preview_generator.render_google_preview(meta_tags, result["final_url"])
-    
+    preview_generator.render_google_preview(result["meta_tags"], result["final_url"], html=previews["google"])
+
+
+def render_health_check(validation_results):
     # SEO Health Check - More beginner friendly
     st.header("🏥 SEO Health Check")
     st.markdown("""
@@ -361,8 +350,6 @@ if hasattr(st.session_state, 'analysis_result') and st.session_state.analysis_re
     </p>
     """, unsafe_allow_html=True)
     
-    validation_results = seo_analyzer.validate_seo(meta_tags)
-    
     # Overall Score with better explanation
     score = validation_results["score"]
     if score >= 80:
@@ -395,6 +382,12 @@ if hasattr(st.session_state, 'analysis_result') and st.session_state.analysis_re
     </div>
     """, unsafe_allow_html=True)
     
+    render_category_scores(validation_results["category_scores"])
+    render_action_plan(validation_results)
+    render_issues_and_recommendations(validation_results)
+
+
+def render_category_scores(category_scores):
     # Category Scores with beginner-friendly descriptions
     st.subheader("🎯 What We Checked")
     st.markdown("""
@@ -403,8 +396,6 @@ if hasattr(st.session_state, 'analysis_result') and st.session_state.analysis_re
     </p>
     """, unsafe_allow_html=True)
     
-    category_scores = validation_results["category_scores"]
-    
     # Create 2x2 grid for category scores
     col1, col2 = st.columns(2)
     col3, col4 = st.columns(2)
@@ -422,22 +413,9 @@ if hasattr(st.session_state, 'analysis_result') and st.session_state.analysis_re
         "How well your content is organized"
     ]
     
-    for i, (col, category_key, icon, friendly_name, friendly_desc) in enumerate(zip(columns, categories, icons, friendly_names, friendly_descriptions)):
-        category = category_scores[category_key]
-        cat_score = category["score"]
-        
-        if cat_score >= 80:
-            cat_color = "#28a745"
-            cat_status = "Excellent"
-            status_emoji = "✅"
-        elif cat_score >= 60:
-            cat_color = "#ffc107"  
-            cat_status = "Good"
-            status_emoji = "⚠️"
-        else:
-            cat_color = "#dc3545"
-            cat_status = "Needs Work"
-            status_emoji = "❌"
+    for col, category_key, icon, friendly_name, friendly_desc in zip(columns, categories, icons, friendly_names, friendly_descriptions):
+        cat_score = category_scores[category_key]["score"]
+        cat_color, cat_status, status_emoji = score_style(cat_score)
         
         with col:
             st.markdown(f"""
@@ -460,10 +438,15 @@ if hasattr(st.session_state, 'analysis_result') and st.session_state.analysis_re
                 <div style="font-size: 0.85rem; color: {cat_color}; font-weight: 600;">{status_emoji} {cat_status}</div>
             </div>
             """, unsafe_allow_html=True)
-    
+
+
+def render_action_plan(validation_results):
     # Quick Action Summary - More user-friendly
     st.subheader("📋 What Should You Do Next?")
     
+    score = validation_results["score"]
+    category_scores = validation_results["category_scores"]
+    
     # Count issues by severity
     total_issues = len(validation_results["issues"])
     total_recommendations = len(validation_results["recommendations"])
@@ -514,7 +497,6 @@ if hasattr(st.session_state, 'analysis_result') and st.session_state.analysis_re
     
     with col2:
         color = "#dc3545" if total_issues > 3 else "#ffc107" if total_issues > 0 else "#28a745"
-        issue_text = "No Issues" if total_issues == 0 else f"{total_issues} Issue{'s' if total_issues != 1 else ''}"
         st.markdown(f"""
         <div class="summary-card" style="border-left: 4px solid {color};">
             <div style="font-size: 1.8rem; font-weight: bold; color: {color};">{total_issues}</div>
@@ -541,7 +523,9 @@ if hasattr(st.session_state, 'analysis_result') and st.session_state.analysis_re
             <div style="font-size: 0.85rem; color: #666;">Average</div>
         </div>
         """, unsafe_allow_html=True)
-    
+
+
+def render_issues_and_recommendations(validation_results):
     # Issues section - More beginner friendly
     if validation_results["issues"]:
         st.subheader("🚨 Things to Fix First")
@@ -591,6 +575,10 @@ if hasattr(st.session_state, 'analysis_result') and st.session_state.analysis_re
                 </div>
             </div>
             """, unsafe_allow_html=True)
+
+
+def render_social_previews(result, previews):
+    meta_tags = result["meta_tags"]
     
     # Social Media Previews with explanation
     st.header("📱 How Your Page Looks When Shared")
@@ -606,14 +594,16 @@ if hasattr(st.session_state, 'analysis_result') and st.session_state.analysis_re
     tab1, tab2, tab3 = st.tabs(["📘 Facebook", "🐦 Twitter", "💼 LinkedIn"])
     
     with tab1:
-        preview_generator.render_facebook_preview(meta_tags, result["final_url"])
+        preview_generator.render_facebook_preview(meta_tags, result["final_url"], html=previews["facebook"])
     
     with tab2:
-        preview_generator.render_twitter_preview(meta_tags, result["final_url"])
+        preview_generator.render_twitter_preview(meta_tags, result["final_url"], html=previews["twitter"])
     
     with tab3:
-        preview_generator.render_linkedin_preview(meta_tags, result["final_url"])
-    
+        preview_generator.render_linkedin_preview(meta_tags, result["final_url"], html=previews["linkedin"])
+
+
+def render_meta_tag_details(meta_tags):
     # Detailed Meta Tags Analysis
     st.header("🏷️ Detailed Meta Tags")
     
@@ -683,6 +673,193 @@ if hasattr(st.session_state, 'analysis_result') and st.session_state.analysis_re
             for tag, value in technical_tags.items():
                 st.write(f"**{tag}:** {value}")
 
+
+def display_results(result):
+    """
+    Render every results section for one successful analysis
+
+    Tabs and expanders switch in the browser without a rerun, so these
+    sections need no fragments; reruns from the inputs above reuse the
+    memoized validation and preview HTML.
+    """
+    meta_tags = result["meta_tags"]
+    validation_results = get_validation(result["final_url"], meta_tags)
+    previews = get_preview_html(result["final_url"], meta_tags)
+    
+    render_google_section(result, previews)
+    render_health_check(validation_results)
+    render_social_previews(result, previews)
+    render_meta_tag_details(meta_tags)
+
+
+def render_single_url_input():
+    url_input = st.text_input(
+        "Enter website URL to analyze:",
+        placeholder="example.com",
+        help="Enter any website URL (protocol will be added automatically)"
+    )
+
+    analyze_button = st.button("Analyze Website", type="primary")
+
+    if analyze_button and url_input:
+        # Auto-add protocol if missing
+        if not url_input.startswith(('http://', 'https://')):
+            url_input = 'https://' + url_input
+    
+        # Validate URL
+        if not validators.url(url_input):
+            st.error("❌ Please enter a valid URL (e.g., example.com or https://example.com)")
+        else:
+            # Show loading spinner
+            with st.spinner("Fetching and analyzing website..."):
+                try:
+                    # Analyze the website
+                    analysis_result = seo_analyzer.analyze_website(url_input)
+                
+                    if analysis_result["success"]:
+                        st.success(f"✅ Successfully analyzed: {analysis_result['final_url']}")
+                    
+                        # Store results in session state
+                        st.session_state.analysis_result = analysis_result
+                        st.session_state.analyzed_url = url_input
+                    
+                    else:
+                        st.error(f"❌ Error analyzing website: {analysis_result['error']}")
+                    
+                except Exception as e:
+                    st.error(f"❌ Unexpected error: {str(e)}")
+
+
+def render_batch_input():
+    urls_text = st.text_area(
+        "Paste URLs to analyze, one per line:",
+        placeholder="example.com\nexample.com/about",
+        height=150
+    )
+    uploaded_file = st.file_uploader("...or upload a .txt or .csv file of URLs", type=["txt", "csv"])
+    
+    batch_run = st.session_state.get("batch_run")
+    running = batch_run is not None and not batch_run.done
+    
+    if st.button("Analyze All", type="primary", disabled=running):
+        text = urls_text or ""
+        if uploaded_file is not None:
+            text += "\n" + uploaded_file.getvalue().decode("utf-8", errors="replace")
+        urls = parse_url_list(text)
+        
+        if not urls:
+            st.error("❌ No valid URLs found. Enter one URL per line (e.g., example.com)")
+        else:
+            if len(urls) > MAX_BATCH_URLS:
+                st.warning(f"⚠️ Only the first {MAX_BATCH_URLS} of {len(urls)} URLs will be analyzed")
+                urls = urls[:MAX_BATCH_URLS]
+            # Analyzed on a background thread; the progress fragment polls it
+            st.session_state.batch_run = BatchRun(seo_analyzer, urls).start()
+            st.session_state.selected_batch_url = None
+    
+    batch_run = st.session_state.get("batch_run")
+    if batch_run is not None:
+        if batch_run.done:
+            render_batch_results(batch_run)
+        else:
+            render_batch_progress()
+
+
+@st.fragment(run_every=1)
+def render_batch_progress():
+    """
+    Redraw progress and the results so far every second while a batch is running
+    """
+    batch_run = st.session_state.batch_run
+    if batch_run.done:
+        # Switch to the static results view
+        st.rerun(scope="app")
+    
+    completed, total = batch_run.progress()
+    st.progress(completed / total if total else 1.0, text=f"Analyzing... {completed}/{total} URLs done")
+    if st.button("Cancel", key="cancel_batch"):
+        batch_run.cancel()
+        st.info("Cancelling - waiting for requests already in flight...")
+    render_batch_table(batch_run)
+
+
+@st.fragment
+def render_batch_results(batch_run):
+    completed, total = batch_run.progress()
+    status = "Cancelled" if batch_run.cancelled else "Finished"
+    st.progress(completed / total if total else 1.0, text=f"{status}: {completed}/{total} URLs analyzed")
+    if batch_run.error:
+        st.error(f"❌ Batch stopped early: {batch_run.error}")
+    render_batch_table(batch_run)
+    render_batch_timings(batch_run)
+
+
+def render_batch_timings(batch_run):
+    summary, bottleneck = batch_run.timing_summary()
+    if bottleneck is None:
+        return
+    
+    with st.expander(f"⏱️ Stage timings (most time spent in: {bottleneck})"):
+        st.dataframe(
+            [
+                {
+                    "Stage": stage,
+                    "Mean (ms)": round(row["mean"] * 1000, 2),
+                    "p50 (ms)": round(row["p50"] * 1000, 2),
+                    "p90 (ms)": round(row["p90"] * 1000, 2),
+                    "p99 (ms)": round(row["p99"] * 1000, 2),
+                    "Share": f"{row['share']:.1%}",
+                    "Slowest for": row["slowest_for"],
+                }
+                for stage, row in summary.items()
+            ],
+            hide_index=True
+        )
+
+
+def render_batch_table(batch_run):
+    rows = batch_run.rows()
+    if not rows:
+        return
+    
+    st.caption("Click a row to see its full breakdown below")
+    event = st.dataframe(rows, on_select="rerun", selection_mode="single-row", hide_index=True, key="batch_table")
+    selected_rows = event.selection.rows
+    if not selected_rows:
+        return
+    
+    url, analysis_result, _ = batch_run.result(selected_rows[0])
+    if not analysis_result["success"]:
+        st.error(f"❌ Error analyzing {url}: {analysis_result['error']}")
+    elif st.session_state.get("selected_batch_url") != url:
+        # Show the existing single-page breakdown for the chosen row
+        st.session_state.analysis_result = analysis_result
+        st.session_state.analyzed_url = url
+        st.session_state.selected_batch_url = url
+        st.rerun(scope="app")
+
+
+# Main title
+st.title("🔍 SEO Meta Tag Analyzer")
+
+# URL input section
+st.header("Website Analysis")
+analysis_mode = st.radio(
+    "Analysis mode",
+    ["Single URL", "Multiple URLs"],
+    horizontal=True,
+    label_visibility="collapsed"
+)
+
+if analysis_mode == "Multiple URLs":
+    render_batch_input()
+else:
+    render_single_url_input()
+
+# Display results if available
+if hasattr(st.session_state, 'analysis_result') and st.session_state.analysis_result["success"]:
+    display_results(st.session_state.analysis_result)
+
 # Footer with attribution
 st.markdown("""
 ---
@@ -0,0 +1,133 @@
+import threading
+import time
+
+import validators
+
+from results import AnalysisResult
+from timings import TimingAggregate, slowest_stage
+
+
+def parse_url_list(text):
+    """
+    Pull URLs out of pasted text or an uploaded file, one per line (or the first column of a CSV)
+
+    Missing schemes default to https, invalid entries are dropped and
+    duplicates are removed while keeping the original order.
+    """
+    urls = []
+    seen = set()
+    for line in text.splitlines():
+        url = line.split(',', 1)[0].strip().strip('"')
+        if not url or url.startswith('#'):
+            continue
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+        if url in seen or not validators.url(url):
+            continue
+        seen.add(url)
+        urls.append(url)
+    return urls
+
+
+class BatchRun:
+    """
+    Analyze a list of URLs on a background thread, collecting results as they finish
+
+    The thread drives SEOAnalyzer.analyze_many; UI code polls progress() and
+    rows() from its own thread and may call cancel() at any time, which stops
+    new fetches and drops the ones still queued. Results are kept as compact
+    AnalysisResult objects carrying their validation, and every result's
+    stage timings are added to the timings aggregate.
+    """
+    def __init__(self, analyzer, urls, max_workers=8, per_host_limit=2):
+        self.analyzer = analyzer
+        self.urls = list(urls)
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.results = []
+        self.timings = TimingAggregate()
+        self.started_at = None
+        self.finished_at = None
+        self.error = None
+
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name='seo-batch-run', daemon=True)
+
+    def start(self):
+        self.started_at = time.monotonic()
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def done(self):
+        return self.finished_at is not None
+
+    def progress(self):
+        """
+        Return (completed, total)
+        """
+        with self._lock:
+            return len(self.results), len(self.urls)
+
+    def rows(self):
+        """
+        Return one summary dict per finished URL, in completion order
+        """
+        with self._lock:
+            results = list(self.results)
+        rows = []
+        for url, result in results:
+            validation = result.validation
+            timings = (result.extra or {}).get("timings")
+            rows.append({
+                "URL": url,
+                "Status": result.status_code,
+                "Score": validation.score if validation else None,
+                "Issues": len(validation.issues) if validation else None,
+                "Slowest stage": slowest_stage(timings) if timings else None,
+                "Error": result.error,
+            })
+        return rows
+
+    def timing_summary(self):
+        """
+        Return (per-stage summary, bottleneck stage) over the results so far
+        """
+        with self._lock:
+            return self.timings.summary(), self.timings.bottleneck()
+
+    def result(self, index):
+        """
+        Return (url, result dict, validation dict) for the index-th finished URL
+        """
+        with self._lock:
+            url, result = self.results[index]
+        validation = result.validation.to_dict() if result.validation else None
+        return url, result.to_dict(), validation
+
+    def _run(self):
+        pairs = self.analyzer.analyze_many(
+            self.urls, max_workers=self.max_workers, per_host_limit=self.per_host_limit
+        )
+        try:
+            for url, result in pairs:
+                validation = self.analyzer.validate_result(result)
+                with self._lock:
+                    self.results.append((url, AnalysisResult.from_dict(result, validation)))
+                    self.timings.add(result)
+                if self._cancel.is_set():
+                    break
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            # Closing the generator cancels whatever analyze_many still has queued
+            pairs.close()
+            self.finished_at = time.monotonic()
@@ -0,0 +1,173 @@
+from seo_rules import DEFAULT_RULE_SET
+
+
+def _import_numpy():
+    """
+    Import NumPy on demand so the rest of the analyzer works without it
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("Batch scoring requires numpy: pip install numpy") from e
+    return numpy
+
+
+class TagColumns:
+    """
+    Columnar table of extracted tags for many pages
+
+    lengths is a (rows, fields) integer array holding the length of each
+    field's value, 0 when the tag is absent or empty, so presence masks are
+    simply lengths > 0 and the h1_tags column is the H1 count. Rules that
+    look inside the text (contains_any) get one precomputed boolean column
+    each in matches, keyed by rule code.
+    """
+    def __init__(self, fields, lengths, matches):
+        self.fields = tuple(fields)
+        self.lengths = lengths
+        self.matches = matches
+        self._field_index = {field: index for index, field in enumerate(self.fields)}
+
+    def __len__(self):
+        return self.lengths.shape[0]
+
+    def length(self, field):
+        return self.lengths[:, self._field_index[field]]
+
+    def present(self, field):
+        return self.length(field) > 0
+
+
+class BatchScores:
+    """
+    Scores for every row of a TagColumns table
+
+    score and each array in category_scores hold one value per row; fired
+    is a (rows, rules) boolean matrix of which rules triggered. result(row)
+    expands a row back into the dict validate_seo returns.
+    """
+    def __init__(self, rule_set, score, category_scores, fired):
+        self.rule_set = rule_set
+        self.score = score
+        self.category_scores = category_scores
+        self.fired = fired
+
+    def __len__(self):
+        return self.score.shape[0]
+
+    def result(self, row):
+        fired = self.fired[row].nonzero()[0].tolist()
+        category_scores = [int(self.category_scores[key][row]) for key, _, _ in self.rule_set.categories]
+        return self.rule_set.assemble(int(self.score[row]), category_scores, fired)
+
+    def results(self):
+        for row in range(len(self)):
+            yield self.result(row)
+
+
+class BatchScorer:
+    """
+    Vectorized validate_seo for site-wide audits
+
+    Evaluates the same compiled rule table as SEOAnalyzer.validate_seo, but
+    over whole columns at once with NumPy: each rule becomes one boolean
+    mask and its deltas are added to the score arrays in a single pass.
+    Results match the scalar validate_seo exactly.
+    """
+    def __init__(self, rule_set=None):
+        self.rule_set = rule_set if rule_set is not None else DEFAULT_RULE_SET
+
+        fields = []
+        for rule in self.rule_set.rules:
+            for field in rule.get("fields") or [rule["field"]]:
+                if field not in fields:
+                    fields.append(field)
+        self.fields = tuple(fields)
+        self._match_rules = [rule for rule in self.rule_set.rules if rule["check"] == "contains_any"]
+
+    def columns(self, meta_tags_list):
+        """
+        Build a TagColumns table from a sequence of meta_tags dicts
+        """
+        np = _import_numpy()
+        rows = meta_tags_list if isinstance(meta_tags_list, (list, tuple)) else list(meta_tags_list)
+        fields = self.fields
+
+        lengths = np.fromiter(
+            (len(meta_tags.get(field) or ()) for meta_tags in rows for field in fields),
+            dtype=np.int32,
+            count=len(rows) * len(fields)
+        ).reshape(len(rows), len(fields))
+
+        matches = {}
+        for rule in self._match_rules:
+            field = rule["field"]
+            tokens = tuple(token.lower() for token in rule["value"])
+            matches[rule["code"]] = np.fromiter(
+                (_contains_any(meta_tags.get(field), tokens) for meta_tags in rows),
+                dtype=bool,
+                count=len(rows)
+            )
+        return TagColumns(fields, lengths, matches)
+
+    def score(self, columns):
+        """
+        Score every row of a TagColumns table, returning BatchScores
+        """
+        np = _import_numpy()
+        rows = len(columns)
+        rules = self.rule_set.rules
+        categories = self.rule_set.categories
+
+        score = np.full(rows, 100, dtype=np.int32)
+        category_totals = {key: np.full(rows, 100, dtype=np.int32) for key, _, _ in categories}
+        fired = np.empty((rows, len(rules)), dtype=bool)
+
+        for index, rule in enumerate(rules):
+            mask = self._rule_mask(np, rule, columns)
+            fired[:, index] = mask
+            category_delta = rule.get("category_delta", 0)
+            if category_delta:
+                category_totals[rule["category"]] += mask * np.int32(category_delta)
+            score_delta = rule.get("score_delta", 0)
+            if score_delta:
+                score += mask * np.int32(score_delta)
+
+        # Ensure scores don't go below 0 or above 100
+        np.maximum(score, 0, out=score)
+        for totals in category_totals.values():
+            np.clip(totals, 0, 100, out=totals)
+        return BatchScores(self.rule_set, score, category_totals, fired)
+
+    def score_meta_tags(self, meta_tags_list):
+        """
+        Shortcut for score(columns(meta_tags_list))
+        """
+        return self.score(self.columns(meta_tags_list))
+
+    def _rule_mask(self, np, rule, columns):
+        check = rule["check"]
+        if check == "contains_any":
+            return columns.matches[rule["code"]]
+
+        fields = rule.get("fields") or [rule["field"]]
+        length = columns.length(fields[0])
+        if check == "missing":
+            mask = length == 0
+            for field in fields[1:]:
+                mask &= columns.length(field) == 0
+            return mask
+        if check == "present":
+            return length > 0
+        if check == "shorter_than":
+            return (length > 0) & (length < rule["value"])
+        if check == "longer_than":
+            return (length > 0) & (length > rule["value"])
+        raise ValueError(f"Rule {rule.get('code')!r} uses check {check!r}, which has no batch form")
+
+
+def _contains_any(value, tokens):
+    if not value:
+        return False
+    value = value.lower()
+    return any(token in value for token in tokens)
@@ -0,0 +1,68 @@
+"""
+Compare row-by-row validate_seo with the vectorized BatchScorer
+
+Usage: python benchmarks/bench_batch_scoring.py [rows]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_scoring import BatchScorer
+from seo_analyzer import SEOAnalyzer
+
+
+def make_meta_tags(rng):
+    """
+    A synthetic meta_tags dict with a realistic mix of present, missing and badly sized tags
+    """
+    meta_tags = {}
+    for field in ('og:title', 'og:description', 'og:image', 'twitter:card', 'twitter:title',
+                  'canonical', 'viewport', 'charset', 'keywords'):
+        if rng.random() < 0.7:
+            meta_tags[field] = 'x' * rng.randint(1, 80)
+    if rng.random() < 0.9:
+        meta_tags['title'] = 't' * rng.randint(5, 90)
+    if rng.random() < 0.8:
+        meta_tags['description'] = 'd' * rng.randint(40, 200)
+    if rng.random() < 0.2:
+        meta_tags['robots'] = rng.choice(['index, follow', 'noindex', 'nofollow'])
+    meta_tags['h1_tags'] = ['Heading'] * rng.choice([0, 1, 1, 1, 2, 3])
+    return meta_tags
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    rng = random.Random(42)
+    data = [make_meta_tags(rng) for _ in range(rows)]
+
+    analyzer = SEOAnalyzer()
+    scorer = BatchScorer(analyzer.rule_set)
+
+    start = time.perf_counter()
+    scalar = [analyzer.validate_seo(meta_tags) for meta_tags in data]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    columns = scorer.columns(data)
+    columns_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores = scorer.score(columns)
+    score_time = time.perf_counter() - start
+
+    # The batch results must match the scalar ones exactly
+    for row, expected in enumerate(scalar):
+        if scores.result(row) != expected:
+            raise SystemExit(f"Mismatch at row {row}: {data[row]!r}")
+
+    print(f"rows: {rows}")
+    print(f"validate_seo loop:       {rows / scalar_time:>12,.0f} rows/sec")
+    print(f"batch (columns + score): {rows / (columns_time + score_time):>12,.0f} rows/sec")
+    print(f"batch (score only):      {rows / score_time:>12,.0f} rows/sec")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Check the seo-analyzer CLI's cold-start import cost against a budget
+
+Runs the CLI under python -X importtime, sums the cumulative import time of
+top-level modules, and fails (exit 1) when a budget is exceeded or a module
+that must stay lazy (Streamlit, and requests/bs4 for --help) gets imported.
+
+Usage: python benchmarks/bench_cli_startup.py [--runs N]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (label, CLI arguments, import budget in ms, modules that must not be imported)
+SCENARIOS = (
+    ('--help', ['--help'], 60, ('streamlit', 'requests', 'bs4', 'lxml', 'numpy')),
+    ('analyzer import', ['-c', 'import seo_cli, seo_analyzer, exporters'], 400, ('streamlit', 'numpy')),
+)
+
+
+def import_times(args):
+    """
+    Run the CLI once and return {module: cumulative import time in microseconds}, 0 for nested imports
+    """
+    if args[0] == '-c':
+        command = [sys.executable, '-X', 'importtime'] + args
+    else:
+        command = [sys.executable, '-X', 'importtime', os.path.join(ROOT, 'seo_cli.py')] + args
+    completed = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Nested imports are indented by two spaces per level; only top-level
+        # ones are timed, nested ones are recorded as imported with 0
+        if name.startswith('  '):
+            times.setdefault(name.strip(), 0)
+        else:
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5, help='runs per scenario; the fastest counts')
+    args = parser.parse_args()
+
+    over_budget = False
+    for label, cli_args, budget_ms, forbidden in SCENARIOS:
+        best = None
+        for _ in range(args.runs):
+            times = import_times(cli_args)
+            total = sum(times.values()) / 1000
+            if best is None or total < best[0]:
+                best = (total, times)
+        total, times = best
+
+        loaded = [module for module in forbidden if module in times]
+        status = 'ok'
+        if total > budget_ms or loaded:
+            status = 'FAIL'
+            over_budget = True
+        print(f"{label:<16} {total:>7.1f} ms (budget {budget_ms} ms)  {status}")
+        if loaded:
+            print(f"  imported modules that must stay lazy: {', '.join(loaded)}")
+        slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[:5]
+        for name, micros in slowest:
+            if micros:
+                print(f"  {micros / 1000:>7.1f} ms  {name}")
+
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
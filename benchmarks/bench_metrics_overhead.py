@@ -0,0 +1,58 @@
+"""
+Measure what metrics cost per analysis: analyze_website against a local server with and without AnalyzerMetrics
+
+Usage: python benchmarks/bench_metrics_overhead.py [requests]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metrics import AnalyzerMetrics
+from seo_analyzer import SEOAnalyzer
+from server import LocalServer
+
+
+def run(analyzer, url, requests_count):
+    start = time.perf_counter()
+    for _ in range(requests_count):
+        analyzer.analyze_website(url)
+    return (time.perf_counter() - start) / requests_count
+
+
+def main():
+    requests_count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    rounds = 6
+
+    with LocalServer() as server:
+        url = server.url('/page/tiny')
+        plain = SEOAnalyzer(extractor='stream')
+        instrumented = SEOAnalyzer(extractor='stream', metrics=AnalyzerMetrics())
+        plain.analyze_website(url)  # Warm up the pooled connections
+        instrumented.analyze_website(url)
+        # Alternate the two in short rounds and keep each one's best, so
+        # server and scheduler noise does not land on just one side
+        disabled = enabled = float('inf')
+        for index in range(rounds * 2):
+            # Swap which side goes first every round
+            if index % 2 == (index // 2) % 2:
+                disabled = min(disabled, run(plain, url, requests_count // rounds))
+            else:
+                enabled = min(enabled, run(instrumented, url, requests_count // rounds))
+
+    metrics = AnalyzerMetrics()
+    calls = 200000
+    start = time.perf_counter()
+    for _ in range(calls):
+        metrics.fetches.inc()
+        metrics.fetch_latency.observe(0.03)
+    per_update = (time.perf_counter() - start) / (calls * 2)
+
+    print(f"analyze_website without metrics: {disabled * 1e6:8.1f} µs/page")
+    print(f"analyze_website with metrics:    {enabled * 1e6:8.1f} µs/page ({(enabled / disabled - 1):+.1%})")
+    print(f"single metric update:            {per_update * 1e6:8.2f} µs")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Measure pages/sec of AnalysisPipeline by parse-worker count against threads-only analyze_many
+
+The fixture server runs in its own process so serving pages does not
+compete with the analyzer for the GIL. Pages are parsed with BeautifulSoup,
+where parsing rather than fetching dominates.
+
+Usage: python benchmarks/bench_pipeline.py [pages] [--workers 1,2,4,8] [--fixture typical]
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pipeline import AnalysisPipeline
+from seo_analyzer import SEOAnalyzer
+
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'server.py')
+FETCH_WORKERS = 16
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port):
+    process = subprocess.Popen([sys.executable, SERVER_SCRIPT, str(port)], stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/page/tiny", timeout=1).read()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Fixture server did not start")
+
+
+def new_analyzer():
+    return SEOAnalyzer(pool_maxsize=FETCH_WORKERS, extractor='soup')
+
+
+def bench_threads(urls):
+    analyzer = new_analyzer()
+    start = time.perf_counter()
+    for _, result in analyzer.analyze_many(urls, max_workers=FETCH_WORKERS, per_host_limit=FETCH_WORKERS):
+        analyzer.validate_result(result)
+    return len(urls) / (time.perf_counter() - start)
+
+
+def bench_pipeline(urls, parse_workers):
+    with AnalysisPipeline(new_analyzer(), parse_workers=parse_workers, fetch_workers=FETCH_WORKERS,
+                          per_host_limit=FETCH_WORKERS) as pipeline:
+        # Warm up so worker start-up is not counted
+        list(pipeline.run(urls[:parse_workers * 2]))
+        start = time.perf_counter()
+        for _ in pipeline.run(urls):
+            pass
+        return len(urls) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the process-pool analysis pipeline.')
+    parser.add_argument('pages', type=int, nargs='?', default=400)
+    parser.add_argument('--workers', help='comma-separated parse worker counts (default: 1, 2, 4, ... up to the core count)')
+    parser.add_argument('--fixture', default='typical', help='fixture page to analyze (default: typical)')
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    if args.workers:
+        worker_counts = [int(count) for count in args.workers.split(',')]
+    else:
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= cores:
+            worker_counts.append(worker_counts[-1] * 2)
+        if worker_counts[-1] != cores:
+            worker_counts.append(cores)
+
+    port = free_port()
+    server = start_server(port)
+    try:
+        urls = [f"http://127.0.0.1:{port}/page/{args.fixture}?n={index}" for index in range(args.pages)]
+        print(f"{args.pages} x {args.fixture}, {FETCH_WORKERS} fetch threads, {cores} core(s)")
+        baseline = bench_threads(urls)
+        print(f"{'threads only (analyze_many)':<30} {baseline:>8.1f} pages/s")
+        for count in worker_counts:
+            pages_per_sec = bench_pipeline(urls, count)
+            print(f"{f'pipeline, {count} parse worker(s)':<30} {pages_per_sec:>8.1f} pages/s  "
+                  f"({pages_per_sec / baseline:.2f}x)")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Measure batch preview generation: Google, Facebook, Twitter and LinkedIn HTML per page
+
+Usage: python benchmarks/bench_previews.py [pages]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preview_generators import build_previews
+
+WORDS = "search engine <optimization> & meta tags for \"modern\" websites it's fast".split()
+
+
+def make_meta_tags(rng, index):
+    def text(low, high):
+        return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+
+    meta_tags = {'title': text(3, 15), 'description': text(10, 40)}
+    if rng.random() < 0.7:
+        meta_tags['og:title'] = text(3, 12)
+        meta_tags['og:image'] = f"https://example.com/images/{index}.png"
+    if rng.random() < 0.5:
+        meta_tags['twitter:card'] = rng.choice(['summary', 'summary_large_image'])
+    return meta_tags
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    rng = random.Random(11)
+    data = [(make_meta_tags(rng, index), f"https://example.com/page/{index}") for index in range(pages)]
+
+    start = time.perf_counter()
+    total_bytes = 0
+    for meta_tags, url in data:
+        for html in build_previews(meta_tags, url).values():
+            total_bytes += len(html)
+    elapsed = time.perf_counter() - start
+
+    previews = pages * 4
+    print(f"pages: {pages}, previews: {previews}")
+    print(f"{previews / elapsed:,.0f} previews/sec ({elapsed:.2f}s, {total_bytes / previews:,.0f} bytes each)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Measure memory per page for dict results versus the compact result objects
+
+Usage: python benchmarks/bench_result_memory.py [pages]
+"""
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from results import AnalysisResult
+from seo_analyzer import SEOAnalyzer
+
+
+def make_result(rng, index):
+    """
+    A fresh analyze_website-style result, built from new strings as parsing would produce them
+    """
+    site = f"site{index % 50}.example"
+    meta_tags = {
+        'title': f"Page {index} title " + 'x' * rng.randint(10, 50),
+        'charset': ''.join(['utf', '-8']),
+        'description': f"Description of page {index} " + 'y' * rng.randint(40, 140),
+        'viewport': ''.join(['width=device-width, ', 'initial-scale=1']),
+    }
+    if rng.random() < 0.7:
+        meta_tags['og:title'] = meta_tags['title'][:40]
+        meta_tags['og:type'] = ''.join(['web', 'site'])
+        meta_tags['og:image'] = f"https://{site}/img/{index}.png"
+    if rng.random() < 0.5:
+        meta_tags['twitter:card'] = ''.join(['summary_', 'large_image'])
+    if rng.random() < 0.3:
+        meta_tags['generator'] = ''.join(['Word', 'Press 6.4'])
+    meta_tags['canonical'] = f"https://{site}/page/{index}"
+    meta_tags['h1_tags'] = [f"Heading {index}"] * rng.choice([0, 1, 1, 2])
+    return {
+        "success": True,
+        "final_url": f"https://{site}/page/{index}",
+        "status_code": 200,
+        "meta_tags": meta_tags,
+        "bytes_read": rng.randint(20000, 200000),
+        "parse_stats": {
+            "parser": ''.join(['lx', 'ml']),
+            "restricted": True,
+            "parse_time": rng.random() / 100,
+            "node_count": rng.randint(20, 200)
+        },
+        "error": None
+    }
+
+
+def measure(pages, build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = build(pages)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return (after - before) / pages
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    analyzer = SEOAnalyzer()
+
+    def build_dicts(count):
+        rng = random.Random(7)
+        held = []
+        for index in range(count):
+            result = make_result(rng, index)
+            held.append((result, analyzer.validate_seo(result["meta_tags"])))
+        return held
+
+    def build_compact(count):
+        rng = random.Random(7)
+        held = []
+        for index in range(count):
+            result = make_result(rng, index)
+            held.append(AnalysisResult.from_dict(result, analyzer.validate_seo(result["meta_tags"])))
+        return held
+
+    dict_bytes = measure(pages, build_dicts)
+    compact_bytes = measure(pages, build_compact)
+    print(f"pages: {pages}")
+    print(f"dict results:    {dict_bytes:>8,.0f} bytes/page")
+    print(f"compact results: {compact_bytes:>8,.0f} bytes/page ({compact_bytes / dict_bytes:.0%})")
+
+
+if __name__ == '__main__':
+    main()
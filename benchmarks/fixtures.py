@@ -0,0 +1,146 @@
+"""
+Deterministic HTML fixture corpus for the benchmarks
+
+Every fixture is generated from a fixed seed, so runs on different commits
+measure exactly the same bytes. Run directly to write the corpus to a
+directory for inspection: python benchmarks/fixtures.py [out_dir]
+"""
+import os
+import random
+import sys
+
+WORDS = (
+    "search engine optimization meta tags page content website business service product customer "
+    "quality guide review best free online local fast modern simple secure design team support"
+).split()
+
+
+def _text(rng, words):
+    return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+
+def _head(rng, extra=''):
+    return (
+        '<head>\n'
+        '<meta charset="utf-8">\n'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+        f'<title>{_text(rng, 8).title()}</title>\n'
+        f'<meta name="description" content="{_text(rng, 24)}">\n'
+        f'<meta name="keywords" content="{", ".join(rng.sample(WORDS, 6))}">\n'
+        '<meta name="robots" content="index, follow">\n'
+        f'<meta property="og:title" content="{_text(rng, 6).title()}">\n'
+        f'<meta property="og:description" content="{_text(rng, 20)}">\n'
+        '<meta property="og:image" content="https://example.com/images/share.png">\n'
+        '<meta property="og:type" content="website">\n'
+        '<meta name="twitter:card" content="summary_large_image">\n'
+        '<link rel="canonical" href="https://example.com/page">\n'
+        '<link rel="stylesheet" href="/static/site.css">\n'
+        '<script src="/static/site.js" defer></script>\n'
+        f'{extra}'
+        '</head>\n'
+    )
+
+
+def _article(rng, paragraphs):
+    parts = []
+    for index in range(paragraphs):
+        if index % 6 == 0:
+            parts.append(f'<h2>{_text(rng, 5).title()}</h2>')
+        parts.append(
+            f'<p>{_text(rng, 40)} <a href="/articles/{rng.randint(1, 5000)}">{_text(rng, 3)}</a> '
+            f'<strong>{_text(rng, 4)}</strong> {_text(rng, 30)}</p>'
+        )
+    return '\n'.join(parts)
+
+
+def _nav(rng, links):
+    items = ''.join(f'<li><a href="/section/{index}">{_text(rng, 2).title()}</a></li>' for index in range(links))
+    return f'<nav><ul>{items}</ul></nav>'
+
+
+def tiny_page():
+    return b'<!DOCTYPE html><html><head><title>Tiny</title></head><body><h1>Hi</h1></body></html>'
+
+
+def typical_page():
+    """
+    About 75 KB: full head, navigation, one H1 and an article body
+    """
+    rng = random.Random(1)
+    body = (
+        f'<body>\n{_nav(rng, 40)}\n<main>\n<h1>{_text(rng, 6).title()}</h1>\n'
+        f'{_article(rng, 120)}\n</main>\n<footer>{_nav(rng, 20)}</footer>\n</body>'
+    )
+    return f'<!DOCTYPE html>\n<html lang="en">\n{_head(rng)}{body}\n</html>\n'.encode('utf-8')
+
+
+def large_page(size=5 * 1024 * 1024):
+    """
+    About 5 MB of article markup behind a normal head
+    """
+    rng = random.Random(2)
+    chunk = _article(rng, 200)
+    repeats = max(1, size // len(chunk.encode('utf-8')))
+    body = f'<body>\n<h1>{_text(rng, 6).title()}</h1>\n' + '\n'.join([chunk] * repeats) + '\n</body>'
+    return f'<!DOCTYPE html>\n<html>\n{_head(rng)}{body}\n</html>\n'.encode('utf-8')
+
+
+def malformed_page():
+    """
+    Unclosed and misnested tags, stray attributes, a head that never closes and broken entities
+    """
+    rng = random.Random(3)
+    parts = [
+        '<html><head><title>Broken <b>markup & friends</title>',
+        '<meta name=description content=unquoted value here>',
+        '<meta property="og:title" content="Quote \'mix">',
+        '<meta name="viewport" content="width=device-width"',
+        '<body><h1>First <span>heading</h1></span>',
+    ]
+    for _ in range(300):
+        parts.append(f'<div><p>{_text(rng, 20)} &amp &copy &#xZZ; <a href=/x?a=1&b=2>{_text(rng, 2)}</div></p>')
+    parts.append('<table><tr><td>cell<td>cell<tr><td>row</table><h1>Second heading')
+    return '\n'.join(parts).encode('utf-8')
+
+
+def many_meta_page(count=2000):
+    rng = random.Random(4)
+    metas = '\n'.join(f'<meta name="custom-{index}" content="{_text(rng, 6)}">' for index in range(count))
+    return f'<!DOCTYPE html>\n<html>\n{_head(rng, metas + chr(10))}<body><h1>Many metas</h1></body>\n</html>\n'.encode('utf-8')
+
+
+def many_h1_page(count=1000):
+    rng = random.Random(5)
+    headings = '\n'.join(f'<h1>{_text(rng, 5)}</h1><p>{_text(rng, 15)}</p>' for _ in range(count))
+    return f'<!DOCTYPE html>\n<html>\n{_head(rng)}<body>\n{headings}\n</body>\n</html>\n'.encode('utf-8')
+
+
+FIXTURES = {
+    'tiny': tiny_page,
+    'typical': typical_page,
+    'large_5mb': large_page,
+    'malformed': malformed_page,
+    'many_meta': many_meta_page,
+    'many_h1': many_h1_page,
+}
+
+
+def load_corpus(names=None):
+    """
+    Return {name: HTML bytes} for every fixture, or only the ones named
+    """
+    return {name: FIXTURES[name]() for name in (names or FIXTURES)}
+
+
+def write_corpus(out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    for name, content in load_corpus().items():
+        with open(os.path.join(out_dir, f"{name}.html"), 'wb') as file:
+            file.write(content)
+
+
+if __name__ == '__main__':
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else 'benchmark_corpus'
+    write_corpus(out_dir)
+    for name, content in load_corpus().items():
+        print(f"{name:<10} {len(content):>10,} bytes")
@@ -0,0 +1,204 @@
+"""
+Offline benchmark suite: meta tag extraction, validate_seo and end-to-end analyze_website
+
+Every benchmark reports throughput and p50/p99 latency. Results are written
+as JSON (by default to benchmarks/results/<commit>.json) so runs on
+different commits can be compared:
+
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/abc1234.json
+    python benchmarks/run_benchmarks.py --only extract --min-time 0.2
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bs4 import BeautifulSoup
+
+from fixtures import load_corpus
+from seo_analyzer import META_TAG_STRAINER, SEOAnalyzer
+from server import LocalServer
+
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+
+# (name, path on the local server) for the end-to-end runs
+HTTP_SCENARIOS = (
+    ('tiny', '/page/tiny'),
+    ('typical', '/page/typical'),
+    ('large_5mb', '/page/large_5mb'),
+    ('malformed', '/page/malformed'),
+    ('many_h1', '/page/many_h1'),
+    ('latency_20ms', '/page/typical?latency=20'),
+    ('redirect_x3', '/redirect/3/page/typical'),
+    ('slow_drip', '/page/typical?drip=8192&interval=2'),
+)
+
+GROUPS = ('extract', 'validate', 'http')
+
+
+def percentile(sorted_values, fraction):
+    """
+    Nearest-rank percentile of an already sorted list
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def measure(function, min_time, min_iterations=5, max_iterations=100000):
+    """
+    Call function repeatedly for at least min_time seconds, returning throughput and latency percentiles
+    """
+    latencies = []
+    started = time.perf_counter()
+    while len(latencies) < max_iterations:
+        call_started = time.perf_counter()
+        function()
+        latencies.append(time.perf_counter() - call_started)
+        if len(latencies) >= min_iterations and time.perf_counter() - started >= min_time:
+            break
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "iterations": len(latencies),
+        "ops_per_sec": len(latencies) / total if total else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+def bench_extract(corpus, min_time):
+    results = {}
+    soup_analyzer = SEOAnalyzer(extractor='soup')
+    stream_analyzer = SEOAnalyzer(extractor='stream')
+    for name, content in corpus.items():
+        # _extract_meta_tags alone, over a tree parsed once up front
+        soup = BeautifulSoup(content, soup_analyzer.html_parser, parse_only=META_TAG_STRAINER)
+        results[f"extract_meta_tags/{name}"] = measure(lambda: soup_analyzer._extract_meta_tags(soup), min_time)
+        # Full parse plus extraction for both backends
+        for label, analyzer in (('soup', soup_analyzer), ('stream', stream_analyzer)):
+            stats = measure(lambda: analyzer._parse_page(content), min_time)
+            stats["mb_per_sec"] = stats["ops_per_sec"] * len(content) / 1e6
+            results[f"parse/{label}/{name}"] = stats
+    return results
+
+
+def bench_validate(corpus, min_time):
+    results = {}
+    analyzer = SEOAnalyzer(extractor='stream')
+    for name, content in corpus.items():
+        meta_tags = analyzer._parse_page(content)[0]
+        results[f"validate_seo/{name}"] = measure(lambda: analyzer.validate_seo(meta_tags), min_time)
+    return results
+
+
+def bench_http(corpus, min_time):
+    results = {}
+    with LocalServer(corpus=corpus) as server:
+        analyzer = SEOAnalyzer()
+        for name, path in HTTP_SCENARIOS:
+            url = server.url(path)
+
+            def analyze():
+                result = analyzer.analyze_website(url)
+                if not result["success"]:
+                    raise RuntimeError(f"{name}: {result['error']}")
+
+            results[f"analyze_website/{name}"] = measure(analyze, min_time, min_iterations=3)
+
+        # Concurrent batch throughput; latency here is per batch
+        urls = [server.url(f'/page/typical?latency=5&n={index}') for index in range(100)]
+        batch = measure(lambda: list(analyzer.analyze_many(urls, max_workers=16, per_host_limit=16)),
+                        min_time, min_iterations=1)
+        batch["pages_per_sec"] = batch["ops_per_sec"] * len(urls)
+        results["analyze_many/typical_x100"] = batch
+    return results
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                                    capture_output=True, text=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown', False
+
+
+def compare(current, baseline_path, threshold):
+    """
+    Print throughput and p99 changes against a saved run, returning the names that regressed
+    """
+    with open(baseline_path, encoding='utf-8') as file:
+        baseline = json.load(file)
+    print(f"\nCompared with {baseline['meta']['commit']} ({baseline_path}):")
+    regressions = []
+    for name, stats in current["benchmarks"].items():
+        old = baseline["benchmarks"].get(name)
+        if not old:
+            continue
+        throughput_change = (stats["ops_per_sec"] / old["ops_per_sec"] - 1) if old["ops_per_sec"] else 0.0
+        p99_change = (stats["p99_ms"] / old["p99_ms"] - 1) if old["p99_ms"] else 0.0
+        flag = ''
+        if throughput_change < -threshold or p99_change > threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f"  {name:<40} ops/s {throughput_change:>+7.1%}   p99 {p99_change:>+7.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the offline benchmark suite.')
+    parser.add_argument('--only', choices=GROUPS, action='append', help='run only these groups')
+    parser.add_argument('--min-time', type=float, default=1.0, help='seconds to spend per benchmark')
+    parser.add_argument('--output', help='result file (default: benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', help='earlier result file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='relative change counted as a regression (default: 0.10)')
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    commit, dirty = git_commit()
+    runners = {'extract': bench_extract, 'validate': bench_validate, 'http': bench_http}
+
+    benchmarks = {}
+    for group in args.only or GROUPS:
+        for name, stats in runners[group](corpus, args.min_time).items():
+            benchmarks[name] = stats
+            print(f"{name:<40} {stats['ops_per_sec']:>12,.1f} ops/s   "
+                  f"p50 {stats['p50_ms']:>9.3f} ms   p99 {stats['p99_ms']:>9.3f} ms")
+
+    current = {
+        "meta": {
+            "commit": commit + ('-dirty' if dirty else ''),
+            "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "min_time": args.min_time,
+        },
+        "benchmarks": benchmarks,
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{current['meta']['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(current, file, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        return 1 if compare(current, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Local threaded HTTP stand-in for benchmarking analyze_website without the internet
+
+Serves the fixture corpus and simulates slow or awkward servers through the URL:
+
+    /page/<fixture>                  the fixture's HTML
+    /page/<fixture>?latency=50       wait 50 ms before responding
+    /page/<fixture>?drip=4096&interval=5
+                                     send the body 4096 bytes at a time, 5 ms apart
+    /redirect/<n>/page/<fixture>     follow n 302 redirects first
+
+Run directly to serve the corpus: python benchmarks/server.py [port]
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import sys
+import threading
+import time
+
+from fixtures import load_corpus
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out as separate writes; with Nagle on, keep-alive
+    # clients would wait out a delayed ACK (~40 ms) on every response
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        segments = [segment for segment in parts.path.split('/') if segment]
+
+        if params.get('latency'):
+            time.sleep(float(params['latency']) / 1000)
+
+        if len(segments) >= 3 and segments[0] == 'redirect':
+            remaining = int(segments[1])
+            rest = '/'.join(segments[2:])
+            target = f"/redirect/{remaining - 1}/{rest}" if remaining > 1 else f"/{rest}"
+            if parts.query:
+                target += '?' + parts.query
+            self.send_response(302)
+            self.send_header('Location', target)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        if len(segments) != 2 or segments[0] != 'page' or segments[1] not in self.server.corpus:
+            self.send_error(404)
+            return
+
+        body = self.server.corpus[segments[1]]
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+
+        drip = int(params.get('drip', 0))
+        if not drip:
+            self.wfile.write(body)
+            return
+        interval = float(params.get('interval', 10)) / 1000
+        for start in range(0, len(body), drip):
+            self.wfile.write(body[start:start + drip])
+            self.wfile.flush()
+            time.sleep(interval)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalServer:
+    """
+    Run the fixture server on a background thread; use as a context manager
+
+        with LocalServer() as server:
+            analyzer.analyze_website(server.url('/page/typical?latency=20'))
+    """
+    def __init__(self, host='127.0.0.1', port=0, corpus=None):
+        self.httpd = ThreadingHTTPServer((host, port), FixtureHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.corpus = corpus if corpus is not None else load_corpus()
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path):
+        return self.base_url + path
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == '__main__':
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+    server = LocalServer(port=port)
+    print(f"Serving fixtures on {server.base_url}/page/<name> (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.httpd.server_close()
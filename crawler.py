@@ -0,0 +1,169 @@
+from collections import deque
+from urllib.parse import urlparse
+import hashlib
+import time
+
+from seo_analyzer import FetchConfig, SEOAnalyzer, normalize_url
+
+
+class SeenSet:
+    """
+    Compact set of visited URLs
+
+    Stores a 64-bit BLAKE2 digest of each normalized URL instead of the URL
+    string, which keeps millions of entries to a few tens of bytes each. The
+    chance of two distinct URLs colliding stays negligible (about 1 in 10^7
+    at two million URLs).
+    """
+    def __init__(self):
+        self._hashes = set()
+
+    def add(self, url):
+        """
+        Add a normalized URL, returning False if it was already present
+        """
+        key = int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big')
+        if key in self._hashes:
+            return False
+        self._hashes.add(key)
+        return True
+
+    def __len__(self):
+        return len(self._hashes)
+
+
+class SiteCrawler:
+    """
+    Crawl a site breadth-first from a seed URL, analyzing every internal page found
+
+    Links are followed only within the seed's host (and its subdomains when
+    include_subdomains is set), up to max_depth links away from the seed and
+    max_pages pages in total. Each depth level is analyzed concurrently with
+    SEOAnalyzer.analyze_many. Links that turn out not to be HTML pages
+    (PDFs, images, downloads) are dropped once their Content-Type is seen,
+    without downloading the body, and counted in stats()["skipped"]; this
+    needs an analyzer whose FetchConfig has html_only set, as the default
+    analyzer does.
+    """
+    def __init__(self, analyzer=None, max_depth=3, max_pages=1000, max_workers=8, per_host_limit=4,
+                 include_subdomains=False, progress_every=50, on_progress=None):
+        if analyzer is None:
+            analyzer = SEOAnalyzer(collect_links=True, pool_maxsize=max_workers, config=FetchConfig(html_only=True))
+        elif not analyzer.collect_links:
+            raise ValueError("SiteCrawler needs an SEOAnalyzer created with collect_links=True")
+
+        self.analyzer = analyzer
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.include_subdomains = include_subdomains
+        self.progress_every = progress_every
+        self.on_progress = on_progress
+
+        self._seen = SeenSet()
+        self._frontier_size = 0
+        self._pages_done = 0
+        self._errors = 0
+        self._skipped = 0
+        self._started_at = None
+
+    def crawl(self, seed_url):
+        """
+        Yield (url, depth, result, validation) for every crawled page as it finishes
+
+        validation is the validate_seo output for successfully analyzed pages
+        and None for pages that failed to load.
+        """
+        if not seed_url.startswith(('http://', 'https://')):
+            seed_url = 'https://' + seed_url
+        self._site_host = self._bare_host(seed_url)
+        self._started_at = time.monotonic()
+
+        # URLs are fetched as discovered but deduplicated by normalized form
+        self._seen.add(normalize_url(seed_url))
+        level = deque([seed_url])
+        self._frontier_size = 1
+
+        for depth in range(self.max_depth + 1):
+            if not level:
+                break
+            next_level = deque()
+
+            for url, result in self.analyzer.analyze_many(
+                self._drain(level),
+                max_workers=self.max_workers,
+                per_host_limit=self.per_host_limit
+            ):
+                if result.get("not_html"):
+                    self._skipped += 1
+                    continue
+                self._pages_done += 1
+                validation = None
+                if result["success"]:
+                    validation = self.analyzer.validate_result(result)
+                    if depth < self.max_depth:
+                        for link in result.get("links", []):
+                            self._enqueue(link, next_level)
+                else:
+                    self._errors += 1
+
+                yield url, depth, result, validation
+
+                if self.on_progress and self._pages_done % self.progress_every == 0:
+                    self.on_progress(self.stats())
+
+            level = next_level
+
+        if self.on_progress:
+            self.on_progress(self.stats())
+
+    def stats(self):
+        """
+        Return crawl progress: pages done, errors, non-HTML links skipped, pages/sec, frontier size and URLs seen
+        """
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0.0
+        return {
+            "pages": self._pages_done,
+            "errors": self._errors,
+            "skipped": self._skipped,
+            "elapsed": elapsed,
+            "pages_per_sec": self._pages_done / elapsed if elapsed > 0 else 0.0,
+            "frontier_size": self._frontier_size,
+            "seen": len(self._seen),
+        }
+
+    def _drain(self, level):
+        """
+        Hand out queued URLs one at a time so the frontier size stays accurate
+        """
+        while level:
+            self._frontier_size -= 1
+            yield level.popleft()
+
+    def _enqueue(self, link, next_level):
+        if len(self._seen) >= self.max_pages:
+            return
+        try:
+            if not self._is_internal(link):
+                return
+            key = normalize_url(link)
+        except ValueError:
+            # Unparseable link, e.g. a port out of range
+            return
+        if self._seen.add(key):
+            next_level.append(link)
+            self._frontier_size += 1
+
+    def _is_internal(self, url):
+        host = self._bare_host(url)
+        if host == self._site_host:
+            return True
+        return self.include_subdomains and host.endswith('.' + self._site_host)
+
+    def _bare_host(self, url):
+        """
+        Host of a URL without port or a leading www.
+        """
+        host = urlparse(url).hostname or ''
+        return host[4:] if host.startswith('www.') else host
@@ -0,0 +1,224 @@
+import csv
+import gzip
+import io
+import json
+
+from results import AnalysisResult, ValidationResult
+from seo_rules import CATEGORIES
+
+# Meta tags exported as their own columns
+KEY_TAGS = (
+    'title', 'description', 'canonical', 'robots', 'viewport',
+    'og:title', 'og:description', 'og:image', 'twitter:card'
+)
+
+COLUMNS = (
+    ('url', 'final_url', 'status_code', 'success', 'error', 'score')
+    + tuple(f"{key}_score" for key, _, _ in CATEGORIES)
+    + ('issue_codes', 'h1_count', 'h1')
+    + KEY_TAGS
+)
+
+FORMATS = ('jsonl', 'csv')
+
+DEFAULT_BUFFER_SIZE = 256 * 1024
+
+
+def export_record(url, result, validation=None):
+    """
+    Flatten one page's analysis result and validation into an export row
+
+    Accepts the dicts from analyze_website/validate_seo or their compact
+    results.py forms; an AnalysisResult carrying its validation needs no
+    separate validation argument.
+    """
+    if isinstance(result, AnalysisResult):
+        if validation is None:
+            validation = result.validation
+        success, final_url, status_code, error = result.success, result.final_url, result.status_code, result.error
+        meta_tags = result.meta_tags
+    else:
+        success, final_url, status_code, error = (
+            result["success"], result.get("final_url"), result.get("status_code"), result.get("error")
+        )
+        meta_tags = result.get("meta_tags") or {}
+
+    record = {
+        "url": url,
+        "final_url": final_url,
+        "status_code": status_code,
+        "success": success,
+        "error": error,
+        "score": None,
+    }
+
+    if isinstance(validation, ValidationResult):
+        record["score"] = validation.score
+        for key, _, _ in CATEGORIES:
+            record[f"{key}_score"] = validation.category_score(key)
+        record["issue_codes"] = list(validation.issue_codes)
+    elif validation is not None:
+        record["score"] = validation["score"]
+        category_scores = validation["category_scores"]
+        for key, _, _ in CATEGORIES:
+            category = category_scores.get(key)
+            record[f"{key}_score"] = category["score"] if category else None
+        record["issue_codes"] = list(validation.get("issue_codes", ()))
+    else:
+        for key, _, _ in CATEGORIES:
+            record[f"{key}_score"] = None
+        record["issue_codes"] = []
+
+    h1_tags = meta_tags.get('h1_tags') or ()
+    record["h1_count"] = len(h1_tags)
+    record["h1"] = h1_tags[0] if h1_tags else None
+    for tag in KEY_TAGS:
+        record[tag] = meta_tags.get(tag)
+    return record
+
+
+def open_text_output(path_or_file, compress=None, buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Open a path, or wrap a caller's binary file object, for buffered UTF-8 text output
+
+    compress defaults to True for paths ending in .gz. Closing the returned
+    stream never closes a file object passed in by the caller.
+    """
+    if isinstance(path_or_file, (str, bytes)) or hasattr(path_or_file, '__fspath__'):
+        if compress is None:
+            compress = str(path_or_file).endswith('.gz')
+        raw = gzip.open(path_or_file, 'wb') if compress else open(path_or_file, 'wb', buffering=0)
+    else:
+        raw = _Unclosable(path_or_file)
+        if compress:
+            raw = gzip.GzipFile(fileobj=raw, mode='wb')
+    # GzipFile compresses on every write, so rows are batched ahead of it
+    return io.TextIOWrapper(io.BufferedWriter(raw, buffer_size), encoding='utf-8', newline='')
+
+
+class _Unclosable(io.RawIOBase):
+    """
+    Pass writes through to a caller's file object without closing it when we close
+    """
+    def __init__(self, file):
+        self._file = file
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._file.write(data)
+        return len(data)
+
+    def flush(self):
+        self._file.flush()
+
+
+class ResultExporter:
+    """
+    Stream analysis results to a file one row at a time
+
+    Rows are written through a buffer of buffer_size bytes, so memory stays
+    constant however many pages are exported. Use as a context manager, or
+    call close() when done.
+    """
+    def __init__(self, path_or_file, compress=None, buffer_size=DEFAULT_BUFFER_SIZE):
+        self._stream = open_text_output(path_or_file, compress, buffer_size)
+        self.rows_written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, url, result, validation=None):
+        self._write_record(export_record(url, result, validation))
+        self.rows_written += 1
+
+    def write_all(self, rows):
+        """
+        Write every (url, result, validation) tuple from an iterable, returning the number written
+        """
+        for url, result, validation in rows:
+            self.write(url, result, validation)
+        return self.rows_written
+
+    def close(self):
+        if not self._stream.closed:
+            self._stream.close()
+
+    def _write_record(self, record):
+        raise NotImplementedError
+
+
+class JsonlExporter(ResultExporter):
+    """
+    One JSON object per line
+    """
+    def _write_record(self, record):
+        self._stream.write(json.dumps(record, ensure_ascii=False))
+        self._stream.write('\n')
+
+
+class CsvExporter(ResultExporter):
+    """
+    CSV with a header row; issue codes are joined with spaces
+    """
+    def __init__(self, path_or_file, compress=None, buffer_size=DEFAULT_BUFFER_SIZE):
+        super().__init__(path_or_file, compress, buffer_size)
+        self._writer = csv.writer(self._stream)
+        self._writer.writerow(COLUMNS)
+
+    def _write_record(self, record):
+        record["issue_codes"] = ' '.join(record["issue_codes"])
+        self._writer.writerow([record[column] for column in COLUMNS])
+
+
+EXPORTERS = {
+    'jsonl': JsonlExporter,
+    'csv': CsvExporter,
+}
+
+
+def format_for_path(path):
+    """
+    Guess the export format from a file name such as audit.csv or audit.jsonl.gz
+    """
+    name = str(path)
+    if name.endswith('.gz'):
+        name = name[:-3]
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith(('.jsonl', '.ndjson', '.json')):
+        return 'jsonl'
+    raise ValueError(f"Cannot tell the export format of {name!r}; pass one of {', '.join(FORMATS)}")
+
+
+def open_exporter(path_or_file, format=None, compress=None, buffer_size=DEFAULT_BUFFER_SIZE):
+    if format is None:
+        format = format_for_path(path_or_file)
+    if format not in EXPORTERS:
+        raise ValueError(f"Unknown export format {format!r}, expected one of {', '.join(FORMATS)}")
+    return EXPORTERS[format](path_or_file, compress=compress, buffer_size=buffer_size)
+
+
+def export_results(rows, path_or_file, format=None, compress=None, buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Write an iterable of (url, result, validation) tuples as JSONL or CSV, returning the row count
+
+    The iterable is consumed lazily, so a generator such as
+    with_validation(analyzer.analyze_many(urls), analyzer) is written to
+    disk as results arrive without the full result set ever being in memory.
+    """
+    with open_exporter(path_or_file, format, compress, buffer_size) as exporter:
+        return exporter.write_all(rows)
+
+
+def with_validation(pairs, analyzer):
+    """
+    Turn analyze_many's (url, result) pairs into (url, result, validation) tuples
+    """
+    for url, result in pairs:
+        validation = analyzer.validate_result(result)
+        yield url, result, validation
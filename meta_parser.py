@@ -0,0 +1,266 @@
+from html.parser import HTMLParser
+import re
+from bs4.builder import HTMLTreeBuilder
+from bs4.dammit import EntitySubstitution, UnicodeDammit
+
+# Tag sets BeautifulSoup uses when building an html.parser tree. Reusing them
+# keeps this parser's output identical to SEOAnalyzer._extract_meta_tags.
+VOID_ELEMENTS = frozenset(HTMLTreeBuilder.DEFAULT_EMPTY_ELEMENT_TAGS)
+PRESERVE_WHITESPACE_ELEMENTS = frozenset(HTMLTreeBuilder.DEFAULT_PRESERVE_WHITESPACE_TAGS)
+# Text inside these (script, style, template, ...) is not part of get_text()
+STRING_CONTAINER_ELEMENTS = frozenset(HTMLTreeBuilder.DEFAULT_STRING_CONTAINERS)
+ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+MAX_H1_TAGS = 3
+
+# html.parser can pass a reference that lacks its semicolon with the text
+# that followed it still attached, e.g. "39abc" for "&#39abc"
+DECIMAL_REFERENCE = re.compile(r'([0-9]*)(.*)', re.DOTALL)
+HEX_REFERENCE = re.compile(r'([0-9a-fA-F]*)(.*)', re.DOTALL)
+REPLACEMENT_CHARACTER = '\ufffd'
+
+
+def dereference_numeric(name):
+    """
+    Resolve a numeric character reference as the HTML spec does, returning (character, trailing data)
+
+    Code points 0x80-0x9F are read as windows-1252, as browsers and
+    BeautifulSoup do, and invalid code points become U+FFFD.
+    """
+    if name[:1] in ('x', 'X'):
+        digits, extra_data = HEX_REFERENCE.match(name, 1).groups()
+        base = 16
+    else:
+        digits, extra_data = DECIMAL_REFERENCE.match(name).groups()
+        base = 10
+    if not digits:
+        return '', name
+
+    number = int(digits, base)
+    if number == 0 or number > 0x10FFFF or 0xD800 <= number <= 0xDFFF:
+        return REPLACEMENT_CHARACTER, extra_data
+    if 0x80 <= number <= 0x9F:
+        try:
+            return bytes([number]).decode('windows-1252'), extra_data
+        except UnicodeDecodeError:
+            # 0x81, 0x8D, 0x8F, 0x90 and 0x9D have no windows-1252 character
+            pass
+    return chr(number), extra_data
+
+
+class MetaTagParser(HTMLParser):
+    """
+    Event-driven meta tag extractor that produces the same dict as SEOAnalyzer._extract_meta_tags
+
+    Only a stack of open tag names is kept instead of a full document tree.
+    Markup can be fed incrementally with feed(); call close() and then
+    meta_tags() once the document is complete. With collect_links the
+    href of every <a> element is kept as well, see links().
+    """
+    def __init__(self, collect_links=False):
+        super().__init__(convert_charrefs=False)
+        self._stack = []
+        self._open_counts = {}
+        self._already_closed_void = []
+        self._pending_data = []
+
+        # Open elements whose text is being collected, as (stack index, parts)
+        self._captures = []
+        self._title_parts = None
+        self._h1_parts = []
+        self._metas = []
+        self._canonical_link = None
+        self._links = [] if collect_links else None
+
+    def meta_tags(self):
+        """
+        Return the extracted meta tags, in the same order as _extract_meta_tags
+        """
+        self._flush_data()
+        meta_tags = {}
+
+        # Title tag
+        if self._title_parts is not None:
+            meta_tags['title'] = ''.join(self._title_parts).strip()
+
+        # Meta tags
+        for attrs in self._metas:
+            # Standard meta tags
+            if attrs.get('name'):
+                content = attrs.get('content', '').strip()
+                if content:
+                    meta_tags[attrs['name'].lower()] = content
+
+            # Property meta tags (Open Graph, etc.)
+            elif attrs.get('property'):
+                content = attrs.get('content', '').strip()
+                if content:
+                    meta_tags[attrs['property'].lower()] = content
+
+            # HTTP-equiv meta tags
+            elif attrs.get('http-equiv'):
+                content = attrs.get('content', '').strip()
+                if content:
+                    meta_tags[f"http-equiv-{attrs['http-equiv'].lower()}"] = content
+
+            # Charset
+            elif attrs.get('charset'):
+                meta_tags['charset'] = attrs['charset']
+
+        # Canonical URL
+        if self._canonical_link and self._canonical_link.get('href'):
+            meta_tags['canonical'] = self._canonical_link['href']
+
+        # H1 tags
+        if self._h1_parts:
+            meta_tags['h1_tags'] = [''.join(parts).strip() for parts in self._h1_parts]
+
+        return meta_tags
+
+    def links(self):
+        """
+        Return the raw href values of <a> elements, in document order
+        """
+        return list(self._links or [])
+
+    def handle_starttag(self, tag, attrs, handle_empty_element=True):
+        self._flush_data()
+
+        attr_dict = {}
+        for key, value in attrs:
+            attr_dict[key] = '' if value is None else value
+
+        if tag == 'meta':
+            self._metas.append(attr_dict)
+        elif tag == 'link' and self._canonical_link is None:
+            rel = attr_dict.get('rel')
+            if rel is not None and (rel == 'canonical' or 'canonical' in rel.split()):
+                self._canonical_link = attr_dict
+        elif tag == 'a' and self._links is not None and attr_dict.get('href'):
+            self._links.append(attr_dict['href'])
+
+        self._stack.append(tag)
+        self._open_counts[tag] = self._open_counts.get(tag, 0) + 1
+        if tag == 'title' and self._title_parts is None:
+            self._title_parts = []
+            self._captures.append((len(self._stack) - 1, self._title_parts))
+        elif tag == 'h1' and len(self._h1_parts) < MAX_H1_TAGS:
+            parts = []
+            self._h1_parts.append(parts)
+            self._captures.append((len(self._stack) - 1, parts))
+
+        if tag in VOID_ELEMENTS and handle_empty_element:
+            # html.parser sends no end event for void elements, so close them
+            # now and ignore one explicit closing tag later on
+            self.handle_endtag(tag, check_already_closed=False)
+            self._already_closed_void.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs, handle_empty_element=False)
+        self.handle_endtag(tag, check_already_closed=False)
+
+    def handle_endtag(self, tag, check_already_closed=True):
+        if check_already_closed and tag in self._already_closed_void:
+            self._already_closed_void.remove(tag)
+            return
+
+        self._flush_data()
+        if not self._open_counts.get(tag):
+            return
+
+        # Close everything up to and including the most recent open element
+        # with this name
+        while self._stack:
+            popped = self._stack.pop()
+            self._open_counts[popped] -= 1
+            while self._captures and self._captures[-1][0] >= len(self._stack):
+                self._captures.pop()
+            if popped == tag:
+                break
+
+    def handle_data(self, data):
+        self._pending_data.append(data)
+
+    def handle_charref(self, name):
+        character, extra_data = dereference_numeric(name)
+        if character:
+            self.handle_data(character)
+        if extra_data:
+            self.handle_data(extra_data)
+
+    def handle_entityref(self, name):
+        character = EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name)
+        self.handle_data(character if character is not None else f"&{name}")
+
+    def handle_comment(self, data):
+        self._flush_data()
+
+    def handle_decl(self, decl):
+        self._flush_data()
+
+    def handle_pi(self, data):
+        self._flush_data()
+
+    def unknown_decl(self, data):
+        self._flush_data()
+        if data.upper().startswith('CDATA['):
+            # CDATA sections count as text, even inside script or template
+            self._pending_data.append(data[len('CDATA['):])
+            self._flush_data(cdata=True)
+
+    def close(self):
+        super().close()
+        self._flush_data()
+
+    def _flush_data(self, cdata=False):
+        """
+        Hand the text collected since the last markup event to every element capturing text
+        """
+        if not self._pending_data:
+            return
+        data = ''.join(self._pending_data)
+        self._pending_data = []
+
+        if not self._captures:
+            return
+        if not cdata and any(self._open_counts.get(tag) for tag in STRING_CONTAINER_ELEMENTS):
+            return
+
+        # Whitespace-only runs collapse to one character outside <pre>-like elements
+        if not any(self._open_counts.get(tag) for tag in PRESERVE_WHITESPACE_ELEMENTS):
+            if not data.strip(ASCII_SPACES):
+                data = '\n' if '\n' in data else ' '
+
+        for _, parts in self._captures:
+            parts.append(data)
+
+
+def decode_html(content):
+    """
+    Decode raw HTML bytes the same way BeautifulSoup does
+    """
+    if isinstance(content, str):
+        return content
+    markup = UnicodeDammit(content, is_html=True).unicode_markup
+    if markup is None:
+        markup = content.decode('utf-8', errors='replace')
+    return markup
+
+
+def extract_meta_tags(content):
+    """
+    Extract meta tags from raw HTML without building a document tree
+    """
+    parser = MetaTagParser()
+    parser.feed(decode_html(content))
+    parser.close()
+    return parser.meta_tags()
+
+
+def extract_meta_tags_and_links(content):
+    """
+    Extract meta tags and <a href> values from raw HTML without building a document tree
+    """
+    parser = MetaTagParser(collect_links=True)
+    parser.feed(decode_html(content))
+    parser.close()
+    return parser.meta_tags(), parser.links()
@@ -0,0 +1,314 @@
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import math
+import os
+import threading
+
+# Bucket upper bounds in seconds for fetch and parse latency
+FETCH_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PARSE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        if math.isinf(value):
+            return '+Inf' if value > 0 else '-Inf'
+        return repr(value)
+    return str(value)
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, values, extra=''):
+    pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class _Metric:
+    """
+    One named series family; labelled children are created on first use
+    """
+    type_name = None
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {labels!r}")
+        return tuple(str(value) for value in labels)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.type_name}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        if not items and not self.labelnames:
+            items = [((), self._initial())]
+        for labels, value in items:
+            lines.extend(self._render_sample(labels, value))
+        return lines
+
+    def _initial(self):
+        return 0
+
+    def _render_sample(self, labels, value):
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    type_name = 'counter'
+
+    def inc(self, amount=1, labels=()):
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, labels=()):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    type_name = 'gauge'
+
+    def inc(self, amount=1, labels=()):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, labels=()):
+        self.inc(-amount, labels)
+
+    def set(self, value, labels=()):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, labels=()):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Histogram(_Metric):
+    """
+    Cumulative-bucket histogram in the Prometheus exposition format
+    """
+    type_name = 'histogram'
+
+    def __init__(self, name, help_text, labelnames=(), buckets=FETCH_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _initial(self):
+        # Per-bucket counts (last one is +Inf), then sum and count
+        return [[0] * (len(self.buckets) + 1), 0.0, 0]
+
+    def observe(self, value, labels=()):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = self._initial()
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def _render_sample(self, labels, state):
+        counts, total, count = state
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+            cumulative += bucket_count
+            le = f'le="{_format_value(float(bound))}"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+        label_text = _format_labels(self.labelnames, labels)
+        lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+        lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    A set of metrics rendered together in the Prometheus text format
+
+    Expose it with serve() for scraping, or write_to_file() for the
+    node_exporter textfile collector or any other file-based pickup.
+    """
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name!r} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, help_text, labelnames=()):
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name, help_text, labelnames=()):
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def histogram(self, name, help_text, labelnames=(), buckets=FETCH_BUCKETS):
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def get(self, name):
+        return self._metrics.get(name)
+
+    def render(self):
+        """
+        Return every metric in the Prometheus text exposition format
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def write_to_file(self, path):
+        """
+        Write the current metrics to path, replacing it atomically so readers never see a partial file
+        """
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.write(self.render())
+        os.replace(temp_path, path)
+
+    def serve(self, port=9464, host='127.0.0.1'):
+        """
+        Serve the metrics at http://host:port/metrics from a daemon thread, returning the started MetricsServer
+        """
+        return MetricsServer(self, host, port).start()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = None
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes every few seconds would flood stderr
+        pass
+
+
+class MetricsServer:
+    """
+    Tiny HTTP endpoint serving a registry for Prometheus to scrape
+    """
+    def __init__(self, registry, host='127.0.0.1', port=9464):
+        handler = type('MetricsHandler', (_MetricsHandler,), {"registry": registry})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name='seo-metrics', daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+class MetricsFileWriter:
+    """
+    Write a registry to a file every interval seconds from a daemon thread, and once more on stop
+    """
+    def __init__(self, registry, path, interval=15):
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='seo-metrics-file', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.registry.write_to_file(self.path)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.registry.write_to_file(self.path)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+class AnalyzerMetrics:
+    """
+    The series SEOAnalyzer updates when constructed with metrics=AnalyzerMetrics()
+
+    Pass a registry to share it with other metrics of the process; by
+    default a new one is created. Analyzers without metrics skip all of
+    this behind a single None check per call site.
+    """
+    def __init__(self, registry=None, prefix='seo_analyzer_'):
+        self.registry = registry if registry is not None else MetricsRegistry()
+        self.fetches = self.registry.counter(
+            prefix + 'fetches_total', 'Pages requested over the network.')
+        self.errors = self.registry.counter(
+            prefix + 'errors_total', 'Failed analyses by error type.', ('type',))
+        self.cache_hits = self.registry.counter(
+            prefix + 'cache_hits_total', 'Analyses answered without a full fetch, by source.', ('source',))
+        self.bytes_read = self.registry.counter(
+            prefix + 'bytes_read_total', 'HTML bytes read and parsed.')
+        self.fetch_latency = self.registry.histogram(
+            prefix + 'fetch_duration_seconds', 'Time from sending a request until its body was read.',
+            buckets=FETCH_BUCKETS)
+        self.parse_latency = self.registry.histogram(
+            prefix + 'parse_duration_seconds', 'Time spent decoding, parsing and extracting meta tags.',
+            buckets=PARSE_BUCKETS)
+        self.in_flight = self.registry.gauge(
+            prefix + 'in_flight_requests', 'Analyses currently running.')
+
+    def render(self):
+        return self.registry.render()
+
+    def serve(self, port=9464, host='127.0.0.1'):
+        return self.registry.serve(port, host)
+
+    def write_to_file(self, path):
+        self.registry.write_to_file(path)
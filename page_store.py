@@ -0,0 +1,195 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+HEAD_END_RE = re.compile(rb'</head\s*>', re.IGNORECASE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    final_url TEXT,
+    status_code INTEGER,
+    headers TEXT NOT NULL,
+    content_hash TEXT,
+    content_length INTEGER,
+    head_html BLOB,
+    meta_tags TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    links TEXT
+)
+"""
+
+UPSERT = """
+INSERT OR REPLACE INTO pages
+    (url, final_url, status_code, headers, content_hash, content_length, head_html, meta_tags, fetched_at, links)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+COLUMNS = 'url, final_url, status_code, headers, content_hash, content_length, head_html, meta_tags, fetched_at, links'
+
+
+class PageStore:
+    """
+    Persistent SQLite store of fetched pages and their extracted meta tags
+
+    Each row is keyed by normalized URL and holds the final URL, status,
+    response headers, a SHA-256 of the body, optionally the zlib-compressed
+    <head> HTML, the meta_tags dict and, for analyzers that collect them,
+    the page's links (NULL otherwise). Writes from add() are buffered and
+    committed batch_size rows per transaction so batch runs are not bound by
+    one fsync per page; call flush() or close() to commit the remainder.
+    """
+    def __init__(self, path, batch_size=100, store_head_html=False):
+        self.path = path
+        self.batch_size = batch_size
+        self.store_head_html = store_head_html
+        self._lock = threading.Lock()
+        self._pending = {}
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        # In WAL mode NORMAL only syncs at checkpoints and stays crash-safe
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(SCHEMA)
+        # Stores created before links were kept lack the column
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(pages)')}
+        if 'links' not in columns:
+            self._conn.execute('ALTER TABLE pages ADD COLUMN links TEXT')
+        self._conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def build_record(self, url, result, response_headers, content):
+        """
+        Turn a successful analysis result and its raw response into a storable row
+        """
+        head_html = None
+        if self.store_head_html and content:
+            match = HEAD_END_RE.search(content)
+            head_html = zlib.compress(content[:match.end()] if match else content)
+
+        return (
+            url,
+            result["final_url"],
+            result["status_code"],
+            json.dumps(dict(response_headers or {})),
+            hashlib.sha256(content).hexdigest() if content is not None else None,
+            len(content) if content is not None else None,
+            head_html,
+            json.dumps(result["meta_tags"]),
+            time.time(),
+            json.dumps(result["links"]) if "links" in result else None,
+        )
+
+    def add(self, url, result, response_headers=None, content=None):
+        """
+        Buffer a page for writing, committing once batch_size pages are pending
+        """
+        record = self.build_record(url, result, response_headers, content)
+        with self._lock:
+            self._pending[url] = record
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def put_many(self, records):
+        """
+        Write an iterable of rows from build_record in a single transaction
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(UPSERT, records)
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(UPSERT, self._pending.values())
+        self._pending.clear()
+
+    def get(self, url, max_age=None):
+        """
+        Return the stored page for a normalized URL as a dict, or None if absent or older than max_age seconds
+        """
+        with self._lock:
+            record = self._pending.get(url)
+            if record is None:
+                record = self._conn.execute(f'SELECT {COLUMNS} FROM pages WHERE url = ?', (url,)).fetchone()
+        if record is None:
+            return None
+        page = _record_to_page(record)
+        if max_age is not None and time.time() - page["fetched_at"] > max_age:
+            return None
+        return page
+
+    def iter_pages(self):
+        """
+        Yield every stored page, e.g. to re-run validate_seo with new rules offline
+        """
+        self.flush()
+        with self._lock:
+            records = self._conn.execute(f'SELECT {COLUMNS} FROM pages ORDER BY url').fetchall()
+        for record in records:
+            yield _record_to_page(record)
+
+    def iter_results(self):
+        """
+        Yield (url, result) pairs shaped like SEOAnalyzer.analyze_website results
+        """
+        for page in self.iter_pages():
+            yield page["url"], page_to_result(page)
+
+    def count(self):
+        self.flush()
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM pages').fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+
+def _record_to_page(record):
+    url, final_url, status_code, headers, content_hash, content_length, head_html, meta_tags, fetched_at, links = record
+    return {
+        "url": url,
+        "final_url": final_url,
+        "status_code": status_code,
+        "headers": json.loads(headers),
+        "content_hash": content_hash,
+        "content_length": content_length,
+        "head_html": zlib.decompress(head_html) if head_html is not None else None,
+        "meta_tags": json.loads(meta_tags),
+        "fetched_at": fetched_at,
+        "links": json.loads(links) if links is not None else None,
+    }
+
+
+def page_to_result(page):
+    """
+    Rebuild an analyze_website-style result from a stored page, with links when they were stored
+    """
+    result = {
+        "success": True,
+        "final_url": page["final_url"],
+        "status_code": page["status_code"],
+        "meta_tags": page["meta_tags"],
+        "bytes_read": page["content_length"] or 0,
+        "parse_stats": None,
+        "error": None
+    }
+    if page["links"] is not None:
+        result["links"] = page["links"]
+    return result
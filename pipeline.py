@@ -0,0 +1,230 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import os
+import time
+
+from seo_analyzer import HOST_QUEUE_LOOKAHEAD, HostSlots, SEOAnalyzer
+from seo_rules import DEFAULT_RULE_SET
+from timings import collect_timings
+
+# Fetch threads are already running when parse workers start, and forking a
+# process that has threads can deadlock the child, so workers are never forked
+DEFAULT_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# Stages measured in the parse worker; the rest come from the fetch thread
+WORKER_STAGES = ('decode', 'parse', 'extract', 'validate')
+
+# The parse worker's own analyzer, created once per process by _init_worker
+_worker_analyzer = None
+
+
+def worker_options(analyzer):
+    """
+    Return the SEOAnalyzer arguments a parse worker needs to parse and validate like analyzer
+    """
+    return {
+        "extractor": analyzer.extractor,
+        "html_parser": analyzer.html_parser,
+        "restrict_parse": analyzer.restrict_parse,
+        "collect_links": analyzer.collect_links,
+        "rules": None if analyzer.rule_set is DEFAULT_RULE_SET else analyzer.rule_set.rules,
+    }
+
+
+def _init_worker(options):
+    global _worker_analyzer
+    _worker_analyzer = SEOAnalyzer(profiler=False, **options)
+
+
+def _parse_and_validate(final_url, status_code, content):
+    """
+    Parse-worker job: build the analysis result for fetched bytes and validate it
+
+    Returns (result, validation); result["timings"] holds the worker stages.
+    """
+    with collect_timings() as timings:
+        result = _worker_analyzer._success_result(final_url, status_code, content)
+    result["timings"] = timings
+    validation = _worker_analyzer.validate_result(result)
+    return result, validation
+
+
+class AnalysisPipeline:
+    """
+    Two-stage analysis: fetch threads feed raw HTML to a pool of parse processes
+
+    Parsing and validate_seo are CPU-bound and hold the GIL, so threads alone
+    stop scaling once they dominate. Here fetch_workers threads only do I/O
+    and every downloaded page goes to one of parse_workers processes (all
+    cores by default). At most backlog fetched pages wait for a parse worker;
+    fetching pauses while the backlog is full, so memory stays bounded.
+
+    The page bytes are handed to the worker as-is (never decoded or copied
+    into another buffer first) and only the small result dict comes back.
+    Caching, the page store, the politeness scheduler and metrics of the
+    given analyzer apply as they do for analyze_many.
+
+    Use it as a context manager, or call close(), to stop the worker processes.
+    """
+    def __init__(self, analyzer=None, parse_workers=None, fetch_workers=16, per_host_limit=2,
+                 backlog=None, start_method=DEFAULT_START_METHOD):
+        self.analyzer = analyzer if analyzer is not None else SEOAnalyzer(pool_maxsize=fetch_workers)
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.fetch_workers = fetch_workers
+        self.per_host_limit = per_host_limit
+        self.backlog = backlog or self.parse_workers * 4
+        self.start_method = start_method
+        self._parse_pool = None
+
+    def _get_parse_pool(self):
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context(self.start_method),
+                initializer=_init_worker,
+                initargs=(worker_options(self.analyzer),)
+            )
+        return self._parse_pool
+
+    def close(self):
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=True, cancel_futures=True)
+            self._parse_pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def run(self, urls):
+        """
+        Analyze many websites, yielding (url, result, validation) tuples as they finish
+
+        Results have the same shape as analyze_website's, timings included;
+        validation is None for failed pages.
+        """
+        analyzer = self.analyzer
+        parse_pool = self._get_parse_pool()
+
+        def fetch(url):
+            with collect_timings() as timings:
+                start = time.perf_counter()
+                result, page = analyzer._fetch_page(url, timings)
+                timings["total"] = time.perf_counter() - start
+            return result, page, timings
+
+        if analyzer.scheduler is not None:
+            urls = analyzer.scheduler.interleave(urls)
+
+        url_iter = iter(urls)
+        exhausted = False
+        fetching = {}
+        slots = HostSlots(self.per_host_limit, analyzer._host_of)
+        fetched = deque()
+        parsing = {}
+        max_fetching = self.fetch_workers * 2
+        max_parsing = self.parse_workers * 2
+        fetch_pool = ThreadPoolExecutor(max_workers=self.fetch_workers)
+        metrics = analyzer.metrics
+
+        def start_fetch(url):
+            # A page counts as in flight from its fetch until it is parsed
+            fetching[fetch_pool.submit(fetch, url)] = url
+            if metrics is not None:
+                metrics.in_flight.inc()
+
+        try:
+            while True:
+                # Only fetch more while the pages already downloaded fit the
+                # backlog; URLs for hosts at per_host_limit wait in slots
+                while len(fetching) < max_fetching and len(fetched) < self.backlog:
+                    url = slots.next_ready()
+                    if url is None:
+                        break
+                    start_fetch(url)
+
+                while (not exhausted and len(fetching) < max_fetching and len(fetched) < self.backlog
+                       and slots.parked < HOST_QUEUE_LOOKAHEAD):
+                    try:
+                        url = next(url_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    if slots.add(url):
+                        start_fetch(url)
+
+                while fetched and len(parsing) < max_parsing:
+                    url, page, timings = fetched.popleft()
+                    _, final_url, status_code, _, content = page
+                    try:
+                        future = parse_pool.submit(_parse_and_validate, final_url, status_code, content)
+                    except BrokenProcessPool:
+                        # A worker died (e.g. killed for memory); the pages it
+                        # held fail with an error result, the rest go to a new pool
+                        self._parse_pool.shutdown(wait=False)
+                        self._parse_pool = None
+                        parse_pool = self._get_parse_pool()
+                        future = parse_pool.submit(_parse_and_validate, final_url, status_code, content)
+                    parsing[future] = (url, page, timings)
+
+                if not fetching and not parsing:
+                    break
+
+                done, _ = wait(list(fetching) + list(parsing), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in fetching:
+                        # Popped after result() so a fetch that raised is still
+                        # in fetching, and counted, when finally runs
+                        result, page, timings = future.result()
+                        url = fetching.pop(future)
+                        slots.finish(url)
+                        if page is None:
+                            # Cached, revalidated or failed: nothing to parse
+                            if metrics is not None:
+                                metrics.in_flight.dec()
+                            result["timings"] = timings
+                            yield url, result, analyzer.validate_result(result)
+                        else:
+                            fetched.append((url, page, timings))
+                    else:
+                        url, page, timings = parsing.pop(future)
+                        if metrics is not None:
+                            metrics.in_flight.dec()
+                        yield (url, *self._finish(future, page, timings))
+        finally:
+            # Stop queued work if the caller abandons the generator early
+            fetch_pool.shutdown(wait=False, cancel_futures=True)
+            for future in parsing:
+                future.cancel()
+            if metrics is not None:
+                metrics.in_flight.dec(len(fetching) + len(fetched) + len(parsing))
+            if analyzer.store is not None:
+                analyzer.store.flush()
+
+    def _finish(self, future, page, fetch_timings):
+        """
+        Combine a parse worker's output with the fetch it came from, returning (result, validation)
+        """
+        analyzer = self.analyzer
+        cache_key, _, _, response_headers, content = page
+        try:
+            result, validation = future.result()
+            worker_timings = result["timings"]
+            for stage in WORKER_STAGES:
+                fetch_timings[stage] = worker_timings[stage]
+                fetch_timings["total"] += worker_timings[stage]
+            result["timings"] = fetch_timings
+            analyzer._remember(cache_key, result, response_headers, content)
+        except Exception as e:
+            analyzer._count_error('analysis')
+            result = analyzer._error_result(f"Analysis error: {str(e)}")
+            result["timings"] = fetch_timings
+            return result, None
+
+        if analyzer.metrics is not None:
+            analyzer.metrics.bytes_read.inc(result["bytes_read"])
+            analyzer.metrics.parse_latency.observe(result["parse_stats"]["parse_time"])
+        return result, validation
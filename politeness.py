@@ -0,0 +1,302 @@
+from collections import OrderedDict, deque
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+import asyncio
+import threading
+import time
+
+import requests
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket; reserve() books the next token and returns how long to wait for it
+    """
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        with self._lock:
+            self._refill()
+            # Going negative books a future token, so concurrent callers
+            # queue up behind each other instead of all waking at once
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def set_rate(self, rate):
+        """
+        Change the refill rate; time already elapsed is credited at the old rate
+        """
+        with self._lock:
+            self._refill()
+            self.rate = rate
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class RobotsCache:
+    """
+    Fetch-once cache of parsed robots.txt files, one per scheme and host, refreshed after ttl seconds
+
+    robots.txt is requested with session and headers, and its rules are
+    matched against user_agent, which defaults to the User-Agent header.
+    PolitenessScheduler binds these to its analyzer's session and headers
+    unless they were given here.
+    """
+    def __init__(self, user_agent=None, ttl=3600, timeout=10, session=None, headers=None):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.session = session
+        self.headers = headers
+        self._user_agent = user_agent
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._host_locks = {}
+
+    @property
+    def user_agent(self):
+        if self._user_agent is not None:
+            return self._user_agent
+        return (self.headers or {}).get('User-Agent') or '*'
+
+    def bind(self, session, headers, timeout):
+        """
+        Fetch with an analyzer's session, headers and timeout, unless a session was already given
+        """
+        if self.session is None:
+            self.session = session
+            self.headers = headers
+            self.timeout = timeout
+
+    def crawl_delay(self, url):
+        """
+        Return the Crawl-delay in seconds that applies to a URL, or None
+        """
+        return self.crawl_delay_in(self.parser_for(url))
+
+    def crawl_delay_in(self, parser):
+        """
+        Return the Crawl-delay in seconds a parsed robots.txt sets for user_agent, or None
+        """
+        delay = parser.crawl_delay(self.user_agent)
+        return float(delay) if delay is not None else None
+
+    def can_fetch(self, url):
+        return self.parser_for(url).can_fetch(self.user_agent, url)
+
+    def parser_for(self, url):
+        """
+        Return the parsed robots.txt for a URL's host, fetching it when missing or older than ttl
+        """
+        origin = _origin(url)
+        with self._lock:
+            entry = self._entries.get(origin)
+            if entry is not None and time.monotonic() - entry[1] < self.ttl:
+                return entry[0]
+            host_lock = self._host_locks.setdefault(origin, threading.Lock())
+
+        # Only one thread fetches a given robots.txt; the others wait for it
+        with host_lock:
+            with self._lock:
+                entry = self._entries.get(origin)
+                if entry is not None and time.monotonic() - entry[1] < self.ttl:
+                    return entry[0]
+            parser = self._fetch(origin)
+            with self._lock:
+                self._entries[origin] = (parser, time.monotonic())
+            return parser
+
+    def _fetch(self, origin):
+        if self.session is None:
+            self.session = requests.Session()
+        parser = RobotFileParser(origin + '/robots.txt')
+        try:
+            response = self.session.get(origin + '/robots.txt', headers=self.headers, timeout=self.timeout)
+        except requests.exceptions.RequestException:
+            # Unreachable robots.txt: assume no restrictions
+            parser.parse([])
+            parser.modified()
+            return parser
+
+        # Same status handling as RobotFileParser.read()
+        if response.status_code in (401, 403):
+            parser.disallow_all = True
+        elif response.status_code >= 400:
+            parser.allow_all = True
+        else:
+            parser.parse(response.text.splitlines())
+        # crawl_delay() and can_fetch() answer nothing until this is set
+        parser.modified()
+        return parser
+
+
+class PolitenessScheduler:
+    """
+    Per-host politeness layer for SEOAnalyzer's fetch path
+
+    Every fetch first takes a token from its host's bucket, refilled at
+    rate requests per second, or slower when robots.txt sets a longer
+    Crawl-delay. A host's rate follows its robots.txt, re-read once the
+    cached copy is older than robots_ttl. interleave() reorders a URL stream round-robin across hosts
+    so one huge site does not starve the others. stats() reports per-host
+    queue depth and time spent waiting.
+    """
+    def __init__(self, rate=1.0, burst=1, respect_crawl_delay=True, robots_ttl=3600, user_agent=None,
+                 max_hosts=10000):
+        self.rate = rate
+        self.burst = burst
+        self.robots = RobotsCache(user_agent=user_agent, ttl=robots_ttl) if respect_crawl_delay else None
+        self.max_hosts = max_hosts
+        self._hosts = OrderedDict()
+        self._lock = threading.Lock()
+
+    def bind(self, session, headers, timeout):
+        """
+        Fetch robots.txt with the analyzer's session, headers and timeout; SEOAnalyzer calls this
+        """
+        if self.robots is not None:
+            self.robots.bind(session, headers, timeout)
+
+    def acquire(self, url):
+        """
+        Block until the URL's host may be fetched again
+        """
+        host, wait = self._reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+        self._finish_wait(host, wait)
+
+    async def acquire_async(self, url):
+        """
+        Asyncio version of acquire(); robots.txt is fetched in a worker thread
+        """
+        host, wait = await asyncio.to_thread(self._reserve, url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        self._finish_wait(host, wait)
+
+    def interleave(self, urls, lookahead=1000):
+        """
+        Yield URLs round-robin across hosts, buffering at most lookahead URLs from the source
+        """
+        queues = OrderedDict()
+        buffered = 0
+        url_iter = iter(urls)
+        exhausted = False
+
+        while True:
+            while not exhausted and buffered < lookahead:
+                try:
+                    url = next(url_iter)
+                except StopIteration:
+                    exhausted = True
+                    break
+                origin = _origin(url)
+                queues.setdefault(origin, deque()).append(url)
+                self._host(origin)["queued"] += 1
+                buffered += 1
+
+            if not queues:
+                return
+
+            # Take one URL from the host at the front, then rotate it to the back
+            origin, queue = next(iter(queues.items()))
+            url = queue.popleft()
+            buffered -= 1
+            self._host(origin)["queued"] -= 1
+            if queue:
+                queues.move_to_end(origin)
+            else:
+                del queues[origin]
+            yield url
+
+    def stats(self):
+        """
+        Return per-host queue depth, waiting fetches, wait times and effective rate
+        """
+        with self._lock:
+            return {
+                origin: {
+                    "queued": host["queued"],
+                    "waiting": host["waiting"],
+                    "requests": host["requests"],
+                    "total_wait": host["total_wait"],
+                    "avg_wait": host["total_wait"] / host["requests"] if host["requests"] else 0.0,
+                    "rate": host["bucket"].rate if host["bucket"] else None,
+                    "crawl_delay": host["crawl_delay"],
+                }
+                for origin, host in self._hosts.items()
+            }
+
+    def _reserve(self, url):
+        origin = _origin(url)
+        host = self._host(origin)
+        if self.robots is not None:
+            # A new parser means robots.txt was (re)fetched, so its Crawl-delay may have changed
+            robots = self.robots.parser_for(url)
+            if robots is not host["robots"]:
+                crawl_delay = self.robots.crawl_delay_in(robots)
+                rate = min(self.rate, 1.0 / crawl_delay) if crawl_delay else self.rate
+                with self._lock:
+                    host["robots"] = robots
+                    host["crawl_delay"] = crawl_delay
+                    if host["bucket"] is None:
+                        host["bucket"] = TokenBucket(rate, self.burst)
+                    else:
+                        host["bucket"].set_rate(rate)
+        elif host["bucket"] is None:
+            with self._lock:
+                if host["bucket"] is None:
+                    host["bucket"] = TokenBucket(self.rate, self.burst)
+
+        wait = host["bucket"].reserve()
+        with self._lock:
+            host["waiting"] += 1
+        return origin, wait
+
+    def _finish_wait(self, origin, wait):
+        with self._lock:
+            host = self._hosts.get(origin)
+            if host is not None:
+                host["waiting"] -= 1
+                host["requests"] += 1
+                host["total_wait"] += wait
+
+    def _host(self, origin):
+        with self._lock:
+            host = self._hosts.get(origin)
+            if host is None:
+                host = self._hosts[origin] = {
+                    "bucket": None,
+                    "robots": None,
+                    "crawl_delay": None,
+                    "queued": 0,
+                    "waiting": 0,
+                    "requests": 0,
+                    "total_wait": 0.0,
+                }
+                # Forget the least recently used idle host once over the limit
+                if len(self._hosts) > self.max_hosts:
+                    for old_origin, old_host in self._hosts.items():
+                        if not old_host["queued"] and not old_host["waiting"]:
+                            del self._hosts[old_origin]
+                            break
+            else:
+                self._hosts.move_to_end(origin)
+            return host
+
+
+def _origin(url):
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    parts = urlparse(url)
+    return f"{parts.scheme}://{parts.netloc.lower()}"
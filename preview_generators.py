@@ -1,204 +1,306 @@
-import streamlit as st
+from html import escape
 from urllib.parse import urlparse
 import re
 
-class PreviewGenerator:
-    def render_google_preview(self, meta_tags, url):
-        """
-        Render Google search result preview
-        """
-        title = meta_tags.get('title', 'Untitled Page')
-        description = meta_tags.get('description', '')
-        
-        # If no description, create a more realistic fallback
-        if not description:
-            description = "This page doesn't have a meta description. Search engines will generate a snippet from the page content instead."
-        
-        # Truncate title for Google (typically ~60 characters)
-        display_title = self._truncate_text(title, 60)
-        
-        # Truncate description for Google (typically ~160 characters)
-        display_description = self._truncate_text(description, 160)
-        
-        # Extract domain from URL
-        domain = urlparse(url).netloc if url else 'example.com'
-        
-        # Create Google-like preview
-        st.markdown(f"""
+# Preview card templates, formatted with already-escaped values. Kept as
+# bound str.format methods so each preview is a single format call.
+GOOGLE_TEMPLATE = """
         <div class="preview-card" style="border: 1px solid #e0e0e0; padding: 16px; background: white; max-width: 100%;">
             <div style="color: #1a0dab; font-size: 1.1rem; font-weight: normal; margin-bottom: 4px; cursor: pointer; word-wrap: break-word;">
-                {display_title}
+                {title}
             </div>
             <div style="color: #006621; font-size: 0.9rem; margin-bottom: 4px;">
                 {domain}
             </div>
             <div style="color: #545454; font-size: 0.9rem; line-height: 1.4; word-wrap: break-word;">
-                {display_description}
+                {description}
             </div>
         </div>
-        """, unsafe_allow_html=True)
-        
-        # Show character counts with responsive design
-        title_color = "#28a745" if len(title) <= 60 else "#ffc107" if len(title) <= 70 else "#dc3545"
-        desc_color = "#28a745" if len(description) <= 160 else "#ffc107" if len(description) <= 170 else "#dc3545"
-        
-        st.markdown(f"""
+        """.format
+
+GOOGLE_LENGTHS_TEMPLATE = """
         <div style="background: #f8f9fa; padding: 1rem; border-radius: 8px; margin: 1rem 0;">
             <div style="display: flex; flex-wrap: wrap; gap: 1rem; justify-content: space-between;">
-                <div><strong>Title:</strong> <span style='color: {title_color}; font-weight: 600;'>{len(title)}/60 characters</span></div>
-                <div><strong>Description:</strong> <span style='color: {desc_color}; font-weight: 600;'>{len(description)}/160 characters</span></div>
+                <div><strong>Title:</strong> <span style='color: {title_color}; font-weight: 600;'>{title_length}/60 characters</span></div>
+                <div><strong>Description:</strong> <span style='color: {description_color}; font-weight: 600;'>{description_length}/160 characters</span></div>
             </div>
         </div>
-        """, unsafe_allow_html=True)
-    
-    def render_facebook_preview(self, meta_tags, url):
-        """
-        Render Facebook sharing preview
-        """
-        title = meta_tags.get('og:title', meta_tags.get('title', 'Untitled Page'))
-        description = meta_tags.get('og:description', meta_tags.get('description', ''))
-        image = meta_tags.get('og:image', '')
-        site_name = meta_tags.get('og:site_name', urlparse(url).netloc if url else 'Website')
-        
-        # Better fallback for missing description
-        if not description:
-            description = "Check out this page for more information."
-        
-        # Truncate for Facebook
-        display_title = self._truncate_text(title, 100)
-        display_description = self._truncate_text(description, 300)
-        
-        st.markdown(f"""
+        """.format
+
+FACEBOOK_TEMPLATE = """
         <div class="preview-card" style="border: 1px solid #dadde1; overflow: hidden; background: white; max-width: 100%; width: 100%;">
             <div style="height: 200px; background: #f0f2f5; display: flex; align-items: center; justify-content: center; color: #8a8d91;">
-                {f'<div style="font-size: 0.8rem; text-align: center; padding: 1rem;">🖼️ Image: {image[:50]}...</div>' if image else '<div>No Open Graph image</div>'}
+                {image}
             </div>
             <div style="padding: 12px;">
                 <div style="color: #8a8d91; font-size: 0.75rem; text-transform: uppercase; margin-bottom: 4px;">
                     {site_name}
                 </div>
                 <div style="color: #1d2129; font-size: 1rem; font-weight: 600; margin-bottom: 4px; line-height: 1.3; word-wrap: break-word;">
-                    {display_title}
+                    {title}
                 </div>
                 <div style="color: #606770; font-size: 0.9rem; line-height: 1.3; word-wrap: break-word;">
-                    {display_description}
+                    {description}
                 </div>
             </div>
         </div>
-        """, unsafe_allow_html=True)
-        
-        # Show recommendations
-        if not image:
-            st.warning("⚠️ No og:image found. Facebook posts with images get 2.3x more engagement!")
-        if not meta_tags.get('og:title'):
-            st.info("💡 Consider adding og:title for better Facebook sharing")
-    
-    def render_twitter_preview(self, meta_tags, url):
-        """
-        Render Twitter card preview
-        """
-        card_type = meta_tags.get('twitter:card', 'summary')
-        title = meta_tags.get('twitter:title', meta_tags.get('og:title', meta_tags.get('title', 'Untitled Page')))
-        description = meta_tags.get('twitter:description', 
-                                  meta_tags.get('og:description', 
-                                              meta_tags.get('description', '')))
-        image = meta_tags.get('twitter:image', meta_tags.get('og:image', ''))
-        site = meta_tags.get('twitter:site', '@website')
-        
-        # Better fallback for missing description
-        if not description:
-            description = "Shared from " + (urlparse(url).netloc if url else 'this website')
-        
-        # Truncate for Twitter
-        display_title = self._truncate_text(title, 70)
-        display_description = self._truncate_text(description, 200)
-        
-        # Determine card layout
-        if card_type == 'summary_large_image':
-            image_height = "200px"
-        else:
-            image_height = "120px"
-        
-        st.markdown(f"""
+        """.format
+
+TWITTER_TEMPLATE = """
         <div class="preview-card" style="border: 1px solid #cfd9de; overflow: hidden; background: white; max-width: 100%; width: 100%;">
             <div style="height: {image_height}; background: #f7f9fa; display: flex; align-items: center; justify-content: center; color: #536471;">
-                {f'<div style="font-size: 0.8rem; text-align: center; padding: 1rem;">🖼️ Image: {image[:50]}...</div>' if image else '<div>No Twitter image</div>'}
+                {image}
             </div>
             <div style="padding: 12px;">
                 <div style="color: #0f1419; font-size: 0.95rem; font-weight: 700; margin-bottom: 4px; line-height: 1.3; word-wrap: break-word;">
-                    {display_title}
+                    {title}
                 </div>
                 <div style="color: #536471; font-size: 0.9rem; line-height: 1.3; margin-bottom: 4px; word-wrap: break-word;">
-                    {display_description}
+                    {description}
                 </div>
                 <div style="color: #536471; font-size: 0.85rem;">
-                    🔗 {urlparse(url).netloc if url else 'example.com'}
+                    🔗 {domain}
                 </div>
             </div>
         </div>
-        """, unsafe_allow_html=True)
-        
-        # Show card type info
-        st.info(f"🐦 Card type: {card_type}")
-        
-        if card_type not in ['summary', 'summary_large_image']:
-            st.warning("⚠️ Uncommon card type detected. Consider using 'summary' or 'summary_large_image'")
-    
-    def render_linkedin_preview(self, meta_tags, url):
-        """
-        Render LinkedIn sharing preview
-        """
-        title = meta_tags.get('og:title', meta_tags.get('title', 'Untitled Page'))
-        description = meta_tags.get('og:description', meta_tags.get('description', ''))
-        image = meta_tags.get('og:image', '')
-        site_name = meta_tags.get('og:site_name', urlparse(url).netloc if url else 'Website')
-        
-        # Better fallback for missing description
-        if not description:
-            description = "Visit this page to learn more about what we have to offer."
-        
-        # Truncate for LinkedIn
-        display_title = self._truncate_text(title, 200)
-        display_description = self._truncate_text(description, 300)
-        
-        st.markdown(f"""
+        """.format
+
+LINKEDIN_TEMPLATE = """
         <div class="preview-card" style="border: 1px solid #d0d0d0; overflow: hidden; background: white; max-width: 100%; width: 100%;">
             <div style="height: 272px; background: #f3f2ef; display: flex; align-items: center; justify-content: center; color: #666666;">
-                {f'<div style="font-size: 0.8rem; text-align: center; padding: 1rem;">🖼️ Image: {image[:50]}...</div>' if image else '<div>No Open Graph image</div>'}
+                {image}
             </div>
             <div style="padding: 12px 16px 16px 16px;">
                 <div style="color: #000000; font-size: 1rem; font-weight: 600; margin-bottom: 4px; line-height: 1.4; word-wrap: break-word;">
-                    {display_title}
+                    {title}
                 </div>
                 <div style="color: #666666; font-size: 0.9rem; line-height: 1.4; margin-bottom: 8px; word-wrap: break-word;">
-                    {display_description}
+                    {description}
                 </div>
                 <div style="color: #666666; font-size: 0.75rem;">
                     {site_name}
                 </div>
             </div>
         </div>
-        """, unsafe_allow_html=True)
-        
+        """.format
+
+GOOGLE_FALLBACK_DESCRIPTION = "This page doesn't have a meta description. Search engines will generate a snippet from the page content instead."
+
+IMAGE_TEMPLATE = '<div style="font-size: 0.8rem; text-align: center; padding: 1rem;">🖼️ Image: {image}...</div>'.format
+
+
+def truncate_text(text, max_length):
+    """
+    Truncate text with ellipsis if it exceeds max_length, breaking at word boundaries when possible
+    """
+    if len(text) <= max_length:
+        return text
+
+    # Try to break at word boundary
+    truncated = text[:max_length-3]
+    last_space = truncated.rfind(' ')
+
+    # If we found a space and it's not too close to the beginning, break there
+    if last_space > max_length * 0.7:
+        return truncated[:last_space] + "..."
+    else:
+        return truncated + "..."
+
+
+def _escape(text):
+    # Every value lands in element text, never in an attribute, so quotes can stay as they are
+    return escape(text, quote=False)
+
+
+def _length_color(length, limit):
+    return "#28a745" if length <= limit else "#ffc107" if length <= limit + 10 else "#dc3545"
+
+
+def _image_html(image, placeholder):
+    # Escaped after slicing, so an entity is never cut in half
+    return IMAGE_TEMPLATE(image=_escape(image[:50])) if image else placeholder
+
+
+def google_preview_html(meta_tags, url):
+    """
+    Return the HTML of a Google search result preview
+    """
+    title = meta_tags.get('title', 'Untitled Page')
+    description = meta_tags.get('description', '')
+
+    # If no description, create a more realistic fallback
+    if not description:
+        description = GOOGLE_FALLBACK_DESCRIPTION
+
+    # Titles are cut around 60 characters and descriptions around 160;
+    # values are escaped after truncation so the limits count visible text
+    return GOOGLE_TEMPLATE(
+        title=_escape(truncate_text(title, 60)),
+        domain=_escape(urlparse(url).netloc if url else 'example.com'),
+        description=_escape(truncate_text(description, 160))
+    )
+
+
+def google_lengths_html(meta_tags):
+    """
+    Return the HTML of the title/description character counts shown under the Google preview
+    """
+    title_length = len(meta_tags.get('title', 'Untitled Page'))
+    description_length = len(meta_tags.get('description', '') or GOOGLE_FALLBACK_DESCRIPTION)
+    return GOOGLE_LENGTHS_TEMPLATE(
+        title_color=_length_color(title_length, 60),
+        title_length=title_length,
+        description_color=_length_color(description_length, 160),
+        description_length=description_length
+    )
+
+
+def facebook_preview_html(meta_tags, url):
+    """
+    Return the HTML of a Facebook sharing preview
+    """
+    title = meta_tags.get('og:title', meta_tags.get('title', 'Untitled Page'))
+    description = meta_tags.get('og:description', meta_tags.get('description', ''))
+    image = meta_tags.get('og:image', '')
+    site_name = meta_tags.get('og:site_name', urlparse(url).netloc if url else 'Website')
+
+    # Better fallback for missing description
+    if not description:
+        description = "Check out this page for more information."
+
+    return FACEBOOK_TEMPLATE(
+        image=_image_html(image, '<div>No Open Graph image</div>'),
+        site_name=_escape(site_name),
+        title=_escape(truncate_text(title, 100)),
+        description=_escape(truncate_text(description, 300))
+    )
+
+
+def twitter_preview_html(meta_tags, url):
+    """
+    Return the HTML of a Twitter card preview
+    """
+    card_type = meta_tags.get('twitter:card', 'summary')
+    title = meta_tags.get('twitter:title', meta_tags.get('og:title', meta_tags.get('title', 'Untitled Page')))
+    description = meta_tags.get('twitter:description',
+                                meta_tags.get('og:description',
+                                              meta_tags.get('description', '')))
+    image = meta_tags.get('twitter:image', meta_tags.get('og:image', ''))
+    domain = urlparse(url).netloc if url else ''
+
+    # Better fallback for missing description
+    if not description:
+        description = "Shared from " + (domain or 'this website')
+
+    return TWITTER_TEMPLATE(
+        # Determine card layout
+        image_height="200px" if card_type == 'summary_large_image' else "120px",
+        image=_image_html(image, '<div>No Twitter image</div>'),
+        title=_escape(truncate_text(title, 70)),
+        description=_escape(truncate_text(description, 200)),
+        domain=_escape(domain or 'example.com')
+    )
+
+
+def linkedin_preview_html(meta_tags, url):
+    """
+    Return the HTML of a LinkedIn sharing preview
+    """
+    title = meta_tags.get('og:title', meta_tags.get('title', 'Untitled Page'))
+    description = meta_tags.get('og:description', meta_tags.get('description', ''))
+    image = meta_tags.get('og:image', '')
+    site_name = meta_tags.get('og:site_name', urlparse(url).netloc if url else 'Website')
+
+    # Better fallback for missing description
+    if not description:
+        description = "Visit this page to learn more about what we have to offer."
+
+    return LINKEDIN_TEMPLATE(
+        image=_image_html(image, '<div>No Open Graph image</div>'),
+        title=_escape(truncate_text(title, 200)),
+        description=_escape(truncate_text(description, 300)),
+        site_name=_escape(site_name)
+    )
+
+
+# Platform name -> function returning its preview card HTML
+PREVIEW_BUILDERS = {
+    'google': google_preview_html,
+    'facebook': facebook_preview_html,
+    'twitter': twitter_preview_html,
+    'linkedin': linkedin_preview_html,
+}
+
+
+def build_previews(meta_tags, url, platforms=None):
+    """
+    Return {platform: preview HTML} for every platform, or only the ones named
+    """
+    return {
+        platform: PREVIEW_BUILDERS[platform](meta_tags, url)
+        for platform in (platforms or PREVIEW_BUILDERS)
+    }
+
+
+class PreviewGenerator:
+    """
+    Streamlit renderers for the preview HTML built by the functions above
+
+    Each render method accepts previously built html so callers can cache it.
+    """
+    def render_google_preview(self, meta_tags, url, html=None):
+        """
+        Render Google search result preview
+        """
+        import streamlit as st  # Imported here so building previews does not load Streamlit
+
+        st.markdown(html or google_preview_html(meta_tags, url), unsafe_allow_html=True)
+
+        # Show character counts with responsive design
+        st.markdown(google_lengths_html(meta_tags), unsafe_allow_html=True)
+
+    def render_facebook_preview(self, meta_tags, url, html=None):
+        """
+        Render Facebook sharing preview
+        """
+        import streamlit as st
+
+        st.markdown(html or facebook_preview_html(meta_tags, url), unsafe_allow_html=True)
+
+        # Show recommendations
+        if not meta_tags.get('og:image', ''):
+            st.warning("⚠️ No og:image found. Facebook posts with images get 2.3x more engagement!")
+        if not meta_tags.get('og:title'):
+            st.info("💡 Consider adding og:title for better Facebook sharing")
+
+    def render_twitter_preview(self, meta_tags, url, html=None):
+        """
+        Render Twitter card preview
+        """
+        import streamlit as st
+
+        st.markdown(html or twitter_preview_html(meta_tags, url), unsafe_allow_html=True)
+
+        # Show card type info
+        card_type = meta_tags.get('twitter:card', 'summary')
+        st.info(f"🐦 Card type: {card_type}")
+
+        if card_type not in ['summary', 'summary_large_image']:
+            st.warning("⚠️ Uncommon card type detected. Consider using 'summary' or 'summary_large_image'")
+
+    def render_linkedin_preview(self, meta_tags, url, html=None):
+        """
+        Render LinkedIn sharing preview
+        """
+        import streamlit as st
+
+        st.markdown(html or linkedin_preview_html(meta_tags, url), unsafe_allow_html=True)
+
         # LinkedIn recommendations
-        if not image:
+        if not meta_tags.get('og:image', ''):
             st.warning("⚠️ LinkedIn posts with images receive 2x more comments and shares!")
-        
+
         st.info("💡 LinkedIn uses Open Graph tags. Optimize og:title, og:description, and og:image for best results.")
-    
+
     def _truncate_text(self, text, max_length):
-        """
-        Truncate text with ellipsis if it exceeds max_length, breaking at word boundaries when possible
-        """
-        if len(text) <= max_length:
-            return text
-        
-        # Try to break at word boundary
-        truncated = text[:max_length-3]
-        last_space = truncated.rfind(' ')
-        
-        # If we found a space and it's not too close to the beginning, break there
-        if last_space > max_length * 0.7:
-            return truncated[:last_space] + "..."
-        else:
-            return truncated + "..."
+        return truncate_text(text, max_length)
@@ -0,0 +1,229 @@
+from itertools import count
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+# Environment variables read by AnalysisProfiler.from_environ, so profiling
+# can be switched on for a deployed process by restarting it
+ENV_DIR = 'SEO_ANALYZER_PROFILE_DIR'
+ENV_SAMPLE_EVERY = 'SEO_ANALYZER_PROFILE_EVERY'
+ENV_SLOW_MS = 'SEO_ANALYZER_PROFILE_SLOW_MS'
+ENV_CPU = 'SEO_ANALYZER_PROFILE_CPU'
+ENV_MEMORY = 'SEO_ANALYZER_PROFILE_MEMORY'
+ENV_MAX_CAPTURES = 'SEO_ANALYZER_PROFILE_MAX_CAPTURES'
+
+INDEX_FILE = 'captures.jsonl'
+
+
+def _url_tag(url):
+    """
+    Return a short, filesystem-safe tag for a URL: a readable slug plus a hash that keeps tags unique
+    """
+    slug = re.sub(r'[^A-Za-z0-9]+', '-', re.sub(r'^https?://', '', url)).strip('-')[:60]
+    digest = hashlib.sha1(url.encode('utf-8')).hexdigest()[:8]
+    return f"{slug}-{digest}" if slug else digest
+
+
+def _flag(value):
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+class AnalysisProfiler:
+    """
+    Opt-in cProfile/tracemalloc capture around SEOAnalyzer.analyze_website
+
+    A capture is taken for every sample_every-th call, and for any call
+    slower than slow_threshold seconds. A slow call was not profiled while it
+    ran, so its fetched HTML is parsed again under the profilers; that
+    reproduces parser blow-ups without fetching the page twice. Each capture
+    writes <tag>.pstats (cpu) and/or <tag>.allocations.txt (memory: the peak
+    traced memory and the largest allocation sites still alive when the call
+    returned) to out_dir, where the tag holds a timestamp, the reason and the
+    URL, and appends a line to captures.jsonl with the full URL and timings.
+
+    Only one capture runs at a time; calls that would start another while one
+    is running are analyzed unprofiled. tracemalloc traces the whole process,
+    so allocations made by other threads during a capture are included.
+
+    SEOAnalyzer installs the profiler by shadowing its methods at
+    construction, so analyzers without one run the plain methods untouched.
+    """
+    def __init__(self, out_dir, cpu=True, memory=False, sample_every=0, slow_threshold=None,
+                 top_allocations=25, traceback_frames=10, max_captures=None):
+        if not (cpu or memory):
+            raise ValueError("Enable cpu and/or memory profiling")
+        self.out_dir = out_dir
+        self.cpu = cpu
+        self.memory = memory
+        self.sample_every = sample_every
+        self.slow_threshold = slow_threshold
+        self.top_allocations = top_allocations
+        self.traceback_frames = traceback_frames
+        self.max_captures = max_captures
+
+        self.captures = 0
+        self._calls = count(1)
+        self._capture_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        # Per thread: whether analyze_website is running, and the content of
+        # the page it parsed, kept for slow re-parses
+        self._local = threading.local()
+        os.makedirs(out_dir, exist_ok=True)
+
+    @classmethod
+    def from_environ(cls, environ=None):
+        """
+        Build a profiler from SEO_ANALYZER_PROFILE_* variables, or return None when SEO_ANALYZER_PROFILE_DIR is unset
+        """
+        environ = os.environ if environ is None else environ
+        out_dir = environ.get(ENV_DIR)
+        if not out_dir:
+            return None
+        slow_ms = environ.get(ENV_SLOW_MS)
+        max_captures = environ.get(ENV_MAX_CAPTURES)
+        return cls(
+            out_dir,
+            cpu=_flag(environ.get(ENV_CPU, '1')),
+            memory=_flag(environ.get(ENV_MEMORY, '0')),
+            sample_every=int(environ.get(ENV_SAMPLE_EVERY, '0')),
+            slow_threshold=float(slow_ms) / 1000 if slow_ms else None,
+            max_captures=int(max_captures) if max_captures else None
+        )
+
+    def install(self, analyzer):
+        """
+        Shadow analyzer.analyze_website (and _parse_page, for slow captures) with profiling wrappers
+        """
+        analyze = analyzer.analyze_website
+        parse_page = analyzer._parse_page
+
+        def analyze_website(url):
+            return self._analyze(analyze, parse_page, url)
+
+        analyzer.analyze_website = analyze_website
+        if self.slow_threshold is not None:
+            def _parse_page(content):
+                self._local.content = content
+                try:
+                    return parse_page(content)
+                finally:
+                    # Kept only for an analyze_website call on this thread,
+                    # which clears it when done; parses outside one (the async
+                    # path's executor threads) must not pin their last page
+                    if not getattr(self._local, 'analyzing', False):
+                        self._local.content = None
+
+            analyzer._parse_page = _parse_page
+        return analyzer
+
+    def _analyze(self, analyze, parse_page, url):
+        if self.sample_every and next(self._calls) % self.sample_every == 0:
+            if self._start_capture():
+                self._local.analyzing = True
+                try:
+                    return self._capture(url, 'sampled', analyze, url)
+                finally:
+                    self._local.analyzing = False
+                    self._local.content = None
+                    self._capture_lock.release()
+
+        self._local.content = None
+        self._local.analyzing = True
+        start = time.perf_counter()
+        try:
+            return analyze(url)
+        finally:
+            elapsed = time.perf_counter() - start
+            content = self._local.content
+            self._local.analyzing = False
+            self._local.content = None
+            if (self.slow_threshold is not None and elapsed >= self.slow_threshold
+                    and content is not None and self._start_capture()):
+                try:
+                    self._capture(url, 'slow', parse_page, content, elapsed=elapsed)
+                finally:
+                    self._capture_lock.release()
+
+    def _start_capture(self):
+        if self.max_captures is not None and self.captures >= self.max_captures:
+            return False
+        return self._capture_lock.acquire(blocking=False)
+
+    def _capture(self, url, reason, function, argument, elapsed=None):
+        """
+        Run function(argument) under the enabled profilers and save what they recorded
+        """
+        self.captures += 1
+        tag = f"{time.strftime('%Y%m%d-%H%M%S')}-{self.captures:04d}-{reason}-{_url_tag(url)}"
+        profile = tracing = None
+
+        if self.memory:
+            import tracemalloc
+
+            # Leave tracing on afterwards if someone else had already started it
+            tracing = tracemalloc.is_tracing()
+            if not tracing:
+                tracemalloc.start(self.traceback_frames)
+            tracemalloc.reset_peak()
+        if self.cpu:
+            import cProfile
+
+            profile = cProfile.Profile()
+            profile.enable()
+
+        capture_start = time.perf_counter()
+        try:
+            return function(argument)
+        finally:
+            capture_time = time.perf_counter() - capture_start
+            if profile is not None:
+                profile.disable()
+            files = []
+            if profile is not None:
+                path = os.path.join(self.out_dir, f"{tag}.pstats")
+                profile.dump_stats(path)
+                files.append(os.path.basename(path))
+            peak = None
+            if self.memory:
+                snapshot = tracemalloc.take_snapshot()
+                peak = tracemalloc.get_traced_memory()[1]
+                if not tracing:
+                    tracemalloc.stop()
+                path = os.path.join(self.out_dir, f"{tag}.allocations.txt")
+                self._write_allocations(path, url, reason, snapshot, peak)
+                files.append(os.path.basename(path))
+            self._append_index({
+                "url": url,
+                "reason": reason,
+                "time": time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+                # For slow captures: how long the original call took
+                "analysis_seconds": elapsed if elapsed is not None else capture_time,
+                "captured_seconds": capture_time,
+                "peak_bytes": peak,
+                "files": files,
+            })
+
+    def _write_allocations(self, path, url, reason, snapshot, peak):
+        import tracemalloc
+
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ))
+        statistics = snapshot.statistics('traceback')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(f"# url: {url}\n# reason: {reason}\n# peak traced memory: {peak:,} bytes\n")
+            file.write(f"# top {self.top_allocations} allocation sites by size\n\n")
+            for index, statistic in enumerate(statistics[:self.top_allocations], 1):
+                file.write(f"#{index}: {statistic.size / 1024:.1f} KiB in {statistic.count} blocks\n")
+                for line in statistic.traceback.format():
+                    file.write(f"    {line}\n")
+                file.write('\n')
+
+    def _append_index(self, record):
+        with self._index_lock:
+            with open(os.path.join(self.out_dir, INDEX_FILE), 'a', encoding='utf-8') as file:
+                file.write(json.dumps(record) + '\n')
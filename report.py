@@ -0,0 +1,356 @@
+from html import escape
+import hashlib
+import json
+import os
+
+from preview_generators import build_previews, google_lengths_html
+from results import AnalysisResult, ValidationResult
+from seo_rules import CATEGORIES
+
+# Bump when the report markup changes so incremental runs rewrite every page
+REPORT_VERSION = 1
+
+HASH_PREFIX = '<!-- report-hash: '
+
+STYLESHEET = """
+body { font-family: -apple-system, "Segoe UI", Roboto, sans-serif; margin: 2rem auto; max-width: 1100px; color: #222; padding: 0 1rem; }
+h1 { font-size: 1.6rem; } h2 { font-size: 1.2rem; margin-top: 2rem; }
+table { border-collapse: collapse; width: 100%; font-size: 0.9rem; }
+th, td { border-bottom: 1px solid #e0e0e0; padding: 6px 8px; text-align: left; vertical-align: top; }
+th.sortable { cursor: pointer; user-select: none; background: #f8f9fa; }
+th.sortable:after { content: " \\2195"; color: #aaa; }
+td.num, th.num { text-align: right; }
+.good { color: #28a745; } .fair { color: #d39e00; } .poor { color: #dc3545; }
+.nav { margin: 1rem 0; display: flex; gap: 1rem; flex-wrap: wrap; }
+.cards { display: grid; grid-template-columns: repeat(auto-fit, minmax(220px, 1fr)); gap: 1rem; }
+.card { border: 1px solid #e0e0e0; border-radius: 8px; padding: 1rem; }
+.previews { display: grid; grid-template-columns: repeat(auto-fit, minmax(420px, 1fr)); gap: 1.5rem; }
+.error { color: #dc3545; }
+"""
+
+# Click a header to sort that table's rows; numeric columns sort numerically
+SORT_SCRIPT = """
+document.querySelectorAll('table.sortable').forEach(function (table) {
+  table.querySelectorAll('th.sortable').forEach(function (th, column) {
+    th.addEventListener('click', function () {
+      var body = table.tBodies[0];
+      var rows = Array.prototype.slice.call(body.rows);
+      var descending = th.dataset.order !== 'desc';
+      th.dataset.order = descending ? 'desc' : 'asc';
+      rows.sort(function (a, b) {
+        var x = a.cells[column].dataset.value || a.cells[column].textContent;
+        var y = b.cells[column].dataset.value || b.cells[column].textContent;
+        var result = (isNaN(x) || isNaN(y)) ? x.localeCompare(y) : x - y;
+        return descending ? -result : result;
+      });
+      rows.forEach(function (row) { body.appendChild(row); });
+    });
+  });
+});
+"""
+
+PAGE_TEMPLATE = """{hash_line}<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<link rel="stylesheet" href="{root}assets/report.css">
+</head>
+<body>
+{body}
+<script src="{root}assets/report.js"></script>
+</body>
+</html>
+""".format
+
+
+def detail_page_name(url):
+    """
+    Relative path of a URL's detail page, stable across runs
+    """
+    return f"pages/{hashlib.sha1(url.encode('utf-8')).hexdigest()}.html"
+
+
+def _score_class(score):
+    if score is None:
+        return ''
+    return 'good' if score >= 80 else 'fair' if score >= 60 else 'poor'
+
+
+def _score_cell(score):
+    if score is None:
+        return '<td class="num" data-value="-1">-</td>'
+    return f'<td class="num {_score_class(score)}">{score}</td>'
+
+
+class ReportWriter:
+    """
+    Stream batch results into a static, offline HTML audit report
+
+    Each add() writes the page's detail file straight away and keeps only a
+    small summary row until a full index page of page_size rows can be
+    written, so memory stays flat however large the site is. Aggregates for
+    the overview (score buckets, issue counts) are running totals.
+
+    Every file starts with a hash of what it was generated from; with
+    incremental set, files whose hash has not changed are left untouched, so
+    re-running a report over fresh results only rewrites what changed.
+    """
+    def __init__(self, out_dir, page_size=100, incremental=True, title='SEO Audit Report'):
+        self.out_dir = out_dir
+        self.page_size = page_size
+        self.incremental = incremental
+        self.title = title
+        self.stats = {"pages": 0, "written": 0, "unchanged": 0}
+
+        self._rows = []
+        self._index_pages = 0
+        self._score_total = 0
+        self._scored = 0
+        self._failed = 0
+        self._buckets = {'good': 0, 'fair': 0, 'poor': 0}
+        self._issue_counts = {}
+        self._closed = False
+
+        os.makedirs(os.path.join(out_dir, 'pages'), exist_ok=True)
+        os.makedirs(os.path.join(out_dir, 'assets'), exist_ok=True)
+        self._write_file('assets/report.css', STYLESHEET, content_hash=None)
+        self._write_file('assets/report.js', SORT_SCRIPT, content_hash=None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, url, result, validation=None):
+        """
+        Add one page's analysis result and validate_seo output to the report
+        """
+        if isinstance(result, AnalysisResult):
+            if validation is None:
+                validation = result.validation
+            result = result.to_dict()
+        if isinstance(validation, ValidationResult):
+            validation = validation.to_dict()
+
+        detail = detail_page_name(url)
+        self._write_page(detail, lambda: self._detail_body(url, result, validation),
+                         title=url, root='../', source=(url, _stable_result(result), validation))
+
+        score = validation["score"] if validation else None
+        self._count(result, validation)
+        self._rows.append((
+            url,
+            detail,
+            result.get("status_code"),
+            score,
+            [validation["category_scores"][key]["score"] if validation else None for key, _, _ in CATEGORIES],
+            len(validation["issues"]) if validation else None,
+            result.get("error")
+        ))
+
+        # Written once the next page's first row arrives, so it knows a next page exists
+        if len(self._rows) > self.page_size:
+            self._flush_index_page(self._rows[:self.page_size], has_next=True)
+            self._rows = self._rows[self.page_size:]
+
+    def add_all(self, rows):
+        """
+        Add every (url, result, validation) tuple from an iterable
+        """
+        for url, result, validation in rows:
+            self.add(url, result, validation)
+        return self.stats
+
+    def close(self):
+        """
+        Write the last index page and the overview page
+        """
+        if self._closed:
+            return self.stats
+        self._closed = True
+        if self._rows or not self._index_pages:
+            self._flush_index_page(self._rows, has_next=False)
+            self._rows = []
+        self._write_page('index.html', self._overview_body, title=self.title, root='',
+                         source=self._overview_source())
+        return self.stats
+
+    def _count(self, result, validation):
+        self.stats["pages"] += 1
+        if validation is None:
+            self._failed += 1
+            return
+        score = validation["score"]
+        self._score_total += score
+        self._scored += 1
+        self._buckets[_score_class(score)] += 1
+        for code in validation.get("issue_codes", ()):
+            self._issue_counts[code] = self._issue_counts.get(code, 0) + 1
+
+    def _flush_index_page(self, rows, has_next):
+        self._index_pages += 1
+        number = self._index_pages
+        name = f"index-{number}.html"
+
+        nav = ['<div class="nav"><a href="index.html">Overview</a>']
+        if number > 1:
+            nav.append(f'<a href="index-{number - 1}.html">&larr; Previous</a>')
+        nav.append(f'<span>Page {number}</span>')
+        if has_next:
+            nav.append(f'<a href="index-{number + 1}.html">Next &rarr;</a>')
+        nav.append('</div>')
+        nav = ''.join(nav)
+
+        header = ''.join(
+            f'<th class="sortable num">{escape(name)}</th>' for _, name, _ in CATEGORIES
+        )
+        body = [
+            f'<h1>{escape(self.title)}</h1>', nav,
+            '<table class="sortable"><thead><tr>'
+            '<th class="sortable">URL</th><th class="sortable num">Status</th><th class="sortable num">Score</th>'
+            f'{header}<th class="sortable num">Issues</th></tr></thead><tbody>'
+        ]
+        for url, detail, status_code, score, category_scores, issue_count, error in rows:
+            link = f'<a href="{escape(detail)}">{escape(url)}</a>'
+            if error:
+                link += f' <span class="error">{escape(error[:120])}</span>'
+            body.append(
+                f'<tr><td>{link}</td><td class="num">{status_code or "-"}</td>{_score_cell(score)}'
+                + ''.join(_score_cell(category_score) for category_score in category_scores)
+                + f'<td class="num">{issue_count if issue_count is not None else "-"}</td></tr>'
+            )
+        body.append('</tbody></table>')
+        body.append(nav)
+
+        self._write_page(name, lambda: '\n'.join(body), title=f"{self.title} - page {number}", root='',
+                         source=(number, has_next, rows))
+
+    def _detail_body(self, url, result, validation):
+        body = [
+            '<div class="nav"><a href="../index.html">Overview</a></div>',
+            f'<h1>{escape(url)}</h1>',
+            '<table>',
+            f'<tr><th>Final URL</th><td>{escape(result.get("final_url") or "-")}</td></tr>',
+            f'<tr><th>Status</th><td>{result.get("status_code") or "-"}</td></tr>',
+        ]
+        if validation is not None:
+            score = validation["score"]
+            body.append(f'<tr><th>Overall score</th><td class="{_score_class(score)}">{score}/100</td></tr>')
+        body.append('</table>')
+
+        if not result["success"]:
+            body.append(f'<p class="error">{escape(result.get("error") or "Analysis failed")}</p>')
+            return '\n'.join(body)
+
+        meta_tags = result["meta_tags"]
+        if validation is not None:
+            body.append('<h2>Category scores</h2><div class="cards">')
+            for category in validation["category_scores"].values():
+                score = category["score"]
+                body.append(
+                    f'<div class="card"><strong>{escape(category["name"])}</strong>'
+                    f'<div class="{_score_class(score)}" style="font-size: 1.5rem;">{score}/100</div>'
+                    f'<div>{escape(category["description"])}</div></div>'
+                )
+            body.append('</div>')
+            for heading, items in (('Issues', validation["issues"]), ('Recommendations', validation["recommendations"])):
+                if items:
+                    body.append(f'<h2>{heading}</h2><ul>')
+                    body.extend(f'<li>{escape(item)}</li>' for item in items)
+                    body.append('</ul>')
+
+        body.append('<h2>Meta tags</h2><table>')
+        for key, value in meta_tags.items():
+            if isinstance(value, list):
+                value = ' | '.join(value)
+            body.append(f'<tr><th>{escape(key)}</th><td>{escape(str(value))}</td></tr>')
+        body.append('</table>')
+
+        previews = build_previews(meta_tags, result.get("final_url") or url)
+        body.append('<h2>Previews</h2><div class="previews">')
+        for platform, html in previews.items():
+            body.append(f'<div><h3>{platform.capitalize()}</h3>{html}')
+            if platform == 'google':
+                body.append(google_lengths_html(meta_tags))
+            body.append('</div>')
+        body.append('</div>')
+        return '\n'.join(body)
+
+    def _overview_body(self):
+        average = self._score_total / self._scored if self._scored else 0
+        body = [
+            f'<h1>{escape(self.title)}</h1>',
+            '<div class="cards">',
+            f'<div class="card"><strong>Pages</strong><div style="font-size: 1.5rem;">{self.stats["pages"]}</div></div>',
+            f'<div class="card"><strong>Average score</strong>'
+            f'<div class="{_score_class(round(average))}" style="font-size: 1.5rem;">{average:.1f}</div></div>',
+            f'<div class="card"><strong>Good / fair / poor</strong><div style="font-size: 1.5rem;">'
+            f'{self._buckets["good"]} / {self._buckets["fair"]} / {self._buckets["poor"]}</div></div>',
+            f'<div class="card"><strong>Failed to load</strong><div style="font-size: 1.5rem;">{self._failed}</div></div>',
+            '</div>',
+            '<h2>Pages</h2><div class="nav">',
+        ]
+        body.extend(f'<a href="index-{number}.html">Page {number}</a>' for number in range(1, self._index_pages + 1))
+        body.append('</div>')
+
+        if self._issue_counts:
+            body.append('<h2>Most common findings</h2><table class="sortable"><thead><tr>'
+                        '<th class="sortable">Rule</th><th class="sortable num">Pages</th></tr></thead><tbody>')
+            for code, count in sorted(self._issue_counts.items(), key=lambda item: item[1], reverse=True):
+                body.append(f'<tr><td>{escape(code)}</td><td class="num">{count}</td></tr>')
+            body.append('</tbody></table>')
+        return '\n'.join(body)
+
+    def _overview_source(self):
+        return (self.stats["pages"], self._score_total, self._failed, self._buckets, self._index_pages,
+                sorted(self._issue_counts.items()))
+
+    def _write_page(self, name, render_body, title, root, source):
+        """
+        Write a page unless its source hash matches the existing file; render_body is only called when writing
+        """
+        content_hash = hashlib.sha1(
+            json.dumps([REPORT_VERSION, self.title, source], sort_keys=True, default=str).encode('utf-8')
+        ).hexdigest()
+        if self.incremental and self._existing_hash(name) == content_hash:
+            self.stats["unchanged"] += 1
+            return
+        html = PAGE_TEMPLATE(hash_line=f"{HASH_PREFIX}{content_hash} -->\n", title=escape(title), root=root, body=render_body())
+        self._write_file(name, html, content_hash)
+
+    def _write_file(self, name, content, content_hash):
+        path = os.path.join(self.out_dir, name)
+        # Write then rename so an interrupted run never leaves a half-written page
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        os.replace(temp_path, path)
+        if content_hash is not None:
+            self.stats["written"] += 1
+
+    def _existing_hash(self, name):
+        try:
+            with open(os.path.join(self.out_dir, name), encoding='utf-8') as file:
+                first_line = file.readline()
+        except OSError:
+            return None
+        if first_line.startswith(HASH_PREFIX):
+            return first_line[len(HASH_PREFIX):].split(' ', 1)[0]
+        return None
+
+
+def _stable_result(result):
+    # Timings differ on every run even when the page has not changed
+    return {key: value for key, value in result.items() if key not in ("parse_stats", "timings")}
+
+
+def write_report(rows, out_dir, page_size=100, incremental=True, title='SEO Audit Report'):
+    """
+    Write a report for an iterable of (url, result, validation) tuples, returning write stats
+    """
+    with ReportWriter(out_dir, page_size=page_size, incremental=incremental, title=title) as writer:
+        writer.add_all(rows)
+    return writer.stats
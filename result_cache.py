@@ -0,0 +1,124 @@
+from collections import OrderedDict
+import copy
+import threading
+import time
+
+
+class _CacheEntry:
+    __slots__ = ('result', 'etag', 'last_modified', 'stored_at', 'size')
+
+    def __init__(self, result, etag, last_modified, size):
+        self.result = result
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = time.monotonic()
+        self.size = size
+
+
+class ResultCache:
+    """
+    In-process TTL + LRU cache of analysis results keyed by normalized URL
+
+    Entries older than ttl seconds are stale: SEOAnalyzer revalidates them
+    with If-None-Match / If-Modified-Since and reuses the stored result on a
+    304. The cache is bounded by entry count and by an estimate of the bytes
+    held, evicting the least recently used entries first.
+    """
+    def __init__(self, max_entries=1000, max_bytes=16 * 1024 * 1024, ttl=300):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "revalidations": 0, "not_modified": 0, "evictions": 0}
+
+    def lookup(self, key):
+        """
+        Return (result, conditional_headers) for a key
+
+        result is a copy of the cached result when the entry is fresh and None
+        otherwise. conditional_headers is non-empty when a stale entry can be
+        revalidated instead of refetched.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None, {}
+
+            self._entries.move_to_end(key)
+            if time.monotonic() - entry.stored_at < self.ttl:
+                self._stats["hits"] += 1
+                return copy.deepcopy(entry.result), {}
+
+            headers = {}
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+            if headers:
+                self._stats["revalidations"] += 1
+            else:
+                # Nothing to revalidate with, treat it as a plain miss
+                self._stats["misses"] += 1
+            return None, headers
+
+    def mark_not_modified(self, key):
+        """
+        Renew a stale entry after a 304 response and return a copy of its result
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.stored_at = time.monotonic()
+            self._entries.move_to_end(key)
+            self._stats["not_modified"] += 1
+            return copy.deepcopy(entry.result)
+
+    def store(self, key, result, response_headers=None):
+        """
+        Cache a successful result along with the validators from its response headers
+        """
+        response_headers = response_headers or {}
+        size = _estimate_size(result)
+        if size > self.max_bytes:
+            return
+
+        entry = _CacheEntry(
+            copy.deepcopy(result),
+            response_headers.get('ETag'),
+            response_headers.get('Last-Modified'),
+            size
+        )
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = entry
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._stats["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """
+        Return hit/miss/revalidation counters and the current size of the cache
+        """
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries), bytes=self._bytes)
+
+
+def _estimate_size(result):
+    """
+    Rough byte size of a result; its repr is dominated by the extracted tag strings
+    """
+    return len(repr(result))
@@ -0,0 +1,314 @@
+from dataclasses import dataclass
+import sys
+
+from seo_rules import CATEGORIES
+
+# Meta tag key -> MetaTags attribute for the tags with a fixed slot
+KNOWN_TAGS = {
+    'title': 'title',
+    'description': 'description',
+    'keywords': 'keywords',
+    'author': 'author',
+    'robots': 'robots',
+    'viewport': 'viewport',
+    'charset': 'charset',
+    'canonical': 'canonical',
+    'h1_tags': 'h1_tags',
+    'og:title': 'og_title',
+    'og:description': 'og_description',
+    'og:image': 'og_image',
+    'og:url': 'og_url',
+    'og:type': 'og_type',
+    'og:site_name': 'og_site_name',
+    'twitter:card': 'twitter_card',
+    'twitter:title': 'twitter_title',
+    'twitter:description': 'twitter_description',
+    'twitter:image': 'twitter_image',
+    'twitter:site': 'twitter_site',
+}
+
+# Tags whose values repeat across most pages of a site, so one shared copy is kept
+INTERNED_TAGS = frozenset([
+    'robots', 'viewport', 'charset', 'author', 'og:type', 'og:site_name', 'twitter:card', 'twitter:site'
+])
+
+# Pages of one site mostly produce the same tag keys in the same order;
+# the order tuple is shared between them, up to this many distinct orders
+MAX_INTERNED_KEY_ORDERS = 10000
+_key_orders = {}
+_categories = {}
+
+
+def _intern_key_order(keys):
+    shared = _key_orders.get(keys)
+    if shared is not None:
+        return shared
+    if len(_key_orders) < MAX_INTERNED_KEY_ORDERS:
+        keys = tuple(sys.intern(key) for key in keys)
+        _key_orders[keys] = keys
+    return keys
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(frozen=True, slots=True)
+class MetaTags:
+    """
+    Extracted meta tags with a slot per well-known tag and an overflow dict for the rest
+
+    Supports get(), [] and iteration like the meta_tags dict it replaces,
+    so validate_seo and the preview renderers accept it directly. keys
+    records the original tag order so to_dict() round-trips exactly.
+    """
+    title: object = None
+    description: object = None
+    keywords: object = None
+    author: object = None
+    robots: object = None
+    viewport: object = None
+    charset: object = None
+    canonical: object = None
+    h1_tags: object = None
+    og_title: object = None
+    og_description: object = None
+    og_image: object = None
+    og_url: object = None
+    og_type: object = None
+    og_site_name: object = None
+    twitter_card: object = None
+    twitter_title: object = None
+    twitter_description: object = None
+    twitter_image: object = None
+    twitter_site: object = None
+    extra: object = None
+    keys: tuple = ()
+
+    @classmethod
+    def from_dict(cls, meta_tags):
+        if not meta_tags:
+            return EMPTY_META_TAGS
+
+        known = {}
+        extra = None
+        for key, value in meta_tags.items():
+            attribute = KNOWN_TAGS.get(key)
+            if attribute is None:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+            elif key == 'h1_tags' and value is not None:
+                known[attribute] = tuple(value)
+            elif key in INTERNED_TAGS:
+                known[attribute] = _intern(value)
+            else:
+                known[attribute] = value
+        return cls(extra=extra, keys=_intern_key_order(tuple(meta_tags)), **known)
+
+    def get(self, key, default=None):
+        value = self._value(key)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        if key not in self.keys:
+            raise KeyError(key)
+        return self._value(key)
+
+    def __contains__(self, key):
+        return key in self.keys
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def items(self):
+        for key in self.keys:
+            yield key, self._value(key)
+
+    def to_dict(self):
+        meta_tags = {}
+        for key in self.keys:
+            value = self._value(key)
+            meta_tags[key] = list(value) if key == 'h1_tags' and value is not None else value
+        return meta_tags
+
+    def _value(self, key):
+        attribute = KNOWN_TAGS.get(key)
+        if attribute is not None:
+            return getattr(self, attribute)
+        if self.extra is not None:
+            return self.extra.get(key)
+        return None
+
+
+EMPTY_META_TAGS = MetaTags()
+
+
+@dataclass(frozen=True, slots=True)
+class CategoryInfo:
+    """
+    Name and description of a score category; one shared instance per category
+    """
+    key: str
+    name: str
+    description: str
+
+
+def category_info(key, name, description):
+    """
+    Return the shared CategoryInfo for these values, creating it on first use
+    """
+    lookup = (key, name, description)
+    info = _categories.get(lookup)
+    if info is None:
+        info = _categories[lookup] = CategoryInfo(sys.intern(key), sys.intern(name), sys.intern(description))
+    return info
+
+
+for _category in CATEGORIES:
+    category_info(*_category)
+
+
+@dataclass(frozen=True, slots=True)
+class CategoryScore:
+    info: CategoryInfo
+    score: int
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationResult:
+    """
+    Compact form of a validate_seo result
+
+    Issue and recommendation strings are interned, so every page reporting
+    the same problem shares one copy of its text.
+    """
+    score: int
+    issues: tuple = ()
+    recommendations: tuple = ()
+    category_scores: tuple = ()
+    issue_codes: tuple = ()
+
+    @classmethod
+    def from_dict(cls, validation):
+        return cls(
+            score=validation["score"],
+            issues=tuple(sys.intern(issue) for issue in validation["issues"]),
+            recommendations=tuple(sys.intern(text) for text in validation["recommendations"]),
+            category_scores=tuple(
+                CategoryScore(category_info(key, category["name"], category["description"]), category["score"])
+                for key, category in validation["category_scores"].items()
+            ),
+            issue_codes=tuple(sys.intern(code) for code in validation.get("issue_codes", ()))
+        )
+
+    def category_score(self, key):
+        for category in self.category_scores:
+            if category.info.key == key:
+                return category.score
+        return None
+
+    def to_dict(self):
+        return {
+            "score": self.score,
+            "issues": list(self.issues),
+            "recommendations": list(self.recommendations),
+            "category_scores": {
+                category.info.key: {
+                    "score": category.score,
+                    "name": category.info.name,
+                    "description": category.info.description
+                }
+                for category in self.category_scores
+            },
+            "issue_codes": list(self.issue_codes)
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ParseStats:
+    parser: str
+    restricted: bool
+    parse_time: float
+    node_count: int
+
+    @classmethod
+    def from_dict(cls, parse_stats):
+        return cls(
+            sys.intern(parse_stats["parser"]),
+            parse_stats["restricted"],
+            parse_stats["parse_time"],
+            parse_stats["node_count"]
+        )
+
+    def to_dict(self):
+        return {
+            "parser": self.parser,
+            "restricted": self.restricted,
+            "parse_time": self.parse_time,
+            "node_count": self.node_count
+        }
+
+
+# Keys of an analyze_website result that AnalysisResult has a field for
+RESULT_FIELDS = ('success', 'final_url', 'status_code', 'meta_tags', 'bytes_read', 'parse_stats', 'error', 'links')
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisResult:
+    """
+    Compact, immutable form of an analyze_website result, optionally carrying its validation
+
+    to_dict() returns the analyze_website dict (without the validation,
+    which has its own to_dict()), so code written against the dicts keeps
+    working. Result keys without a field are kept in extra.
+    """
+    success: bool
+    final_url: object = None
+    status_code: object = None
+    meta_tags: MetaTags = EMPTY_META_TAGS
+    bytes_read: int = 0
+    parse_stats: object = None
+    error: object = None
+    links: object = None
+    validation: object = None
+    extra: object = None
+
+    @classmethod
+    def from_dict(cls, result, validation=None):
+        parse_stats = result.get("parse_stats")
+        links = result.get("links")
+        extra = {key: value for key, value in result.items() if key not in RESULT_FIELDS} or None
+        if isinstance(validation, dict):
+            validation = ValidationResult.from_dict(validation)
+        return cls(
+            success=result["success"],
+            final_url=result.get("final_url"),
+            status_code=result.get("status_code"),
+            meta_tags=MetaTags.from_dict(result.get("meta_tags")),
+            bytes_read=result.get("bytes_read", 0),
+            parse_stats=ParseStats.from_dict(parse_stats) if parse_stats is not None else None,
+            error=result.get("error"),
+            links=tuple(links) if links is not None else None,
+            validation=validation,
+            extra=extra
+        )
+
+    def to_dict(self):
+        result = {
+            "success": self.success,
+            "final_url": self.final_url,
+            "status_code": self.status_code,
+            "meta_tags": self.meta_tags.to_dict(),
+            "bytes_read": self.bytes_read,
+            "parse_stats": self.parse_stats.to_dict() if self.parse_stats is not None else None,
+            "error": self.error
+        }
+        if self.links is not None:
+            result["links"] = list(self.links)
+        if self.extra:
+            result.update(self.extra)
+        return result
@@ -1,64 +1,917 @@
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+from meta_parser import MetaTagParser, decode_html
+from page_store import page_to_result
+from profiling import AnalysisProfiler
+from seo_rules import DEFAULT_RULE_SET, RuleSet
+from timings import collect_timings, new_timings, record_stage
+from urllib.parse import urljoin, urlparse, urlunparse, parse_qsl, urlencode
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from collections import deque
+import asyncio
+import socket
+import threading
+import time
 import re
 import validators
 
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+
+def _import_aiohttp():
+    """
+    Import aiohttp on demand so the sync analyzer works without it
+    """
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise ImportError("The async analyzer requires aiohttp: pip install aiohttp") from e
+    return aiohttp
+
+
+# _extract_meta_tags only reads these elements, so the BeautifulSoup path
+# skips creating nodes for everything else
+META_TAG_STRAINER = SoupStrainer(['title', 'meta', 'link', 'h1'])
+META_TAG_AND_LINK_STRAINER = SoupStrainer(['title', 'meta', 'link', 'h1', 'a'])
+
+# Prefer the C-based lxml parser when it is installed
+DEFAULT_HTML_PARSER = 'lxml' if builder_registry.lookup('lxml') else 'html.parser'
+
+
+# Query parameters that only track campaigns and never change page content
+TRACKING_PARAMS = {'gclid', 'dclid', 'fbclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid', '_ga', '_gl'}
+TRACKING_PARAM_PREFIXES = ('utm_',)
+
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# How many URLs analyze_many holds back while their hosts are at per_host_limit
+HOST_QUEUE_LOOKAHEAD = 1000
+
+
+def is_html_content_type(content_type):
+    """
+    Return whether a Content-Type header value denotes an HTML document; a missing value counts as HTML
+    """
+    if not content_type:
+        return True
+    return content_type.split(';', 1)[0].strip().lower() in HTML_CONTENT_TYPES
+
+
+def normalize_url(url):
+    """
+    Normalize a URL so equivalent spellings share one cache or dedupe key
+
+    Lower-cases scheme and host, drops default ports, fragments, tracking
+    parameters and trailing slashes, and sorts the remaining query parameters.
+    """
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    parts = urlparse(url)
+    scheme = parts.scheme.lower()
+
+    host = (parts.hostname or '').lower()
+    if ':' in host:
+        host = f"[{host}]"
+    port = parts.port
+    if port is not None and (scheme, port) not in (('http', 80), ('https', 443)):
+        host = f"{host}:{port}"
+
+    path = parts.path.rstrip('/') or '/'
+
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    ]
+    query.sort()
+
+    return urlunparse((scheme, host, path, parts.params, urlencode(query), ''))
+
+
+class FetchConfig:
+    """
+    Request settings shared by every fetch path so sync and async fetches behave the same
+    """
+    def __init__(self, headers=None, timeout=10, allow_redirects=True, max_redirects=30,
+                 head_only=False, max_bytes=256 * 1024, head_h1_count=3, chunk_size=16 * 1024, html_only=False):
+        self.headers = dict(DEFAULT_HEADERS if headers is None else headers)
+        self.timeout = timeout
+        self.allow_redirects = allow_redirects
+        self.max_redirects = max_redirects
+
+        # Head-only mode streams the body and stops reading once </head> and
+        # head_h1_count closing </h1> tags were seen, or after max_bytes
+        self.head_only = head_only
+        self.max_bytes = max_bytes
+        self.head_h1_count = head_h1_count
+        self.chunk_size = chunk_size
+
+        # Optionally reject responses whose Content-Type is not HTML (PDFs,
+        # images, ...) before their body is downloaded. A missing header is
+        # allowed. SiteCrawler's default analyzer turns this on.
+        self.html_only = html_only
+
+
+class _HeadScanner:
+    """
+    Collect a streamed body until everything _extract_meta_tags reads has arrived
+    """
+    def __init__(self, max_bytes, h1_count):
+        self.max_bytes = max_bytes
+        self.h1_count = h1_count
+        self._buffer = bytearray()
+        self._tail = b''
+        self._head_closed = False
+        self._h1_closed = 0
+
+    def feed(self, chunk):
+        """
+        Add a chunk and return True once the rest of the body can be skipped
+        """
+        room = self.max_bytes - len(self._buffer)
+        if len(chunk) >= room:
+            self._buffer += chunk[:room]
+            return True
+        self._buffer += chunk
+
+        # Keep the last few bytes of the previous chunk so markers split
+        # across chunk boundaries are still found. '</h1' is only counted in
+        # the last 3 carried bytes plus the new chunk, so no occurrence is
+        # counted twice
+        lowered = chunk.lower()
+        if not self._head_closed and b'</head' in self._tail + lowered:
+            self._head_closed = True
+        self._h1_closed += (self._tail[-3:] + lowered).count(b'</h1')
+        self._tail = (self._tail + lowered)[-5:]
+
+        return self._head_closed and self._h1_closed >= self.h1_count
+
+    @property
+    def content(self):
+        return bytes(self._buffer)
+
+
+class _TimedConnectionMixin:
+    """
+    Resolve the host separately from connecting so both can be recorded as timing stages
+
+    urllib3 would resolve inside create_connection; resolving here first and
+    handing it one address at a time keeps its fallback across addresses
+    without a second lookup.
+    """
+    def _new_conn(self):
+        start = time.perf_counter()
+        host = self._dns_host
+        try:
+            addresses = socket.getaddrinfo(host.strip('[]'), self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+        resolved = time.perf_counter()
+        record_stage('dns', resolved - start)
+
+        # Like create_connection, move on to the next address after a refused
+        # or timed out attempt (NewConnectionError subclasses ConnectTimeoutError)
+        error = None
+        try:
+            for address in dict.fromkeys(sockaddr[0] for *_, sockaddr in addresses):
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except ConnectTimeoutError as e:
+                    error = e
+        finally:
+            self._dns_host = host
+            done = time.perf_counter()
+            record_stage('connect', done - resolved)
+            self._socket_time = done - start
+
+        # A timeout message names the address that was tried; report the host instead
+        if isinstance(error, NewConnectionError):
+            raise error
+        raise ConnectTimeoutError(
+            self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})"
+        ) from error
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    def connect(self):
+        # Everything connect() does beyond opening the socket is the TLS handshake
+        self._socket_time = 0.0
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            record_stage('tls', time.perf_counter() - start - self._socket_time)
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that reports every request it sends and every new socket its connections open
+    """
+    def __init__(self, on_request, on_new_connection, **kwargs):
+        # Must be set before HTTPAdapter.__init__, which builds the pool manager
+        self._on_request = on_request
+        self._on_new_connection = on_new_connection
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        on_new_connection = self._on_new_connection
+
+        # Count sockets, not connection objects: urllib3 reconnects a pooled
+        # connection the server closed through connect() on the same object
+        class CountingHTTPConnection(_TimedHTTPConnection):
+            def _new_conn(self):
+                sock = super()._new_conn()
+                on_new_connection()
+                return sock
+
+        class CountingHTTPSConnection(_TimedHTTPSConnection):
+            def _new_conn(self):
+                sock = super()._new_conn()
+                on_new_connection()
+                return sock
+
+        class CountingHTTPConnectionPool(HTTPConnectionPool):
+            ConnectionCls = CountingHTTPConnection
+
+        class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+            ConnectionCls = CountingHTTPSConnection
+
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': CountingHTTPConnectionPool,
+            'https': CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        self._on_request()
+        return super().send(request, **kwargs)
+
+
+class HostSlots:
+    """
+    Per-host concurrency limit enforced by a dispatcher instead of by blocking workers
+
+    add() says whether a URL may start now; URLs for hosts already at
+    per_host_limit are parked in a queue per host and handed out by
+    next_ready(), in order, as that host's fetches finish(). Not thread-safe:
+    only the dispatching thread calls it.
+    """
+    def __init__(self, per_host_limit, host_of):
+        self.per_host_limit = per_host_limit
+        self.host_of = host_of
+        self.parked = 0
+        self._active = {}
+        self._queues = {}
+        # Hosts with parked URLs and a free slot
+        self._ready = deque()
+
+    def add(self, url):
+        """
+        Return True if url may start now; otherwise park it until its host has a free slot
+        """
+        host = self.host_of(url)
+        active = self._active.get(host, 0)
+        if host not in self._queues and active < self.per_host_limit:
+            self._active[host] = active + 1
+            return True
+        self._queues.setdefault(host, deque()).append(url)
+        self.parked += 1
+        return False
+
+    def next_ready(self):
+        """
+        Return a parked URL whose host now has a free slot, counting it as started, or None
+        """
+        if not self._ready:
+            return None
+        host = self._ready.popleft()
+        queue = self._queues[host]
+        url = queue.popleft()
+        self.parked -= 1
+        active = self._active[host] = self._active.get(host, 0) + 1
+        if not queue:
+            del self._queues[host]
+        elif active < self.per_host_limit:
+            self._ready.append(host)
+        return url
+
+    def finish(self, url):
+        """
+        Free the slot a started URL held
+        """
+        host = self.host_of(url)
+        active = self._active[host] - 1
+        if active:
+            self._active[host] = active
+        else:
+            del self._active[host]
+        # A host below its limit with parked URLs is already queued as ready
+        if host in self._queues and active == self.per_host_limit - 1:
+            self._ready.append(host)
+
+
 class SEOAnalyzer:
-    def __init__(self):
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
+    # Meta tag extraction backends: 'soup' walks a BeautifulSoup tree,
+    # 'stream' uses the event-driven MetaTagParser and builds no tree
+    EXTRACTORS = ('soup', 'stream')
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, config=None, extractor='soup',
+                 html_parser=None, restrict_parse=True, cache=None, store=None, store_max_age=None,
+                 collect_links=False, scheduler=None, rules=None, metrics=None, profiler=None):
+        if extractor not in self.EXTRACTORS:
+            raise ValueError(f"Unknown extractor {extractor!r}, expected one of {', '.join(self.EXTRACTORS)}")
+        self.extractor = extractor
+
+        # BeautifulSoup settings for the 'soup' extractor. restrict_parse
+        # limits the tree to the tags _extract_meta_tags reads.
+        self.html_parser = html_parser or DEFAULT_HTML_PARSER
+        self.restrict_parse = restrict_parse
+
+        # Also return the absolute URLs of every <a href> as result["links"]
+        self.collect_links = collect_links
+
+        # Optional ResultCache consulted before every fetch
+        self.cache = cache
+
+        # Optional PageStore every fetched page is written to. Pages stored
+        # less than store_max_age seconds ago are served without a fetch.
+        self.store = store
+        self.store_max_age = store_max_age
+
+        # Optional PolitenessScheduler every network fetch waits on
+        self.scheduler = scheduler
+
+        # Optional metrics.AnalyzerMetrics updated on every analysis. When
+        # None, each instrumented call site costs a single None check.
+        self.metrics = metrics
+
+        # Optional profiling.AnalysisProfiler capturing cProfile/tracemalloc
+        # data for sampled and slow analyses. By default one is built from the
+        # SEO_ANALYZER_PROFILE_* environment variables if they are set; pass
+        # False to ignore them. It wraps the methods once here, so analyzers
+        # without one pay nothing per call.
+        if profiler is None:
+            profiler = AnalysisProfiler.from_environ()
+        self.profiler = profiler or None
+        if self.profiler is not None:
+            self.profiler.install(self)
+
+        # validate_seo rule table, compiled once; defaults to seo_rules.DEFAULT_RULES
+        self.rule_set = DEFAULT_RULE_SET if rules is None else RuleSet(rules)
+
+        # Headers, timeout and redirect policy shared by the sync and async fetch paths
+        self.config = config if config is not None else FetchConfig()
+        self.headers = self.config.headers
+
+        # Connection reuse counters, updated from the session's adapters
+        self._connection_stats_lock = threading.Lock()
+        self._connection_stats = {"requests": 0, "new_connections": 0}
+
+        # One long-lived session so repeat fetches of a host reuse pooled
+        # keep-alive connections instead of paying TCP/TLS setup every time.
+        # pool_connections is the number of hosts kept, pool_maxsize the
+        # connections kept per host; size it to the analyze_many worker count.
+        self.session = requests.Session()
+        adapter = _CountingHTTPAdapter(
+            on_request=self._record_request,
+            on_new_connection=self._record_new_connection,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.max_redirects = self.config.max_redirects
+
+        # robots.txt lookups go out with the same session, headers and timeout
+        if self.scheduler is not None:
+            self.scheduler.bind(self.session, self.headers, self.config.timeout)
+
+    def get_connection_stats(self):
+        """
+        Return how many requests were sent and how many of them reused a pooled connection
+        """
+        with self._connection_stats_lock:
+            requests_sent = self._connection_stats["requests"]
+            new_connections = self._connection_stats["new_connections"]
+        return {
+            "requests": requests_sent,
+            "new_connections": new_connections,
+            "reused_connections": max(0, requests_sent - new_connections),
         }
+
+    def _record_request(self):
+        with self._connection_stats_lock:
+            self._connection_stats["requests"] += 1
+
+    def _record_new_connection(self):
+        with self._connection_stats_lock:
+            self._connection_stats["new_connections"] += 1
     
     def analyze_website(self, url):
         """
         Analyze a website's SEO meta tags
+
+        Every result carries a "timings" dict with the seconds spent in each
+        stage (timings.STAGES), the total, bytes_downloaded and redirects.
+        dns/connect/tls stay 0 when a pooled connection was reused; validate
+        is filled in by validate_result.
+        """
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.in_flight.inc()
+        try:
+            with collect_timings() as timings:
+                start = time.perf_counter()
+                result = self._analyze_website(url, timings)
+                timings["total"] = time.perf_counter() - start
+        finally:
+            if metrics is not None:
+                metrics.in_flight.dec()
+        result["timings"] = timings
+        return result
+
+    def _analyze_website(self, url, timings):
+        result, page = self._fetch_page(url, timings)
+        if page is None:
+            return result
+
+        cache_key, final_url, status_code, response_headers, content = page
+        try:
+            result = self._success_result(final_url, status_code, content)
+            self._remember(cache_key, result, response_headers, content)
+            return result
+        except Exception as e:
+            self._count_error('analysis')
+            return self._error_result(f"Analysis error: {str(e)}")
+
+    def _fetch_page(self, url, timings, revalidate=True):
+        """
+        Fetch a page without parsing it, returning (result, page)
+
+        page is (cache_key, final_url, status_code, response_headers, content)
+        for a freshly downloaded page and None otherwise, in which case result
+        is the finished analysis: a cached or revalidated result, or an error.
+        revalidate=False fetches in full even when a stale entry could be revalidated.
         """
         try:
             # Ensure URL has protocol
             if not url.startswith(('http://', 'https://')):
                 url = 'https://' + url
+
+            cache_key, cached_result, conditional_headers = self._cache_lookup(url)
+            if cached_result is not None:
+                return cached_result, None
+            if not revalidate:
+                conditional_headers = {}
+
+            if self.scheduler is not None:
+                self.scheduler.acquire(url)
             
+            # Fetch the webpage. Streamed so the wait for headers and the body
+            # download can be timed apart.
+            metrics = self.metrics
+            if metrics is not None:
+                metrics.fetches.inc()
+            request_start = time.perf_counter()
+            response = self.session.get(
+                url,
+                headers={**self.headers, **conditional_headers},
+                timeout=self.config.timeout,
+                allow_redirects=self.config.allow_redirects,
+                stream=True
+            )
+            with response:
+                # Time to the final response's headers across redirects,
+                # minus the connection setup recorded by the connection classes
+                setup = timings["dns"] + timings["connect"] + timings["tls"]
+                timings["ttfb"] = max(0.0, time.perf_counter() - request_start - setup)
+                timings["redirects"] = len(response.history)
+
+                if response.status_code == 304:
+                    # A 304 has no body to parse; only the cached entry can answer it
+                    revalidated = self.cache.mark_not_modified(cache_key) if conditional_headers else None
+                    if revalidated is not None:
+                        if metrics is not None:
+                            metrics.cache_hits.inc(labels=('revalidated',))
+                        return revalidated, None
+                    if conditional_headers:
+                        # The entry was evicted while the request was in flight
+                        response.close()
+                        return self._fetch_page(url, timings, revalidate=False)
+                    return self._unexpected_not_modified_result(), None
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type')
+                if self.config.html_only and not is_html_content_type(content_type):
+                    return self._not_html_result(content_type), None
+
+                download_start = time.perf_counter()
+                if self.config.head_only:
+                    scanner = self._create_head_scanner()
+                    for chunk in response.iter_content(chunk_size=self.config.chunk_size):
+                        if scanner.feed(chunk):
+                            break
+                    content = scanner.content
+                else:
+                    content = response.content
+                timings["download"] = time.perf_counter() - download_start
+                if metrics is not None:
+                    metrics.fetch_latency.observe(time.perf_counter() - request_start)
+                # Bytes off the wire, before any gzip/deflate decoding
+                timings["bytes_downloaded"] = response.raw.tell()
+
+            return None, (cache_key, response.url, response.status_code, response.headers, content)
+
+        except requests.exceptions.RequestException as e:
+            self._count_error('network')
+            return self._error_result(f"Network error: {str(e)}"), None
+        except Exception as e:
+            self._count_error('analysis')
+            return self._error_result(f"Analysis error: {str(e)}"), None
+
+    async def analyze_website_async(self, url, session=None):
+        """
+        Analyze a website's SEO meta tags using an asyncio HTTP client
+
+        Pass an aiohttp.ClientSession to share connections between calls;
+        otherwise a short-lived one is created for this URL. Results carry
+        timings like analyze_website's, except that aiohttp does not expose
+        connection setup, so dns/connect/tls are 0 and included in ttfb.
+        """
+        if session is None:
+            async with self._create_async_session() as own_session:
+                return await self.analyze_website_async(url, session=own_session)
+
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.in_flight.inc()
+        try:
+            timings = new_timings()
+            start = time.perf_counter()
+            result = await self._analyze_website_async(url, session, timings)
+            timings["total"] = time.perf_counter() - start
+        finally:
+            if metrics is not None:
+                metrics.in_flight.dec()
+        result["timings"] = timings
+        return result
+
+    async def _analyze_website_async(self, url, session, timings, revalidate=True):
+        aiohttp = _import_aiohttp()
+
+        try:
+            # Ensure URL has protocol
+            if not url.startswith(('http://', 'https://')):
+                url = 'https://' + url
+
+            cache_key, cached_result, conditional_headers = self._cache_lookup(url)
+            if cached_result is not None:
+                return cached_result
+            if not revalidate:
+                conditional_headers = {}
+
+            if self.scheduler is not None:
+                await self.scheduler.acquire_async(url)
+
             # Fetch the webpage
-            response = requests.get(url, headers=self.headers, timeout=10, allow_redirects=True)
-            response.raise_for_status()
-            
+            metrics = self.metrics
+            if metrics is not None:
+                metrics.fetches.inc()
+            request_start = time.perf_counter()
+            async with session.get(
+                url,
+                headers=conditional_headers,
+                allow_redirects=self.config.allow_redirects,
+                max_redirects=self.config.max_redirects
+            ) as response:
+                timings["ttfb"] = time.perf_counter() - request_start
+                timings["redirects"] = len(response.history)
+
+                if response.status == 304:
+                    # A 304 has no body to parse; only the cached entry can answer it
+                    revalidated = self.cache.mark_not_modified(cache_key) if conditional_headers else None
+                    if revalidated is not None:
+                        if metrics is not None:
+                            metrics.cache_hits.inc(labels=('revalidated',))
+                        return revalidated
+                    if conditional_headers:
+                        # The entry was evicted while the request was in flight
+                        response.release()
+                        return await self._analyze_website_async(url, session, timings, revalidate=False)
+                    return self._unexpected_not_modified_result()
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type')
+                if self.config.html_only and not is_html_content_type(content_type):
+                    return self._not_html_result(content_type)
+
+                download_start = time.perf_counter()
+                if self.config.head_only:
+                    scanner = self._create_head_scanner()
+                    async for chunk in response.content.iter_chunked(self.config.chunk_size):
+                        if scanner.feed(chunk):
+                            break
+                    content = scanner.content
+                else:
+                    content = await response.read()
+                timings["download"] = time.perf_counter() - download_start
+                if metrics is not None:
+                    metrics.fetch_latency.observe(time.perf_counter() - request_start)
+                timings["bytes_downloaded"] = response.content.total_bytes
+                final_url = str(response.url)
+                status_code = response.status
+                response_headers = response.headers
+
+            # Parsing is CPU-bound, keep it off the event loop
+            result = await asyncio.to_thread(self._timed_success_result, final_url, status_code, content, timings)
+            self._remember(cache_key, result, response_headers, content)
+            return result
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._count_error('network')
+            return self._error_result(f"Network error: {str(e) or type(e).__name__}")
+        except Exception as e:
+            self._count_error('analysis')
+            return self._error_result(f"Analysis error: {str(e)}")
+
+    async def analyze_many_async(self, urls, max_concurrency=100, per_host_limit=2):
+        """
+        Analyze many websites concurrently on one event loop, yielding (url, result) pairs as they finish
+
+        max_concurrency bounds the analyses in flight, per_host_limit bounds
+        the open connections to any single host.
+        """
+        if self.scheduler is not None:
+            urls = self.scheduler.interleave(urls)
+
+        async with self._create_async_session(limit=max_concurrency, limit_per_host=per_host_limit) as session:
+            url_iter = iter(urls)
+            exhausted = False
+            pending = {}
+            try:
+                while True:
+                    while not exhausted and len(pending) < max_concurrency:
+                        try:
+                            url = next(url_iter)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                        task = asyncio.ensure_future(self.analyze_website_async(url, session=session))
+                        pending[task] = url
+
+                    if not pending:
+                        break
+
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield pending.pop(task), task.result()
+            finally:
+                for task in pending:
+                    task.cancel()
+
+    def _create_async_session(self, limit=100, limit_per_host=0):
+        """
+        Create an aiohttp session configured from the shared fetch config
+        """
+        aiohttp = _import_aiohttp()
+        return aiohttp.ClientSession(
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+            connector=aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host),
+        )
+
+    def _cache_lookup(self, url):
+        """
+        Return (cache_key, cached_result, conditional_headers) for a URL about to be fetched
+
+        The in-memory cache is checked first, then the page store. cache_key
+        is the normalized URL, or None when neither is configured.
+        """
+        if self.cache is None and self.store is None:
+            return None, None, {}
+        cache_key = normalize_url(url)
+
+        conditional_headers = {}
+        if self.cache is not None:
+            cached_result, conditional_headers = self.cache.lookup(cache_key)
+            if cached_result is not None:
+                if self.metrics is not None:
+                    self.metrics.cache_hits.inc(labels=('cache',))
+                return cache_key, cached_result, {}
+
+        if self.store is not None and self.store_max_age is not None:
+            page = self.store.get(cache_key, max_age=self.store_max_age)
+            # A page stored without links cannot answer for an analyzer that collects them
+            if page is not None and not (self.collect_links and page["links"] is None):
+                if self.metrics is not None:
+                    self.metrics.cache_hits.inc(labels=('store',))
+                return cache_key, page_to_result(page), {}
+
+        return cache_key, None, conditional_headers
+
+    def _remember(self, cache_key, result, response_headers, content):
+        """
+        Save a freshly fetched result to the cache and the page store
+        """
+        if self.cache is not None:
+            self.cache.store(cache_key, result, response_headers)
+        if self.store is not None:
+            self.store.add(cache_key, result, response_headers, content)
+
+    def _create_head_scanner(self):
+        return _HeadScanner(self.config.max_bytes, self.config.head_h1_count)
+
+    def _timed_success_result(self, final_url, status_code, content, timings):
+        """
+        _success_result with its parse stages recorded into timings, for use off the calling thread
+        """
+        with collect_timings(timings):
+            return self._success_result(final_url, status_code, content)
+
+    def _success_result(self, final_url, status_code, content):
+        """
+        Parse a fetched page and build a successful analysis result
+        """
+        meta_tags, links, parse_stats = self._parse_page(content)
+        if self.metrics is not None:
+            self.metrics.bytes_read.inc(len(content))
+            self.metrics.parse_latency.observe(parse_stats["parse_time"])
+        
+        result = {
+            "success": True,
+            "final_url": final_url,
+            "status_code": status_code,
+            "meta_tags": meta_tags,
+            "bytes_read": len(content),
+            "parse_stats": parse_stats,
+            "error": None
+        }
+        if self.collect_links:
+            result["links"] = self._resolve_links(final_url, links)
+        return result
+
+    def _parse_page(self, content):
+        """
+        Extract meta tags from raw HTML with the configured backend, returning (meta_tags, links, parse_stats)
+
+        links holds raw <a href> values and is empty unless collect_links is set.
+        """
+        links = []
+        start = time.perf_counter()
+        # Decoded once up front (as BeautifulSoup would) so decoding is timed on its own
+        markup = decode_html(content)
+        decoded = time.perf_counter()
+        if self.extractor == 'stream':
+            stream_parser = MetaTagParser(collect_links=self.collect_links)
+            stream_parser.feed(markup)
+            stream_parser.close()
+            parsed = time.perf_counter()
+            meta_tags = stream_parser.meta_tags()
+            if self.collect_links:
+                links = stream_parser.links()
+            parser = 'stream'
+            node_count = 0
+        else:
             # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
+            parser = self.html_parser
+            strainer = None
+            if self.restrict_parse:
+                strainer = META_TAG_AND_LINK_STRAINER if self.collect_links else META_TAG_STRAINER
+            soup = BeautifulSoup(markup, parser, parse_only=strainer)
+            parsed = time.perf_counter()
+
             # Extract meta tags
             meta_tags = self._extract_meta_tags(soup)
-            
-            return {
-                "success": True,
-                "final_url": response.url,
-                "status_code": response.status_code,
-                "meta_tags": meta_tags,
-                "error": None
-            }
-            
-        except requests.exceptions.RequestException as e:
-            return {
-                "success": False,
-                "error": f"Network error: {str(e)}",
-                "meta_tags": {},
-                "final_url": None,
-                "status_code": None
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Analysis error: {str(e)}",
-                "meta_tags": {},
-                "final_url": None,
-                "status_code": None
-            }
-    
+            if self.collect_links:
+                links = self._extract_links(soup)
+        end = time.perf_counter()
+        parse_time = end - start
+        record_stage('decode', decoded - start)
+        record_stage('parse', parsed - decoded)
+        record_stage('extract', end - parsed)
+
+        if self.extractor == 'soup':
+            # Counted outside the timed section; it walks the whole tree
+            node_count = sum(1 for _ in soup.descendants)
+
+        return meta_tags, links, {
+            "parser": parser,
+            "restricted": self.extractor == 'soup' and self.restrict_parse,
+            "parse_time": parse_time,
+            "node_count": node_count
+        }
+
+    def _unexpected_not_modified_result(self):
+        """
+        Build the error result for a 304 answering a request that was not conditional
+        """
+        self._count_error('network')
+        return self._error_result("Network error: 304 Not Modified for an unconditional request")
+
+    def _count_error(self, error_type):
+        if self.metrics is not None:
+            self.metrics.errors.inc(labels=(error_type,))
+
+    def _not_html_result(self, content_type):
+        """
+        Build the failed result for a response that is not an HTML page, flagged with "not_html"
+        """
+        self._count_error('not_html')
+        result = self._error_result(f"Not an HTML page ({content_type})")
+        result["not_html"] = True
+        return result
+
+    def _error_result(self, error):
+        """
+        Build a failed analysis result
+        """
+        return {
+            "success": False,
+            "error": error,
+            "meta_tags": {},
+            "final_url": None,
+            "status_code": None,
+            "bytes_read": 0,
+            "parse_stats": None
+        }
+
+    def analyze_many(self, urls, max_workers=8, per_host_limit=2):
+        """
+        Analyze many websites on a thread pool, yielding (url, result) pairs as they finish
+
+        URLs are pulled lazily from the iterable so only a bounded number of
+        analyses are queued at once, and per_host_limit caps how many fetches
+        run against the same host at the same time. URLs for a host at its
+        limit are held back (up to HOST_QUEUE_LOOKAHEAD of them) while URLs
+        for other hosts go ahead, so workers never sit waiting on a busy host.
+        Each result has the same shape as the one returned by analyze_website.
+        """
+        if self.scheduler is not None:
+            # Alternate between hosts so one large site cannot starve the rest
+            urls = self.scheduler.interleave(urls)
+
+        url_iter = iter(urls)
+        exhausted = False
+        pending = {}
+        slots = HostSlots(per_host_limit, self._host_of)
+        # Keep a small backlog per worker so the pool never idles, but never
+        # materialize the whole URL list as futures
+        max_pending = max_workers * 2
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            while True:
+                while len(pending) < max_pending:
+                    url = slots.next_ready()
+                    if url is None:
+                        break
+                    pending[executor.submit(self.analyze_website, url)] = url
+
+                while not exhausted and len(pending) < max_pending and slots.parked < HOST_QUEUE_LOOKAHEAD:
+                    try:
+                        url = next(url_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    if slots.add(url):
+                        pending[executor.submit(self.analyze_website, url)] = url
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = pending.pop(future)
+                    slots.finish(url)
+                    yield url, future.result()
+        finally:
+            # Stop queued work if the caller abandons the generator early
+            executor.shutdown(wait=False, cancel_futures=True)
+            if self.store is not None:
+                self.store.flush()
+
+    def _host_of(self, url):
+        """
+        Return the lower-cased host of a URL, assuming https when no protocol is given
+        """
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+        return urlparse(url).netloc.lower()
+
     def _extract_meta_tags(self, soup):
         """
         Extract all relevant meta tags from HTML
@@ -111,161 +964,54 @@ class SEOAnalyzer:
         
         return meta_tags
     
+    def _extract_links(self, soup):
+        """
+        Extract the raw href of every link on the page
+        """
+        return [a.get('href') for a in soup.find_all('a') if a.get('href')]
+
+    def _resolve_links(self, base_url, hrefs):
+        """
+        Resolve hrefs against the page URL, keeping unique http(s) URLs without fragments
+        """
+        links = []
+        seen = set()
+        for href in hrefs:
+            try:
+                absolute = urljoin(base_url, href.strip())
+                parts = urlparse(absolute)
+            except ValueError:
+                # Malformed href such as an unclosed IPv6 bracket
+                continue
+            if parts.scheme not in ('http', 'https'):
+                continue
+            absolute = parts._replace(fragment='').geturl()
+            if absolute not in seen:
+                seen.add(absolute)
+                links.append(absolute)
+        return links
+
+    def validate_result(self, result):
+        """
+        Validate a successful analysis result, adding the time taken to its timings
+
+        Returns None for failed results.
+        """
+        if not result["success"]:
+            return None
+        start = time.perf_counter()
+        validation = self.validate_seo(result["meta_tags"])
+        timings = result.get("timings")
+        if timings is not None:
+            elapsed = time.perf_counter() - start
+            timings["validate"] += elapsed
+            timings["total"] += elapsed
+        return validation
+
     def validate_seo(self, meta_tags):
         """
         Validate SEO implementation and provide recommendations with category breakdown
+
+        Scoring is driven by the analyzer's compiled rule set (see seo_rules).
         """
-        issues = []
-        recommendations = []
-        score = 100
-        
-        # Category scores
-        basic_meta_score = 100
-        social_media_score = 100
-        technical_seo_score = 100
-        content_structure_score = 100
-        
-        # BASIC META TAGS VALIDATION
-        title = meta_tags.get('title', '')
-        if not title:
-            issues.append("Missing title tag")
-            basic_meta_score -= 50
-            score -= 25
-        else:
-            if len(title) < 30:
-                issues.append("Title is too short (< 30 characters)")
-                recommendations.append("Consider expanding your title to 50-60 characters for optimal search visibility")
-                basic_meta_score -= 20
-                score -= 10
-            elif len(title) > 60:
-                issues.append("Title is too long (> 60 characters) - may be truncated in search results")
-                recommendations.append("Shorten your title to 50-60 characters to prevent truncation")
-                basic_meta_score -= 10
-                score -= 5
-        
-        description = meta_tags.get('description', '')
-        if not description:
-            issues.append("Missing meta description")
-            basic_meta_score -= 50
-            score -= 20
-        else:
-            if len(description) < 120:
-                issues.append("Meta description is too short (< 120 characters)")
-                recommendations.append("Expand your meta description to 150-160 characters for better search snippets")
-                basic_meta_score -= 20
-                score -= 10
-            elif len(description) > 160:
-                issues.append("Meta description is too long (> 160 characters) - may be truncated")
-                recommendations.append("Shorten your meta description to 150-160 characters")
-                basic_meta_score -= 10
-                score -= 5
-        
-        # SOCIAL MEDIA VALIDATION
-        og_title = meta_tags.get('og:title')
-        og_description = meta_tags.get('og:description')
-        og_image = meta_tags.get('og:image')
-        
-        if not og_title:
-            issues.append("Missing Open Graph title (og:title)")
-            recommendations.append("Add og:title meta tag for better social media sharing")
-            social_media_score -= 20
-            score -= 5
-        
-        if not og_description:
-            issues.append("Missing Open Graph description (og:description)")
-            recommendations.append("Add og:description meta tag for social media previews")
-            social_media_score -= 20
-            score -= 5
-        
-        if not og_image:
-            issues.append("Missing Open Graph image (og:image)")
-            recommendations.append("Add og:image meta tag with a high-quality image (1200x630px recommended)")
-            social_media_score -= 30
-            score -= 5
-        
-        twitter_card = meta_tags.get('twitter:card')
-        if not twitter_card:
-            issues.append("Missing Twitter Card type")
-            recommendations.append("Add twitter:card meta tag (summary_large_image recommended)")
-            social_media_score -= 20
-            score -= 5
-        
-        twitter_title = meta_tags.get('twitter:title')
-        twitter_description = meta_tags.get('twitter:description')
-        if not twitter_title and not og_title:
-            social_media_score -= 10
-        
-        # TECHNICAL SEO VALIDATION 
-        canonical = meta_tags.get('canonical')
-        if not canonical:
-            recommendations.append("Consider adding a canonical URL to prevent duplicate content issues")
-            technical_seo_score -= 15
-            score -= 3
-        
-        robots = meta_tags.get('robots')
-        if robots and ('noindex' in robots.lower() or 'nofollow' in robots.lower()):
-            issues.append("Page has restrictive robots meta tag")
-            recommendations.append("Review robots meta tag - it may prevent search engine indexing")
-            technical_seo_score -= 20
-        
-        viewport = meta_tags.get('viewport')
-        if not viewport:
-            issues.append("Missing viewport meta tag")
-            recommendations.append("Add viewport meta tag for mobile responsiveness")
-            technical_seo_score -= 25
-            score -= 5
-        
-        charset = meta_tags.get('charset')
-        if not charset:
-            technical_seo_score -= 10
-        
-        # CONTENT STRUCTURE VALIDATION
-        h1_tags = meta_tags.get('h1_tags', [])
-        if not h1_tags:
-            issues.append("No H1 tags found")
-            recommendations.append("Add at least one H1 tag to structure your content")
-            content_structure_score -= 40
-            score -= 5
-        elif len(h1_tags) > 1:
-            recommendations.append("Multiple H1 tags found - consider using only one H1 per page")
-            content_structure_score -= 20
-        
-        # Check for keywords
-        keywords = meta_tags.get('keywords')
-        if keywords:
-            content_structure_score += 10  # Bonus for having keywords
-        
-        # Ensure scores don't go below 0 or above 100
-        basic_meta_score = max(0, min(100, basic_meta_score))
-        social_media_score = max(0, min(100, social_media_score))
-        technical_seo_score = max(0, min(100, technical_seo_score))
-        content_structure_score = max(0, min(100, content_structure_score))
-        score = max(0, score)
-        
-        return {
-            "score": score,
-            "issues": issues,
-            "recommendations": recommendations,
-            "category_scores": {
-                "basic_meta": {
-                    "score": basic_meta_score,
-                    "name": "Basic Meta Tags",
-                    "description": "Title, description, and essential meta tags"
-                },
-                "social_media": {
-                    "score": social_media_score,
-                    "name": "Social Media",
-                    "description": "Open Graph and Twitter Card optimization"
-                },
-                "technical_seo": {
-                    "score": technical_seo_score,
-                    "name": "Technical SEO",
-                    "description": "Canonical URLs, robots, viewport, and charset"
-                },
-                "content_structure": {
-                    "score": content_structure_score,
-                    "name": "Content Structure",
-                    "description": "H1 tags, keywords, and content organization"
-                }
-            }
-        }
+        return self.rule_set.evaluate(meta_tags)
@@ -0,0 +1,159 @@
+"""
+seo-analyzer: analyze pages from the command line
+
+    seo-analyzer https://example.com
+    seo-analyzer --file urls.txt --format json > audit.jsonl
+    seo-analyzer --sitemap https://example.com/sitemap.xml --min-score 70
+
+Exits with status 1 when any page fails to load or scores below --min-score,
+so it can gate CI jobs. Heavy dependencies (requests, BeautifulSoup) are only
+imported once arguments are parsed, and Streamlit is never imported.
+"""
+import argparse
+import itertools
+import sys
+
+OUTPUT_FORMATS = ('table', 'json', 'csv')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='seo-analyzer',
+        description='Analyze the meta tags of web pages and score their SEO.'
+    )
+    parser.add_argument('urls', nargs='*', metavar='URL', help='page URLs to analyze')
+    parser.add_argument('-f', '--file', help="file with one URL per line ('-' for stdin)")
+    parser.add_argument('--sitemap', help='analyze every page listed in a sitemap or sitemap index')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='table',
+                        help='output format; json writes one object per line (default: table)')
+    parser.add_argument('--min-score', type=int, default=None,
+                        help='exit with status 1 if any page scores below this')
+    parser.add_argument('--workers', type=int, default=8, help='concurrent fetches (default: 8)')
+    parser.add_argument('--per-host', type=int, default=2, help='concurrent fetches per host (default: 2)')
+    parser.add_argument('--timeout', type=float, default=10, help='request timeout in seconds (default: 10)')
+    parser.add_argument('--extractor', choices=('soup', 'stream'), default='soup',
+                        help='meta tag extraction backend (default: soup)')
+    parser.add_argument('--timings', action='store_true',
+                        help='print per-stage timing percentiles to stderr when done')
+    return parser
+
+
+def iter_url_file(path):
+    """
+    Yield URLs from a file, one per line, skipping blanks and # comments
+    """
+    file = sys.stdin if path == '-' else open(path, encoding='utf-8')
+    try:
+        for line in file:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield line
+    finally:
+        if file is not sys.stdin:
+            file.close()
+
+
+def iter_results(args, analyzer, sitemap_source=None):
+    """
+    Yield (url, result) pairs for every requested page as they finish
+    """
+    if sitemap_source is not None:
+        yield from sitemap_source.analyze(max_workers=args.workers, per_host_limit=args.per_host)
+        return
+
+    if len(args.urls) == 1 and not args.file:
+        yield args.urls[0], analyzer.analyze_website(args.urls[0])
+        return
+
+    urls = args.urls
+    if args.file:
+        urls = itertools.chain(urls, iter_url_file(args.file))
+    yield from analyzer.analyze_many(urls, max_workers=args.workers, per_host_limit=args.per_host)
+
+
+class TableWriter:
+    """
+    Print one aligned row per page as results arrive
+    """
+    def __init__(self, file):
+        self.file = file
+        self.file.write(f"{'SCORE':>5}  {'STATUS':>6}  {'ISSUES':>6}  URL\n")
+
+    def write(self, url, result, validation=None):
+        if validation is None:
+            self.file.write(f"{'-':>5}  {'ERR':>6}  {'-':>6}  {url}  ({result['error']})\n")
+        else:
+            self.file.write(
+                f"{validation['score']:>5}  {result['status_code']:>6}  {len(validation['issues']):>6}  {url}\n"
+            )
+        self.file.flush()
+
+    def close(self):
+        self.file.flush()
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if not (args.urls or args.file or args.sitemap):
+        build_parser().error('give at least one URL, --file or --sitemap')
+
+    # Imported only now, so --help and argument errors stay fast
+    from seo_analyzer import FetchConfig, SEOAnalyzer
+    from timings import TimingAggregate
+
+    analyzer = SEOAnalyzer(
+        pool_maxsize=args.workers,
+        config=FetchConfig(timeout=args.timeout),
+        extractor=args.extractor
+    )
+
+    if args.format == 'table':
+        writer = TableWriter(sys.stdout)
+    else:
+        from exporters import open_exporter
+
+        writer = open_exporter(sys.stdout.buffer, format='jsonl' if args.format == 'json' else 'csv',
+                               buffer_size=8 * 1024)
+
+    sitemap_source = None
+    if args.sitemap:
+        from sitemap import SitemapSource
+
+        sitemap_source = SitemapSource(args.sitemap, analyzer, skip_unchanged=False)
+
+    timings = TimingAggregate()
+    pages = failed = below_threshold = 0
+    try:
+        for url, result in iter_results(args, analyzer, sitemap_source):
+            pages += 1
+            validation = analyzer.validate_result(result)
+            timings.add(result)
+            if validation is not None:
+                if args.min_score is not None and validation["score"] < args.min_score:
+                    below_threshold += 1
+            else:
+                failed += 1
+            writer.write(url, result, validation)
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        writer.close()
+
+    sitemap_errors = sitemap_source.errors if sitemap_source is not None else []
+    for sitemap_url, error in sitemap_errors:
+        print(f"Skipped sitemap {sitemap_url}: {error}", file=sys.stderr)
+
+    summary = f"{pages} page(s) analyzed, {failed} failed"
+    if sitemap_errors:
+        summary += f", {len(sitemap_errors)} sitemap(s) skipped"
+    if args.min_score is not None:
+        summary += f", {below_threshold} below score {args.min_score}"
+    print(summary, file=sys.stderr)
+    if args.timings:
+        print(timings.format_table(), file=sys.stderr)
+
+    return 1 if failed or below_threshold or sitemap_errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,353 @@
+# Category key, display name and description, in display order
+CATEGORIES = (
+    ("basic_meta", "Basic Meta Tags", "Title, description, and essential meta tags"),
+    ("social_media", "Social Media", "Open Graph and Twitter Card optimization"),
+    ("technical_seo", "Technical SEO", "Canonical URLs, robots, viewport, and charset"),
+    ("content_structure", "Content Structure", "H1 tags, keywords, and content organization"),
+)
+
+# Each rule reads one field (or several with "fields"), applies a check from
+# CHECKS and, when it fires, adds category_delta to its category and
+# score_delta to the overall score (negative for penalties) and reports its
+# issue and recommendation. "{value}" in the text is filled with the rule's
+# threshold. Rules run in table order, which is the order messages appear in.
+DEFAULT_RULES = [
+    # BASIC META TAGS
+    {
+        "code": "title_missing",
+        "field": "title",
+        "check": "missing",
+        "category": "basic_meta",
+        "category_delta": -50,
+        "score_delta": -25,
+        "issue": "Missing title tag",
+    },
+    {
+        "code": "title_too_short",
+        "field": "title",
+        "check": "shorter_than",
+        "value": 30,
+        "category": "basic_meta",
+        "category_delta": -20,
+        "score_delta": -10,
+        "issue": "Title is too short (< {value} characters)",
+        "recommendation": "Consider expanding your title to 50-60 characters for optimal search visibility",
+    },
+    {
+        "code": "title_too_long",
+        "field": "title",
+        "check": "longer_than",
+        "value": 60,
+        "category": "basic_meta",
+        "category_delta": -10,
+        "score_delta": -5,
+        "issue": "Title is too long (> {value} characters) - may be truncated in search results",
+        "recommendation": "Shorten your title to 50-60 characters to prevent truncation",
+    },
+    {
+        "code": "description_missing",
+        "field": "description",
+        "check": "missing",
+        "category": "basic_meta",
+        "category_delta": -50,
+        "score_delta": -20,
+        "issue": "Missing meta description",
+    },
+    {
+        "code": "description_too_short",
+        "field": "description",
+        "check": "shorter_than",
+        "value": 120,
+        "category": "basic_meta",
+        "category_delta": -20,
+        "score_delta": -10,
+        "issue": "Meta description is too short (< {value} characters)",
+        "recommendation": "Expand your meta description to 150-160 characters for better search snippets",
+    },
+    {
+        "code": "description_too_long",
+        "field": "description",
+        "check": "longer_than",
+        "value": 160,
+        "category": "basic_meta",
+        "category_delta": -10,
+        "score_delta": -5,
+        "issue": "Meta description is too long (> {value} characters) - may be truncated",
+        "recommendation": "Shorten your meta description to 150-160 characters",
+    },
+
+    # SOCIAL MEDIA
+    {
+        "code": "og_title_missing",
+        "field": "og:title",
+        "check": "missing",
+        "category": "social_media",
+        "category_delta": -20,
+        "score_delta": -5,
+        "issue": "Missing Open Graph title (og:title)",
+        "recommendation": "Add og:title meta tag for better social media sharing",
+    },
+    {
+        "code": "og_description_missing",
+        "field": "og:description",
+        "check": "missing",
+        "category": "social_media",
+        "category_delta": -20,
+        "score_delta": -5,
+        "issue": "Missing Open Graph description (og:description)",
+        "recommendation": "Add og:description meta tag for social media previews",
+    },
+    {
+        "code": "og_image_missing",
+        "field": "og:image",
+        "check": "missing",
+        "category": "social_media",
+        "category_delta": -30,
+        "score_delta": -5,
+        "issue": "Missing Open Graph image (og:image)",
+        "recommendation": "Add og:image meta tag with a high-quality image (1200x630px recommended)",
+    },
+    {
+        "code": "twitter_card_missing",
+        "field": "twitter:card",
+        "check": "missing",
+        "category": "social_media",
+        "category_delta": -20,
+        "score_delta": -5,
+        "issue": "Missing Twitter Card type",
+        "recommendation": "Add twitter:card meta tag (summary_large_image recommended)",
+    },
+    {
+        "code": "social_title_missing",
+        "fields": ["twitter:title", "og:title"],
+        "check": "missing",
+        "category": "social_media",
+        "category_delta": -10,
+    },
+
+    # TECHNICAL SEO
+    {
+        "code": "canonical_missing",
+        "field": "canonical",
+        "check": "missing",
+        "category": "technical_seo",
+        "category_delta": -15,
+        "score_delta": -3,
+        "recommendation": "Consider adding a canonical URL to prevent duplicate content issues",
+    },
+    {
+        "code": "robots_restrictive",
+        "field": "robots",
+        "check": "contains_any",
+        "value": ["noindex", "nofollow"],
+        "category": "technical_seo",
+        "category_delta": -20,
+        "issue": "Page has restrictive robots meta tag",
+        "recommendation": "Review robots meta tag - it may prevent search engine indexing",
+    },
+    {
+        "code": "viewport_missing",
+        "field": "viewport",
+        "check": "missing",
+        "category": "technical_seo",
+        "category_delta": -25,
+        "score_delta": -5,
+        "issue": "Missing viewport meta tag",
+        "recommendation": "Add viewport meta tag for mobile responsiveness",
+    },
+    {
+        "code": "charset_missing",
+        "field": "charset",
+        "check": "missing",
+        "category": "technical_seo",
+        "category_delta": -10,
+    },
+
+    # CONTENT STRUCTURE
+    {
+        "code": "h1_missing",
+        "field": "h1_tags",
+        "check": "missing",
+        "category": "content_structure",
+        "category_delta": -40,
+        "score_delta": -5,
+        "issue": "No H1 tags found",
+        "recommendation": "Add at least one H1 tag to structure your content",
+    },
+    {
+        "code": "h1_multiple",
+        "field": "h1_tags",
+        "check": "longer_than",
+        "value": 1,
+        "category": "content_structure",
+        "category_delta": -20,
+        "recommendation": "Multiple H1 tags found - consider using only one H1 per page",
+    },
+    {
+        "code": "keywords_present",
+        "field": "keywords",
+        "check": "present",
+        "category": "content_structure",
+        "category_delta": 10,  # Bonus for having keywords
+    },
+]
+
+
+def _missing(fields, value):
+    if len(fields) == 1:
+        field = fields[0]
+        return lambda meta_tags: not meta_tags.get(field)
+    return lambda meta_tags: not any(meta_tags.get(field) for field in fields)
+
+
+def _present(fields, value):
+    field = fields[0]
+    return lambda meta_tags: bool(meta_tags.get(field))
+
+
+def _shorter_than(fields, value):
+    field = fields[0]
+
+    def predicate(meta_tags):
+        found = meta_tags.get(field)
+        return bool(found) and len(found) < value
+    return predicate
+
+
+def _longer_than(fields, value):
+    field = fields[0]
+
+    def predicate(meta_tags):
+        found = meta_tags.get(field)
+        return bool(found) and len(found) > value
+    return predicate
+
+
+def _contains_any(fields, value):
+    field = fields[0]
+    tokens = tuple(token.lower() for token in value)
+
+    def predicate(meta_tags):
+        found = meta_tags.get(field)
+        if not found:
+            return False
+        found = found.lower()
+        return any(token in found for token in tokens)
+    return predicate
+
+
+# Check name -> factory building a predicate over a meta_tags dict
+CHECKS = {
+    "missing": _missing,
+    "present": _present,
+    "shorter_than": _shorter_than,
+    "longer_than": _longer_than,
+    "contains_any": _contains_any,
+}
+
+
+class RuleSet:
+    """
+    A rule table compiled once into predicates and precomputed messages
+
+    evaluate() returns the same structure validate_seo always has (score,
+    issues, recommendations, category_scores) plus issue_codes, the codes of
+    every rule that fired. Pass a modified copy of DEFAULT_RULES to adjust
+    thresholds, penalties or wording per client.
+    """
+    def __init__(self, rules=None, categories=CATEGORIES):
+        self.rules = list(DEFAULT_RULES if rules is None else rules)
+        self.categories = tuple(categories)
+        category_index = {key: index for index, (key, _, _) in enumerate(self.categories)}
+
+        compiled = []
+        for rule in self.rules:
+            check = rule["check"]
+            if check not in CHECKS:
+                raise ValueError(f"Rule {rule.get('code')!r} uses unknown check {check!r}")
+            if rule["category"] not in category_index:
+                raise ValueError(f"Rule {rule.get('code')!r} uses unknown category {rule['category']!r}")
+
+            fields = rule.get("fields") or [rule["field"]]
+            value = rule.get("value")
+            issue = rule.get("issue")
+            recommendation = rule.get("recommendation")
+            compiled.append((
+                CHECKS[check](fields, value),
+                category_index[rule["category"]],
+                rule.get("category_delta", 0),
+                rule.get("score_delta", 0),
+                issue.format(value=value) if issue else None,
+                recommendation.format(value=value) if recommendation else None,
+                rule["code"],
+            ))
+        self._compiled = tuple(compiled)
+
+    def evaluate(self, meta_tags):
+        """
+        Score one meta_tags dict
+        """
+        category_scores = [100] * len(self.categories)
+        score = 100
+        issues = []
+        recommendations = []
+        issue_codes = []
+
+        for predicate, category, category_delta, score_delta, issue, recommendation, code in self._compiled:
+            if predicate(meta_tags):
+                category_scores[category] += category_delta
+                score += score_delta
+                issue_codes.append(code)
+                if issue:
+                    issues.append(issue)
+                if recommendation:
+                    recommendations.append(recommendation)
+
+        return self._result(score, category_scores, issues, recommendations, issue_codes)
+
+    def assemble(self, score, category_scores, fired):
+        """
+        Build an evaluate()-style result from precomputed scores and the indexes of the rules that fired
+
+        Used by batch scorers that compute the numbers elsewhere but need the
+        same messages and structure.
+        """
+        issues = []
+        recommendations = []
+        issue_codes = []
+        for index in fired:
+            _, _, _, _, issue, recommendation, code = self._compiled[index]
+            issue_codes.append(code)
+            if issue:
+                issues.append(issue)
+            if recommendation:
+                recommendations.append(recommendation)
+        return self._result(score, category_scores, issues, recommendations, issue_codes)
+
+    def _result(self, score, category_scores, issues, recommendations, issue_codes):
+        # Ensure scores don't go below 0 or above 100
+        return {
+            "score": max(0, score),
+            "issues": issues,
+            "recommendations": recommendations,
+            "category_scores": {
+                key: {
+                    "score": max(0, min(100, category_score)),
+                    "name": name,
+                    "description": description
+                }
+                for (key, name, description), category_score in zip(self.categories, category_scores)
+            },
+            "issue_codes": issue_codes
+        }
+
+    def evaluate_many(self, meta_tags_iter):
+        """
+        Score many meta_tags dicts, yielding one result per input
+        """
+        evaluate = self.evaluate
+        for meta_tags in meta_tags_iter:
+            yield evaluate(meta_tags)
+
+
+DEFAULT_RULE_SET = RuleSet()
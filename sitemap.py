@@ -0,0 +1,183 @@
+from collections import namedtuple
+from datetime import datetime, timezone
+import gzip
+import io
+import xml.etree.ElementTree as ET
+import zlib
+
+import requests
+import urllib3
+
+from seo_analyzer import normalize_url
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+# Failures that skip one sitemap: HTTP errors, broken downloads, bad gzip or bad XML
+SITEMAP_ERRORS = (requests.RequestException, urllib3.exceptions.HTTPError, ET.ParseError, OSError, EOFError,
+                  zlib.error)
+
+SitemapEntry = namedtuple('SitemapEntry', ['loc', 'lastmod'])
+
+
+def parse_lastmod(value):
+    """
+    Parse a W3C datetime from <lastmod> into an aware UTC datetime, or None if it is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def iter_sitemap_xml(stream):
+    """
+    Incrementally parse a sitemap or sitemap index from a binary stream
+
+    Yields ('url', SitemapEntry) for <url> entries and ('sitemap', SitemapEntry)
+    for child sitemaps of an index. Finished elements are cleared as soon as
+    they are yielded, so memory stays flat however many entries there are.
+    """
+    root = None
+    for event, elem in ET.iterparse(stream, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = elem
+            continue
+
+        kind = _local_name(elem.tag)
+        if kind not in ('url', 'sitemap'):
+            continue
+
+        loc = lastmod = None
+        for child in elem:
+            name = _local_name(child.tag)
+            if name == 'loc':
+                loc = (child.text or '').strip()
+            elif name == 'lastmod':
+                lastmod = parse_lastmod(child.text)
+        if loc:
+            yield kind, SitemapEntry(loc, lastmod)
+
+        # Drop the finished entry and anything the root still references
+        elem.clear()
+        root.clear()
+
+
+def open_sitemap_stream(url, session, headers=None, timeout=10):
+    """
+    Open a sitemap URL as a streaming binary file object, decompressing .xml.gz on the fly
+    """
+    response = session.get(url, headers=headers, timeout=timeout, stream=True)
+    try:
+        response.raise_for_status()
+    except requests.HTTPError:
+        response.close()
+        raise
+
+    # Undo any Content-Encoding while reading; a .gz file body is handled below
+    response.raw.decode_content = True
+    # Keep the raw stream readable at EOF so BufferedReader can report it
+    response.raw.auto_close = False
+    stream = io.BufferedReader(response.raw)
+    if stream.peek(2)[:2] == GZIP_MAGIC:
+        stream = gzip.GzipFile(fileobj=stream)
+    return response, stream
+
+
+class SitemapSource:
+    """
+    Lazily stream page URLs out of a sitemap or sitemap index into SEOAnalyzer batch runs
+
+    Child sitemaps of an index are fetched one at a time, and URLs are only
+    read from the network as fast as the consumer pulls them, so
+    analyze_many's bounded queue provides backpressure all the way down to
+    the sitemap download. When a page store is available, entries whose
+    <lastmod> is not newer than the stored fetch time are skipped. Entries
+    whose <loc> is not a valid URL (a port out of range, say) are skipped
+    and counted in stats["skipped_invalid"].
+
+    A sitemap that cannot be fetched or parsed is skipped, keeping whatever
+    it yielded before failing; it is counted in stats["errors"] and listed
+    in errors as (sitemap URL, message). Sitemap fetches wait on the
+    analyzer's politeness scheduler like page fetches do.
+    """
+    def __init__(self, sitemap_url, analyzer, store=None, skip_unchanged=True, max_index_depth=2):
+        self.sitemap_url = sitemap_url
+        self.analyzer = analyzer
+        self.store = store if store is not None else analyzer.store
+        self.skip_unchanged = skip_unchanged
+        self.max_index_depth = max_index_depth
+        self.stats = {"sitemaps": 0, "entries": 0, "skipped_unchanged": 0, "skipped_invalid": 0, "errors": 0}
+        self.errors = []
+
+    def entries(self):
+        """
+        Yield every SitemapEntry for a page, following sitemap indexes
+        """
+        yield from self._entries(self.sitemap_url, 0)
+
+    def urls(self):
+        """
+        Yield page URLs to analyze, skipping unchanged ones when a store is available
+        """
+        for entry in self.entries():
+            try:
+                key = normalize_url(entry.loc)
+            except ValueError:
+                self.stats["skipped_invalid"] += 1
+                continue
+            if self.skip_unchanged and self._is_unchanged(key, entry.lastmod):
+                self.stats["skipped_unchanged"] += 1
+                continue
+            yield entry.loc
+
+    def analyze(self, max_workers=8, per_host_limit=2):
+        """
+        Run the sitemap's URLs through SEOAnalyzer.analyze_many, yielding (url, result) pairs
+        """
+        return self.analyzer.analyze_many(self.urls(), max_workers=max_workers, per_host_limit=per_host_limit)
+
+    def _entries(self, sitemap_url, depth):
+        self.stats["sitemaps"] += 1
+        child_sitemaps = []
+
+        try:
+            if self.analyzer.scheduler is not None:
+                self.analyzer.scheduler.acquire(sitemap_url)
+            response, stream = open_sitemap_stream(
+                sitemap_url,
+                self.analyzer.session,
+                headers=self.analyzer.headers,
+                timeout=self.analyzer.config.timeout
+            )
+            with response:
+                for kind, entry in iter_sitemap_xml(stream):
+                    if kind == 'url':
+                        self.stats["entries"] += 1
+                        yield entry
+                    elif depth < self.max_index_depth:
+                        # An index lists at most 50,000 sitemaps; collect them so
+                        # its connection is not held open while children stream
+                        child_sitemaps.append(entry.loc)
+        except SITEMAP_ERRORS as e:
+            # One broken sitemap must not abort the batch analyzing the others
+            self.stats["errors"] += 1
+            self.errors.append((sitemap_url, str(e)))
+
+        for child_url in child_sitemaps:
+            yield from self._entries(child_url, depth + 1)
+
+    def _is_unchanged(self, key, lastmod):
+        if self.store is None or lastmod is None:
+            return False
+        page = self.store.get(key)
+        return page is not None and lastmod.timestamp() <= page["fetched_at"]
+
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1]
@@ -0,0 +1,67 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
+
+import pytest
+
+
+class RouteHandler(BaseHTTPRequestHandler):
+    """
+    Serve server.routes: {path: (status, body bytes, content type[, extra headers])}; anything else is a 404
+
+    A route may also be a callable taking the request headers and returning such a tuple.
+
+    Each response is delayed by server.delay seconds, and server.max_in_flight
+    records the most requests handled at once per Host header.
+    """
+    def do_GET(self):
+        server = self.server
+        host = self.headers.get('Host')
+        with server.lock:
+            server.requests.append((self.path, dict(self.headers)))
+            server.in_flight[host] = server.in_flight.get(host, 0) + 1
+            server.max_in_flight[host] = max(server.max_in_flight.get(host, 0), server.in_flight[host])
+        try:
+            time.sleep(server.delay)
+            self._respond()
+        finally:
+            with server.lock:
+                server.in_flight[host] -= 1
+
+    def _respond(self):
+        route = self.server.routes.get(self.path.split('?', 1)[0], (404, b'Not found', 'text/plain'))
+        if callable(route):
+            route = route(self.headers)
+        status, body, content_type, *extra_headers = route
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        for name, value in (extra_headers[0] if extra_headers else {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    """
+    A local HTTP server; set routes and delay on it, read the (path, headers) of every request from requests
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), RouteHandler)
+    server.routes = {}
+    server.requests = []
+    server.delay = 0
+    server.lock = threading.Lock()
+    server.in_flight = {}
+    server.max_in_flight = {}
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,85 @@
+import time
+
+from metrics import AnalyzerMetrics
+from pipeline import AnalysisPipeline
+from seo_analyzer import HostSlots, SEOAnalyzer
+
+PAGE = (200, b'<html><head><title>Page</title></head><body><h1>Page</h1></body></html>', 'text/html')
+
+
+def grouped_urls(http_server, per_host):
+    # 127.0.0.1 and localhost are two hosts to the analyzer but reach the same server
+    port = http_server.server_address[1]
+    return ([f"http://127.0.0.1:{port}/page?n={index}" for index in range(per_host)]
+            + [f"http://localhost:{port}/page?n={index}" for index in range(per_host)])
+
+
+def test_host_slots_release_parked_urls_in_order():
+    slots = HostSlots(1, lambda url: url.split('/')[0])
+    assert slots.add('a/1')
+    assert not slots.add('a/2')
+    assert not slots.add('a/3')
+    assert slots.add('b/1')
+    assert slots.next_ready() is None
+
+    slots.finish('a/1')
+    assert slots.next_ready() == 'a/2'
+    assert slots.next_ready() is None
+    slots.finish('a/2')
+    assert slots.next_ready() == 'a/3'
+    assert slots.parked == 0
+
+
+def test_per_host_limit_does_not_block_other_hosts(http_server):
+    http_server.routes['/page'] = PAGE
+    http_server.delay = 0.1
+    urls = grouped_urls(http_server, 8)
+    analyzer = SEOAnalyzer(pool_maxsize=8, profiler=False)
+
+    start = time.perf_counter()
+    results = list(analyzer.analyze_many(urls, max_workers=8, per_host_limit=2))
+    elapsed = time.perf_counter() - start
+
+    assert sorted(url for url, _ in results) == sorted(urls)
+    assert all(result["success"] for _, result in results)
+    assert max(http_server.max_in_flight.values()) == 2
+    # Both hosts run side by side: 4 rounds of 0.1 s, not 8
+    assert elapsed < 0.7
+
+
+def test_pipeline_per_host_limit_does_not_block_other_hosts(http_server):
+    http_server.routes['/page'] = PAGE
+    http_server.delay = 0.1
+    urls = grouped_urls(http_server, 8)
+
+    with AnalysisPipeline(SEOAnalyzer(pool_maxsize=8, profiler=False), parse_workers=1, fetch_workers=8,
+                          per_host_limit=2) as pipeline:
+        list(pipeline.run(urls[:1]))
+        http_server.max_in_flight.clear()
+        start = time.perf_counter()
+        results = list(pipeline.run(urls))
+        elapsed = time.perf_counter() - start
+
+    assert sorted(url for url, _, _ in results) == sorted(urls)
+    assert all(validation is not None for _, _, validation in results)
+    assert max(http_server.max_in_flight.values()) == 2
+    assert elapsed < 0.7
+
+
+def test_pipeline_counts_pages_in_flight(http_server):
+    http_server.routes['/page'] = PAGE
+    http_server.delay = 0.05
+    metrics = AnalyzerMetrics()
+    seen = []
+    with AnalysisPipeline(SEOAnalyzer(pool_maxsize=4, metrics=metrics, profiler=False), parse_workers=1,
+                          fetch_workers=4, per_host_limit=4) as pipeline:
+        for _ in pipeline.run(grouped_urls(http_server, 4)):
+            seen.append(metrics.in_flight.value())
+        assert max(seen) > 0
+        assert metrics.in_flight.value() == 0
+
+        # Abandoning the run early must not leave pages counted
+        results = pipeline.run(grouped_urls(http_server, 4))
+        next(results)
+        results.close()
+        assert metrics.in_flight.value() == 0
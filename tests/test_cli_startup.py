@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+from bench_cli_startup import SCENARIOS, import_times
+
+# Import time is noisy on a busy machine; the fastest of a few runs counts, as in the benchmark
+RUNS = 3
+
+
+@pytest.mark.parametrize('label, cli_args, budget_ms, forbidden', SCENARIOS, ids=[scenario[0] for scenario in SCENARIOS])
+def test_cli_startup_budget(label, cli_args, budget_ms, forbidden):
+    runs = [import_times(cli_args) for _ in range(RUNS)]
+    for times in runs:
+        loaded = [module for module in forbidden if module in times]
+        assert not loaded, f"{label} imported modules that must stay lazy: {', '.join(loaded)}"
+
+    best_ms = min(sum(times.values()) for times in runs) / 1000
+    assert best_ms <= budget_ms, f"{label} imports took {best_ms:.1f} ms, over the {budget_ms} ms budget"
@@ -0,0 +1,62 @@
+import socket
+
+import urllib3.util.connection
+
+from seo_analyzer import SEOAnalyzer
+
+PAGE = (200, b'<html><head><title>Page</title></head><body></body></html>', 'text/html')
+
+# TEST-NET-1 (RFC 5737): never routed, stands in for an address that times out
+UNREACHABLE = '192.0.2.1'
+
+
+def resolve_host_to(monkeypatch, hostname, addresses):
+    """
+    Make hostname resolve to addresses, in order, and connects to UNREACHABLE time out
+    """
+    getaddrinfo = socket.getaddrinfo
+    create_connection = urllib3.util.connection.create_connection
+
+    def fake_getaddrinfo(host, port, *args, **kwargs):
+        if host != hostname:
+            return getaddrinfo(host, port, *args, **kwargs)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', (address, port)) for address in addresses]
+
+    def fake_create_connection(address, *args, **kwargs):
+        if address[0] == UNREACHABLE:
+            raise socket.timeout('timed out')
+        return create_connection(address, *args, **kwargs)
+
+    monkeypatch.setattr(socket, 'getaddrinfo', fake_getaddrinfo)
+    monkeypatch.setattr(urllib3.util.connection, 'create_connection', fake_create_connection)
+
+
+def test_connect_timeout_falls_back_to_next_address(http_server, monkeypatch):
+    http_server.routes['/'] = PAGE
+    resolve_host_to(monkeypatch, 'multi.test', [UNREACHABLE, '127.0.0.1'])
+
+    result = SEOAnalyzer(profiler=False).analyze_website(f"http://multi.test:{http_server.server_address[1]}/")
+
+    assert result["success"], result.get("error")
+    assert result["status_code"] == 200
+
+
+def test_connect_timeout_error_names_the_host(monkeypatch):
+    resolve_host_to(monkeypatch, 'multi.test', [UNREACHABLE])
+
+    result = SEOAnalyzer(profiler=False).analyze_website("http://multi.test/")
+
+    assert not result["success"]
+    assert 'multi.test' in result["error"]
+    assert UNREACHABLE not in result["error"]
+
+
+def test_reconnects_after_server_closes_count_as_new_connections(http_server):
+    # The test server speaks HTTP/1.0 and closes the connection after every response
+    http_server.routes['/'] = PAGE
+    analyzer = SEOAnalyzer(profiler=False)
+
+    for _ in range(3):
+        assert analyzer.analyze_website(f"{http_server.base_url}/")["success"]
+
+    assert analyzer.get_connection_stats() == {"requests": 3, "new_connections": 3, "reused_connections": 0}
@@ -0,0 +1,78 @@
+from crawler import SiteCrawler
+from page_store import PageStore
+from seo_analyzer import FetchConfig, SEOAnalyzer
+
+
+def html(title, *links):
+    anchors = ''.join(f'<a href="{link}">{link}</a>' for link in links)
+    return (200, f'<html><head><title>{title}</title></head><body>{anchors}</body></html>'.encode('utf-8'), 'text/html')
+
+
+def serve_site(http_server):
+    http_server.routes.update({
+        '/': html('Home', '/a', '/report.pdf'),
+        '/a': html('A', '/b'),
+        '/b': html('B'),
+        '/report.pdf': (200, b'%PDF-1.7 ' + b'x' * 4096, 'application/pdf'),
+    })
+
+
+def crawled_paths(crawler, seed_url):
+    return sorted(url[len(seed_url) - 1:] for url, _, _, _ in crawler.crawl(seed_url))
+
+
+def test_non_html_links_are_skipped(http_server):
+    serve_site(http_server)
+    crawler = SiteCrawler()
+
+    assert crawled_paths(crawler, http_server.base_url + '/') == ['/', '/a', '/b']
+    stats = crawler.stats()
+    assert stats["skipped"] == 1
+    assert stats["errors"] == 0
+
+
+def test_crawl_expands_pages_served_from_the_store(http_server, tmp_path):
+    serve_site(http_server)
+    seed_url = http_server.base_url + '/'
+    with PageStore(str(tmp_path / 'pages.db')) as store:
+        analyzer = SEOAnalyzer(collect_links=True, store=store, store_max_age=3600, profiler=False,
+                               config=FetchConfig(html_only=True))
+        assert crawled_paths(SiteCrawler(analyzer), seed_url) == ['/', '/a', '/b']
+        fetched = len(http_server.requests)
+
+        # Every HTML page is fresh in the store now; only the PDF is requested again
+        assert crawled_paths(SiteCrawler(analyzer), seed_url) == ['/', '/a', '/b']
+        assert [path for path, _ in http_server.requests[fetched:]] == ['/report.pdf']
+
+
+def test_pages_stored_without_links_are_refetched_for_crawls(http_server, tmp_path):
+    serve_site(http_server)
+    seed_url = http_server.base_url + '/'
+    with PageStore(str(tmp_path / 'pages.db')) as store:
+        SEOAnalyzer(store=store, profiler=False).analyze_website(seed_url)
+        analyzer = SEOAnalyzer(collect_links=True, store=store, store_max_age=3600, profiler=False,
+                               config=FetchConfig(html_only=True))
+        assert crawled_paths(SiteCrawler(analyzer), seed_url) == ['/', '/a', '/b']
+
+
+def test_non_html_links_are_analyzed_unless_html_only(http_server):
+    serve_site(http_server)
+    crawler = SiteCrawler(SEOAnalyzer(collect_links=True, profiler=False))
+
+    assert crawled_paths(crawler, http_server.base_url + '/') == ['/', '/a', '/b', '/report.pdf']
+    assert crawler.stats()["skipped"] == 0
+
+
+def test_malformed_links_are_skipped(http_server):
+    serve_site(http_server)
+    port = http_server.server_address[1]
+    http_server.routes['/'] = html('Home', 'http://[oops/', 'http://127.0.0.1:99999/x', '/a')
+    crawler = SiteCrawler()
+
+    results = {url[len(http_server.base_url):]: result for url, _, result, _ in crawler.crawl(http_server.base_url + '/')}
+
+    assert sorted(results) == ['/', '/a', '/b']
+    assert results['/']["success"]
+    assert results['/']["meta_tags"]["title"] == 'Home'
+    assert results['/']["links"] == ['http://127.0.0.1:99999/x', f'http://127.0.0.1:{port}/a']
+    assert crawler.stats()["errors"] == 0
@@ -0,0 +1,63 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+from fixtures import FIXTURES, load_corpus
+from meta_parser import extract_meta_tags
+from seo_analyzer import SEOAnalyzer
+
+# Markup the benchmark corpus does not cover, each case keyed by what it exercises
+EDGE_CASES = {
+    'numeric_charrefs': b"<title>Tom&#39;s &amp; Jerry</title><h1>&#x41;&#X42;&#67; &#128169;</h1>",
+    'windows_1252_charrefs': b"<title>&#147;Quoted&#148; &#150; dash &#129;</title>",
+    'charref_without_semicolon': b"<title>It&#39s here &#x41 and &#65</title>",
+    'charref_in_attribute': b'<meta name="description" content="Tom&#39;s &#x26; more">',
+    'named_entity_without_semicolon': b"<title>AT&T &amp friends &copy 2024 &notin; &unknown</title>",
+    'named_entity_in_attribute': b'<meta property="og:title" content="Fish &amp chips &copy">',
+    'unclosed_tags': b'<html><head><title>Open<meta name="description" content="x"><body><h1>One<h1>Two',
+    'misnested_tags': b"<h1>Bold <b>text</h1> after</b><h1><span>Second</h1>",
+    'script_and_style_text': b"<h1>Visible<script>var x = '<h1>';</script><style>h1{}</style></h1>",
+    'cdata_and_comments': b"<title>A<!-- hidden -->B<![CDATA[C]]></title>",
+    'whitespace_only': b"<h1>  <b> </b>\n </h1><h1><pre>  </pre></h1>",
+    'charset_detection': '<meta charset="windows-1252"><title>Caf\xe9 – bar</title>'.encode('windows-1252'),
+}
+
+# The 5 MB fixture takes seconds under html.parser and adds nothing the others do not
+CORPUS = load_corpus([name for name in FIXTURES if name != 'large_5mb'])
+
+
+def soup_meta_tags(content, restrict_parse):
+    analyzer = SEOAnalyzer(extractor='soup', html_parser='html.parser', restrict_parse=restrict_parse, profiler=False)
+    return analyzer._parse_page(content)[0]
+
+
+def stream_meta_tags(content):
+    analyzer = SEOAnalyzer(extractor='stream', profiler=False)
+    return analyzer._parse_page(content)[0]
+
+
+@pytest.mark.parametrize('restrict_parse', [True, False])
+@pytest.mark.parametrize('name', sorted({**CORPUS, **EDGE_CASES}))
+def test_stream_matches_soup(name, restrict_parse):
+    content = CORPUS.get(name) or EDGE_CASES[name]
+    assert stream_meta_tags(content) == soup_meta_tags(content, restrict_parse)
+
+
+def test_numeric_charrefs_are_decoded():
+    meta_tags = extract_meta_tags(EDGE_CASES['numeric_charrefs'])
+    assert meta_tags['title'] == "Tom's & Jerry"
+    assert meta_tags['h1_tags'] == ['ABC \U0001F4A9']
+
+
+def test_windows_1252_charrefs_are_remapped():
+    meta_tags = extract_meta_tags(EDGE_CASES['windows_1252_charrefs'])
+    assert meta_tags['title'] == '“Quoted” – dash \x81'
+
+
+def test_invalid_charrefs_become_replacement_characters():
+    # Not a parity case: older BeautifulSoup releases, 4.13.4 included, keep these as-is
+    meta_tags = extract_meta_tags(b"<title>null &#0; big &#1114112; surrogate &#xD800;</title>")
+    assert meta_tags['title'] == 'null \ufffd big \ufffd surrogate \ufffd'
@@ -0,0 +1,35 @@
+import time
+
+from politeness import PolitenessScheduler
+from seo_analyzer import FetchConfig, SEOAnalyzer
+
+
+def robots(text):
+    return (200, text.encode('utf-8'), 'text/plain')
+
+
+def test_robots_uses_analyzer_user_agent(http_server):
+    http_server.routes['/robots.txt'] = robots('User-agent: seo-test-bot\nCrawl-delay: 4\n\nUser-agent: *\nCrawl-delay: 1\n')
+    scheduler = PolitenessScheduler(rate=100)
+    SEOAnalyzer(config=FetchConfig(headers={'User-Agent': 'seo-test-bot/1.0'}), scheduler=scheduler, profiler=False)
+
+    scheduler.acquire(http_server.base_url + '/page')
+    assert [headers['User-Agent'] for _, headers in http_server.requests] == ['seo-test-bot/1.0']
+    assert scheduler.stats()[http_server.base_url]["crawl_delay"] == 4.0
+
+
+def test_crawl_delay_is_reread_after_robots_ttl(http_server):
+    http_server.routes['/robots.txt'] = robots('User-agent: *\nCrawl-delay: 2\n')
+    scheduler = PolitenessScheduler(rate=100, robots_ttl=0.2)
+    SEOAnalyzer(scheduler=scheduler, profiler=False)
+
+    scheduler.acquire(http_server.base_url + '/page')
+    assert scheduler.stats()[http_server.base_url]["rate"] == 0.5
+
+    http_server.routes['/robots.txt'] = robots('User-agent: *\nDisallow:\n')
+    time.sleep(0.3)
+    scheduler.acquire(http_server.base_url + '/page')
+    stats = scheduler.stats()[http_server.base_url]
+    assert stats["rate"] == 100
+    assert stats["crawl_delay"] is None
+    assert len(http_server.requests) == 2
@@ -0,0 +1,40 @@
+import json
+import threading
+
+from profiling import INDEX_FILE, AnalysisProfiler
+from seo_analyzer import SEOAnalyzer
+
+PAGE = (200, b'<html><head><title>Page</title></head><body><h1>Page</h1></body></html>', 'text/html')
+
+
+def read_index(out_dir):
+    with open(out_dir / INDEX_FILE, encoding='utf-8') as file:
+        return [json.loads(line) for line in file]
+
+
+def test_slow_analyses_are_reparsed_under_the_profiler(http_server, tmp_path):
+    http_server.routes['/page'] = PAGE
+    profiler = AnalysisProfiler(str(tmp_path), slow_threshold=0)
+    analyzer = SEOAnalyzer(profiler=profiler)
+
+    assert analyzer.analyze_website(http_server.base_url + '/page')["success"]
+    [capture] = read_index(tmp_path)
+    assert capture["reason"] == 'slow'
+    assert (tmp_path / capture["files"][0]).exists()
+    assert getattr(profiler._local, 'content', None) is None
+
+
+def test_parses_outside_analyze_website_keep_no_page(tmp_path):
+    # The async path parses on executor threads, outside analyze_website
+    profiler = AnalysisProfiler(str(tmp_path), slow_threshold=0)
+    analyzer = SEOAnalyzer(profiler=profiler)
+    kept = []
+
+    def parse():
+        analyzer._parse_page(PAGE[1])
+        kept.append(getattr(profiler._local, 'content', None))
+
+    thread = threading.Thread(target=parse)
+    thread.start()
+    thread.join()
+    assert kept == [None]
@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from result_cache import ResultCache
+from seo_analyzer import SEOAnalyzer
+
+BODY = b'<html><head><title>Page</title></head><body></body></html>'
+
+
+def evicting_route(cache):
+    """
+    Answer conditional requests with 304, after evicting the entry they revalidate
+    """
+    def route(headers):
+        if headers.get('If-None-Match'):
+            cache.clear()
+            return 304, b'', 'text/html', {'ETag': '"v1"'}
+        return 200, BODY, 'text/html', {'ETag': '"v1"'}
+    return route
+
+
+def analyze(analyzer, url, use_async):
+    if use_async:
+        return asyncio.run(analyzer.analyze_website_async(url))
+    return analyzer.analyze_website(url)
+
+
+@pytest.mark.parametrize('use_async', [False, True], ids=['sync', 'async'])
+def test_not_modified_for_an_evicted_entry_is_fetched_again(http_server, use_async):
+    # ttl=0 makes every entry stale, so the second analysis revalidates
+    cache = ResultCache(ttl=0)
+    http_server.routes['/'] = evicting_route(cache)
+    analyzer = SEOAnalyzer(cache=cache, profiler=False)
+    url = f"{http_server.base_url}/"
+
+    assert analyze(analyzer, url, use_async)["success"]
+    result = analyze(analyzer, url, use_async)
+
+    assert result["success"], result.get("error")
+    assert result["status_code"] == 200
+    assert result["meta_tags"]["title"] == 'Page'
+    sent = [headers.get('If-None-Match') for _, headers in http_server.requests]
+    assert sent == [None, '"v1"', None]
+
+
+@pytest.mark.parametrize('use_async', [False, True], ids=['sync', 'async'])
+def test_unconditional_not_modified_is_an_error(http_server, use_async):
+    cache = ResultCache()
+    http_server.routes['/'] = (304, b'', 'text/html')
+    analyzer = SEOAnalyzer(cache=cache, profiler=False)
+
+    result = analyze(analyzer, f"{http_server.base_url}/", use_async)
+
+    assert not result["success"]
+    assert '304' in result["error"]
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,60 @@
+from page_store import PageStore
+from politeness import PolitenessScheduler
+from seo_analyzer import SEOAnalyzer
+from sitemap import SitemapSource
+
+XML = 'application/xml'
+
+
+def urlset(*locs):
+    entries = ''.join(f'<url><loc>{loc}</loc></url>' for loc in locs)
+    return f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</urlset>'.encode('utf-8')
+
+
+def sitemap_index(*locs):
+    entries = ''.join(f'<sitemap><loc>{loc}</loc></sitemap>' for loc in locs)
+    return f'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</sitemapindex>'.encode('utf-8')
+
+
+def test_broken_child_sitemaps_are_skipped(http_server):
+    base_url = http_server.base_url
+    http_server.routes.update({
+        '/sitemap.xml': (200, sitemap_index(*(f"{base_url}/{name}.xml" for name in ('missing', 'error', 'broken', 'good'))), XML),
+        '/error.xml': (500, b'Server error', 'text/plain'),
+        # Cut off inside its second entry
+        '/broken.xml': (200, urlset(f"{base_url}/a", f"{base_url}/lost")[:-15], XML),
+        '/good.xml': (200, urlset(f"{base_url}/b", f"{base_url}/c"), XML),
+    })
+    source = SitemapSource(base_url + '/sitemap.xml', SEOAnalyzer(profiler=False), skip_unchanged=False)
+
+    assert list(source.urls()) == [f"{base_url}/a", f"{base_url}/b", f"{base_url}/c"]
+    assert source.stats["sitemaps"] == 5
+    assert source.stats["errors"] == 3
+    assert [url for url, _ in source.errors] == [f"{base_url}/{name}.xml" for name in ('missing', 'error', 'broken')]
+
+
+def test_sitemap_fetches_wait_on_the_scheduler(http_server):
+    base_url = http_server.base_url
+    http_server.routes['/sitemap.xml'] = (200, urlset(f"{base_url}/a"), XML)
+    scheduler = PolitenessScheduler(rate=100, respect_crawl_delay=False)
+    source = SitemapSource(base_url + '/sitemap.xml', SEOAnalyzer(scheduler=scheduler, profiler=False))
+
+    assert list(source.urls()) == [f"{base_url}/a"]
+    assert scheduler.stats()[base_url]["requests"] == 1
+
+
+def test_entries_with_invalid_urls_are_skipped(http_server, tmp_path):
+    base_url = http_server.base_url
+    lastmod = '<lastmod>2024-01-01</lastmod>'
+    http_server.routes['/sitemap.xml'] = (200, (
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        f'<url><loc>http://127.0.0.1:99999/a</loc>{lastmod}</url>'
+        f'<url><loc>{base_url}/b</loc>{lastmod}</url>'
+        '</urlset>'
+    ).encode('utf-8'), XML)
+    with PageStore(str(tmp_path / 'pages.db')) as store:
+        source = SitemapSource(base_url + '/sitemap.xml', SEOAnalyzer(store=store, profiler=False))
+
+        assert list(source.urls()) == [f"{base_url}/b"]
+    assert source.stats["skipped_invalid"] == 1
+    assert source.stats["errors"] == 0
@@ -0,0 +1,190 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+import threading
+
+# Stages of one analysis, in the order they happen. Network stages are
+# filled from the connection classes in seo_analyzer, the rest around the
+# code that runs them.
+STAGES = ('dns', 'connect', 'tls', 'ttfb', 'download', 'decode', 'parse', 'extract', 'validate')
+
+# Histogram bucket upper bounds in seconds, roughly 1.5x apart from 50 µs to 60 s
+DEFAULT_BOUNDS = tuple(round(0.00005 * 1.5 ** exponent, 6) for exponent in range(35))
+
+_local = threading.local()
+
+
+def new_timings():
+    """
+    Return an empty timings dict: seconds per stage plus total, bytes_downloaded and redirects
+    """
+    timings = dict.fromkeys(STAGES, 0.0)
+    timings["total"] = 0.0
+    timings["bytes_downloaded"] = 0
+    timings["redirects"] = 0
+    return timings
+
+
+@contextmanager
+def collect_timings(timings=None):
+    """
+    Make timings (a new dict by default) the current thread's sink for record_stage calls
+
+    Sinks nest; the previous one is restored on exit.
+    """
+    if timings is None:
+        timings = new_timings()
+    previous = getattr(_local, 'timings', None)
+    _local.timings = timings
+    try:
+        yield timings
+    finally:
+        _local.timings = previous
+
+
+def record_stage(stage, seconds):
+    """
+    Add seconds to a stage of the current thread's timings; a no-op outside collect_timings
+    """
+    timings = getattr(_local, 'timings', None)
+    if timings is not None:
+        timings[stage] += seconds
+
+
+def slowest_stage(timings):
+    """
+    Return the stage that took the longest in one result's timings, or None if nothing was timed
+    """
+    stage = max(STAGES, key=lambda name: timings.get(name) or 0.0)
+    return stage if timings.get(stage) else None
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram of durations in seconds
+
+    Percentiles are estimated by interpolating inside the bucket the rank
+    falls in, so they are accurate to the bucket width (about 1.5x).
+    """
+    def __init__(self, bounds=DEFAULT_BOUNDS):
+        self.bounds = tuple(bounds)
+        # One extra bucket for values above the last bound
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        if other.bounds != self.bounds:
+            raise ValueError("Cannot merge histograms with different bucket bounds")
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction):
+        """
+        Estimate the value below which the given fraction (0-1) of samples fall
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                return min(lower + (upper - lower) * (rank - seen) / count, self.max)
+            seen += count
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.mean,
+            "p50": self.percentile(0.50),
+            "p90": self.percentile(0.90),
+            "p99": self.percentile(0.99),
+            "max": self.max
+        }
+
+
+class TimingAggregate:
+    """
+    Per-stage histograms over the timings of many results
+
+    Feed it every result of a batch (results without timings are skipped);
+    summary() then shows where the time went across the whole run and
+    slowest_stages counts which stage dominated each page.
+    """
+    def __init__(self, bounds=DEFAULT_BOUNDS):
+        self.stages = {stage: Histogram(bounds) for stage in STAGES}
+        self.total = Histogram(bounds)
+        self.slowest_stages = dict.fromkeys(STAGES, 0)
+        self.pages = 0
+        self.bytes_downloaded = 0
+        self.redirects = 0
+
+    def add(self, result):
+        """
+        Add one analysis result, or a bare timings dict
+        """
+        timings = result.get("timings") if "timings" in result else result
+        if not timings or "total" not in timings:
+            return
+        self.pages += 1
+        for stage, histogram in self.stages.items():
+            histogram.add(timings.get(stage) or 0.0)
+        self.total.add(timings["total"])
+        self.bytes_downloaded += timings.get("bytes_downloaded", 0)
+        self.redirects += timings.get("redirects", 0)
+        stage = slowest_stage(timings)
+        if stage is not None:
+            self.slowest_stages[stage] += 1
+
+    def bottleneck(self):
+        """
+        Return the stage with the most time summed over all pages, or None before any were added
+        """
+        stage = max(STAGES, key=lambda name: self.stages[name].total)
+        return stage if self.stages[stage].total else None
+
+    def summary(self):
+        """
+        Return {stage: histogram dict plus its share of all timed seconds}
+        """
+        timed = sum(histogram.total for histogram in self.stages.values())
+        summary = {}
+        for stage, histogram in self.stages.items():
+            summary[stage] = histogram.to_dict()
+            summary[stage]["share"] = histogram.total / timed if timed else 0.0
+            summary[stage]["slowest_for"] = self.slowest_stages[stage]
+        return summary
+
+    def format_table(self):
+        """
+        Return the summary as a plain-text table in milliseconds
+        """
+        lines = [f"{'STAGE':<9} {'MEAN':>9} {'P50':>9} {'P90':>9} {'P99':>9} {'SHARE':>6} {'SLOWEST':>7}"]
+        for stage, row in self.summary().items():
+            lines.append(
+                f"{stage:<9} {row['mean'] * 1000:>9.2f} {row['p50'] * 1000:>9.2f} {row['p90'] * 1000:>9.2f} "
+                f"{row['p99'] * 1000:>9.2f} {row['share']:>6.1%} {row['slowest_for']:>7}"
+            )
+        lines.append(
+            f"{self.pages} page(s), {self.bytes_downloaded:,} bytes downloaded, {self.redirects} redirect(s); "
+            f"times in ms"
+        )
+        return '\n'.join(lines)